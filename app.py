@@ -2,28 +2,73 @@
 """
 STT Server Application Entry Point
 """
+import argparse
 import uvicorn
-from src.core.app import app
+from src.core.app import create_app
+from src.core.config import settings
+from src.core.lifecycle import lifecycle, sweep_upload_folder
+from src.core.server import GracefulServer
 from src.services.stt_service import stt_service
-from src.utils.logger import get_logger
+from src.services.jobs import job_runner
+from src.utils.logger import get_logger, setup_logging, get_uvicorn_custom_log
+from src.utils.tracing import trace_exporter
 from src.utils.log_messages import get_log_message
 
 logger = get_logger(__name__)
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="STT Server")
+    parser.add_argument("--role", choices=("worker", "dispatcher"), default=settings.SERVER_ROLE,
+                        help="worker: 모델을 로드하여 변환, dispatcher: DISPATCHER_WORKERS로 요청 분배")
+    parser.add_argument("--port", type=int, default=8080)
+    return parser.parse_args()
+
+def run_dispatcher(port: int) -> None:
+    """Serve the dispatcher: no model, requests are forwarded to DISPATCHER_WORKERS"""
+    from src.core.dispatcher_app import create_dispatcher_app
+    
+    lifecycle.on_shutdown(trace_exporter.flush)
+    config = uvicorn.Config(
+        create_dispatcher_app(),
+        host="0.0.0.0",
+        port=port,
+        log_level="info",
+        log_config=get_uvicorn_custom_log(),
+        timeout_graceful_shutdown=int(settings.SHUTDOWN_DRAIN_TIMEOUT)
+    )
+    GracefulServer(config).run()
+
 def main():
     """Main application entry point"""
+    setup_logging()
+    args = parse_args()
     try:
-        # Load STT model
         logger.info(get_log_message("SYSTEM", "SERVER_STARTED"))
+        if args.role == "dispatcher":
+            run_dispatcher(args.port)
+            return
+        
+        # Load STT model
         stt_service.load_model()
         
-        # Run server
-        uvicorn.run(
-            app,
+        # 이전 실행에서 정리되지 못한 업로드 파일 삭제
+        sweep_upload_folder()
+        lifecycle.on_shutdown(trace_exporter.flush)
+        
+        # 이전 실행에서 전송하지 못한 웹훅 재전송, 종료 시 미완료 작업과 결과 저장
+        job_runner.resume()
+        lifecycle.on_shutdown(job_runner.shutdown)
+        
+        # Run server (종료 신호 수신 시 처리 중 요청을 기다린 후 종료)
+        config = uvicorn.Config(
+            create_app(),
             host="0.0.0.0",
-            port=8080,
-            log_level="info"
+            port=args.port,
+            log_level="info",
+            log_config=get_uvicorn_custom_log(),
+            timeout_graceful_shutdown=int(settings.SHUTDOWN_DRAIN_TIMEOUT)
         )
+        GracefulServer(config).run()
     except Exception as e:
         logger.error(get_log_message("SYSTEM", "SERVER_START_FAILED", error=str(e)))
         raise
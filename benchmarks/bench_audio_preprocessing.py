@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Audio Preprocessing Benchmark
+
+포맷(샘플레이트, 채널, 샘플 형식, 압축 여부)별로 기존 faster-whisper(FFmpeg) 디코딩과
+src.services.audio_preprocessing.load_audio의 처리 시간, 최대 할당 메모리(tracemalloc),
+결과 차이(기존 경로 대비 SNR)를 비교합니다. 압축 포맷은 두 경로 모두 FFmpeg를 사용하므로 기준선 확인용입니다.
+
+    python benchmarks/bench_audio_preprocessing.py --seconds 60 --repeat 5
+    python benchmarks/bench_audio_preprocessing.py --audio sample.wav other.mp3
+"""
+import argparse
+import os
+import statistics
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import av
+import numpy as np
+from faster_whisper import decode_audio
+
+from src.services.audio_preprocessing import describe, load_audio
+
+# (파일 이름, 샘플레이트, 채널, 형식) - 형식은 s16/s32/f32 WAV 또는 PyAV 코덱 이름
+FORMATS = [
+    ("16k_mono_s16.wav", 16000, 1, "s16"),
+    ("16k_mono_f32.wav", 16000, 1, "f32"),
+    ("44k_stereo_s16.wav", 44100, 2, "s16"),
+    ("48k_mono_s32.wav", 48000, 1, "s32"),
+    ("8k_mono_s16.wav", 8000, 1, "s16"),
+    ("44k_stereo.flac", 44100, 2, "flac"),
+    ("44k_stereo.mp3", 44100, 2, "mp3"),
+    ("48k_stereo.ogg", 48000, 2, "libvorbis"),
+]
+
+
+def synthetic_audio(sample_rate: int, seconds: float, channels: int) -> np.ndarray:
+    """Speech-like harmonics with a different pitch per channel, shape (frames, channels)"""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    columns = []
+    for channel in range(channels):
+        phase = 2 * np.pi * np.cumsum(140 + 30 * channel + 40 * np.sin(2 * np.pi * 0.5 * t)) / sample_rate
+        voice = sum(np.sin(k * phase) / k for k in range(1, 8))
+        columns.append(0.1 * voice * 0.5 * (1 + np.sin(2 * np.pi * 3 * t)))
+    return np.stack(columns, axis=1).astype(np.float32)
+
+
+def write_wav(path: str, audio: np.ndarray, sample_rate: int, sample_format: str) -> None:
+    if sample_format == "f32":
+        # wave 모듈은 IEEE float WAV를 쓰지 못하므로 헤더를 직접 작성
+        data = audio.astype("<f4").tobytes()
+        channels = audio.shape[1]
+        fmt = struct.pack("<HHIIHH", 3, channels, sample_rate, sample_rate * channels * 4, channels * 4, 32)
+        body = b"WAVEfmt " + struct.pack("<I", len(fmt)) + fmt + b"data" + struct.pack("<I", len(data)) + data
+        with open(path, "wb") as f:
+            f.write(b"RIFF" + struct.pack("<I", len(body)) + body)
+        return
+    dtype, scale, width = ("<i2", 32767, 2) if sample_format == "s16" else ("<i4", 2 ** 31 - 1, 4)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(audio.shape[1])
+        f.setsampwidth(width)
+        f.setframerate(sample_rate)
+        f.writeframes((audio * scale).astype(dtype).tobytes())
+
+
+def write_compressed(path: str, audio: np.ndarray, sample_rate: int, codec: str) -> None:
+    layout = "stereo" if audio.shape[1] == 2 else "mono"
+    with av.open(path, "w") as container:
+        stream = container.add_stream(codec, rate=sample_rate, layout=layout)
+        pcm = (audio * 32767).astype(np.int16)
+        for start in range(0, len(pcm), 4096):
+            frame = av.AudioFrame.from_ndarray(pcm[start:start + 4096].reshape(1, -1), format="s16", layout=layout)
+            frame.sample_rate = sample_rate
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+
+
+def generate(folder: str, seconds: float) -> list:
+    paths = []
+    for name, sample_rate, channels, sample_format in FORMATS:
+        path = os.path.join(folder, name)
+        audio = synthetic_audio(sample_rate, seconds, channels)
+        try:
+            if sample_format in ("s16", "s32", "f32"):
+                write_wav(path, audio, sample_rate, sample_format)
+            else:
+                write_compressed(path, audio, sample_rate, sample_format)
+        except (av.error.FFmpegError, ValueError) as e:
+            print(f"skip {name}: {e}", file=sys.stderr)
+            continue
+        paths.append(path)
+    return paths
+
+
+def measure(fn, path: str, repeat: int) -> tuple:
+    """(median seconds, peak traced MiB, output)"""
+    times = []
+    output = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = fn(path)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fn(path)
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return statistics.median(times), peak, np.asarray(output)
+
+
+def snr_db(reference: np.ndarray, candidate: np.ndarray) -> float:
+    n = min(len(reference), len(candidate))
+    noise = np.sum((reference[:n].astype(np.float64) - candidate[:n]) ** 2)
+    return float("inf") if noise == 0 else 10 * np.log10(np.sum(reference[:n].astype(np.float64) ** 2) / noise)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FFmpeg decode vs NumPy preprocessing per format")
+    parser.add_argument("--audio", nargs="*", help="측정할 오디오 파일 (미지정 시 포맷별 합성 파일 생성)")
+    parser.add_argument("--seconds", type=float, default=60.0, help="합성 파일 길이 (초)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        paths = args.audio or generate(folder, args.seconds)
+        print(f"{'file':<22} {'path':<7} {'ffmpeg ms':>10} {'new ms':>8} {'speedup':>8} {'ffmpeg MiB':>11} {'new MiB':>8} {'SNR dB':>7}")
+        for path in paths:
+            base_time, base_peak, reference = measure(lambda p: decode_audio(p, sampling_rate=16000), path, args.repeat)
+            new_time, new_peak, output = measure(load_audio, path, args.repeat)
+            print(
+                f"{os.path.basename(path):<22} {describe(path)['path']:<7} {base_time * 1000:>10.1f} {new_time * 1000:>8.1f} "
+                f"{base_time / new_time:>7.1f}x {base_peak:>11.1f} {new_peak:>8.1f} {snr_db(reference, output):>7.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
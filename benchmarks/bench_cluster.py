@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Local Cluster Benchmark
+
+한 머신에서 워커 프로세스 N개와 디스패처 하나를 띄우고 디스패처로 동시 변환 요청을 보내
+처리량, 지연 시간(p50/p95), 워커별 분배 수를 측정합니다. --compare를 지정하면 같은 부하를
+워커 하나에 직접 보낸 결과와 비교합니다. --models에 여러 모델을 주면 워커마다 돌아가며 배정하고
+요청마다 X-STT-Model 헤더를 돌려가며 보내, 해당 모델을 가진 워커로만 분배되는지 확인합니다.
+
+    python benchmarks/bench_cluster.py --workers 3 --requests 60 --concurrency 6
+    python benchmarks/bench_cluster.py --workers 2 --models tiny base --compare
+"""
+import argparse
+import io
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+import wave
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def synthetic_wav(seconds: float, sample_rate: int = 16000) -> bytes:
+    """Speech-like harmonics as 16-bit mono WAV"""
+    frames = bytearray()
+    for n in range(int(seconds * sample_rate)):
+        t = n / sample_rate
+        value = sum(math.sin(2 * math.pi * 150 * k * t) / k for k in range(1, 6)) * 0.5 * (1 + math.sin(2 * math.pi * 3 * t))
+        frames += int(max(-1.0, min(1.0, 0.2 * value)) * 32767).to_bytes(2, "little", signed=True)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(bytes(frames))
+    return buf.getvalue()
+
+
+def start(args: List[str], env: Dict[str, str], log_path: str) -> subprocess.Popen:
+    log = open(log_path, "w")
+    return subprocess.Popen([sys.executable, "app.py", *args], cwd=ROOT, env={**os.environ, **env}, stdout=log, stderr=log)
+
+
+def wait_ready(url: str, timeout: float, ready_nodes: Optional[int] = None) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if ready_nodes is None:
+                if requests.get(f"{url}/api/v1/ready", timeout=1).status_code == 200:
+                    return
+            elif requests.get(f"{url}/api/v1/cluster", timeout=1).json()["ready_nodes"] >= ready_nodes:
+                return
+        except (requests.RequestException, ValueError, KeyError):
+            pass
+        time.sleep(0.5)
+    raise TimeoutError(f"{url} not ready after {timeout}s")
+
+
+def run_load(url: str, audio: bytes, total: int, concurrency: int, models: List[str]) -> Dict[str, Any]:
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=concurrency)
+    session.mount("http://", adapter)
+
+    def one(index: int) -> Dict[str, Any]:
+        headers = {"X-STT-Model": models[index % len(models)]} if len(models) > 1 else {}
+        start_time = time.perf_counter()
+        response = session.post(f"{url}/api/v1/transcribe", files={"file": ("bench.wav", audio, "audio/wav")}, headers=headers)
+        return {
+            "latency": time.perf_counter() - start_time,
+            "status": response.status_code,
+            "node": response.headers.get("X-STT-Node", "direct"),
+            "model": headers.get("X-STT-Model")
+        }
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one, range(total)))
+    elapsed = time.perf_counter() - start_time
+
+    latencies = sorted(result["latency"] for result in results)
+    return {
+        "requests": total,
+        "errors": sum(result["status"] != 200 for result in results),
+        "seconds": round(elapsed, 2),
+        "throughput": round(total / elapsed, 2),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 1),
+        "per_node": dict(Counter(result["node"] for result in results)),
+        "routes": [(result["model"], result["node"]) for result in results if result["model"]]
+    }
+
+
+def print_result(name: str, result: Dict[str, Any]) -> None:
+    print(f"{name:<10} {result['requests']:>5} req  {result['errors']:>3} err  {result['seconds']:>7.2f}s  "
+          f"{result['throughput']:>6.2f} req/s  p50 {result['p50_ms']:>8.1f}ms  p95 {result['p95_ms']:>8.1f}ms")
+    for node, count in sorted(result["per_node"].items()):
+        print(f"{'':<10} {node:<24} {count:>5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dispatcher + local workers throughput")
+    parser.add_argument("--workers", type=int, default=2, help="워커 프로세스 수")
+    parser.add_argument("--models", nargs="+", default=["base"], help="워커에 돌아가며 배정할 모델")
+    parser.add_argument("--base-port", type=int, default=8100, help="디스패처 포트 (워커는 +1부터)")
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--audio", help="요청에 사용할 오디오 파일 (미지정 시 합성 WAV)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="합성 오디오 길이 (초)")
+    parser.add_argument("--startup-timeout", type=float, default=300.0)
+    parser.add_argument("--compare", action="store_true", help="같은 부하를 첫 번째 워커에 직접 보낸 결과와 비교")
+    parser.add_argument("--output", help="결과 JSON 파일")
+    parser.add_argument("--log-dir", default=os.path.join(ROOT, "logs", "bench_cluster"))
+    args = parser.parse_args()
+
+    if args.audio:
+        with open(args.audio, "rb") as f:
+            audio = f.read()
+    else:
+        audio = synthetic_wav(args.seconds)
+
+    os.makedirs(args.log_dir, exist_ok=True)
+    dispatcher_url = f"http://127.0.0.1:{args.base_port}"
+    worker_urls = [f"http://127.0.0.1:{args.base_port + 1 + i}" for i in range(args.workers)]
+    processes = []
+    try:
+        for i, url in enumerate(worker_urls):
+            processes.append(start(["--port", url.rsplit(":", 1)[1]], {
+                "NODE_ID": f"worker-{i}",
+                "WHISPER_MODEL": args.models[i % len(args.models)]
+            }, os.path.join(args.log_dir, f"worker-{i}.log")))
+        processes.append(start(["--role", "dispatcher", "--port", str(args.base_port)], {
+            "DISPATCHER_WORKERS": json.dumps(worker_urls)
+        }, os.path.join(args.log_dir, "dispatcher.log")))
+
+        wait_ready(dispatcher_url, args.startup_timeout, ready_nodes=args.workers)
+        cluster = requests.get(f"{dispatcher_url}/api/v1/cluster").json()
+        resident = {node["node"]: node["load"]["models"] for node in cluster["nodes"]}
+        print(f"workers: {', '.join(f'{node} {models}' for node, models in resident.items())}\n")
+
+        results = {"cluster": run_load(dispatcher_url, audio, args.requests, args.concurrency, args.models)}
+        print_result("cluster", results["cluster"])
+        misrouted = [(model, node) for model, node in results["cluster"]["routes"] if model not in resident.get(node, [])]
+        if len(args.models) > 1:
+            print(f"{'':<10} misrouted (model not resident on node): {len(misrouted)}")
+
+        if args.compare:
+            results["single"] = run_load(worker_urls[0], audio, args.requests, args.concurrency, args.models[:1])
+            print_result("single", results["single"])
+            print(f"\nspeedup: {results['cluster']['throughput'] / results['single']['throughput']:.2f}x")
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({"workers": args.workers, "models": args.models, "results": results}, f, indent=2)
+        if misrouted or results["cluster"]["errors"]:
+            sys.exit(1)
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+if __name__ == "__main__":
+    main()
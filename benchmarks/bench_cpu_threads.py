@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+CPU Thread Split Benchmark
+
+감지된 CPU 한도 안에서 추론당 스레드 수(cpu_threads)와 동시 추론 수(num_workers)의
+분할별로, 동시 요청 수에 따른 지연 시간과 처리량 곡선을 측정합니다.
+한가할 때(동시 요청 1)는 스레드를 몰아주는 분할이, 바쁠 때는 동시 추론을 늘린 분할이 유리한지 확인합니다.
+
+    python benchmarks/bench_cpu_threads.py --model tiny --audio sample.wav --concurrency 1,2,4,8
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from faster_whisper import WhisperModel, decode_audio
+
+from src.services.cpu_allocation import ThreadPlan, detect_cpu_limit, worker_options
+
+SAMPLE_RATE = 16000
+
+
+def synthetic_audio(seconds: float) -> np.ndarray:
+    """Speech-like test signal (amplitude-modulated harmonics) when no --audio is given"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 140 + 40 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 3 * t))
+    return (0.1 * voice * envelope).astype(np.float32)
+
+
+def transcribe(model: WhisperModel, audio: np.ndarray) -> float:
+    start = time.perf_counter()
+    segments, _ = model.transcribe(audio, language="en", beam_size=1)
+    list(segments)
+    return time.perf_counter() - start
+
+
+def run_level(model: WhisperModel, audio: np.ndarray, concurrency: int, requests: int) -> tuple:
+    """Run `requests` transcriptions from `concurrency` client threads"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(lambda _: transcribe(model, audio), range(requests)))
+    elapsed = time.perf_counter() - start
+    audio_seconds = len(audio) / SAMPLE_RATE * requests
+    p95 = sorted(latencies)[max(0, int(len(latencies) * 0.95) - 1)]
+    return statistics.median(latencies), p95, audio_seconds / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency/throughput per CPU thread split")
+    parser.add_argument("--model", default="tiny")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--audio", help="오디오 파일 (미지정 시 10초 합성 신호)")
+    parser.add_argument("--cores", type=int, default=0, help="사용할 코어 수 (기본값: 감지된 CPU 한도)")
+    parser.add_argument("--concurrency", default="1,2,4,8", help="동시 요청 수 목록")
+    parser.add_argument("--requests", type=int, default=16, help="동시 요청 수별 총 요청 수")
+    args = parser.parse_args()
+
+    cores = args.cores or detect_cpu_limit()
+    audio = decode_audio(args.audio, sampling_rate=SAMPLE_RATE) if args.audio else synthetic_audio(10.0)
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    print(f"cores={cores}  audio={len(audio) / SAMPLE_RATE:.1f}s  model={args.model}/{args.compute_type}")
+    print(f"{'threads x workers':<18} {'clients':>7} {'p50 s':>8} {'p95 s':>8} {'audio s/s':>10}")
+    for num_workers in worker_options(cores):
+        plan = ThreadPlan.split(cores, num_workers)
+        model = WhisperModel(
+            args.model, device="cpu", compute_type=args.compute_type,
+            cpu_threads=plan.cpu_threads, num_workers=plan.num_workers
+        )
+        transcribe(model, audio)  # warmup
+        label = f"{plan.cpu_threads} x {plan.num_workers}"
+        for concurrency in levels:
+            requests = max(args.requests, concurrency)
+            p50, p95, throughput = run_level(model, audio, concurrency, requests)
+            print(f"{label:<18} {concurrency:>7} {p50:>8.2f} {p95:>8.2f} {throughput:>10.1f}")
+        del model
+
+
+if __name__ == "__main__":
+    main()
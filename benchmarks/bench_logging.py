@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Logging Overhead Benchmark
+
+요청 하나가 남기는 로그(요청 수신 ~ 파일 정리)를 흉내 내어,
+로깅 설정별로 요청 처리 스레드가 부담하는 요청당 시간을 비교합니다.
+
+    python benchmarks/bench_logging.py --requests 5000
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.logger import LoggerConfig, SAMPLED, shutdown_logging
+from src.utils.log_messages import get_log_message
+
+TRANSCRIPT = "안녕하세요. 오늘 날씨가 좋네요. " * 20
+
+
+def simulate_request(logger: logging.Logger, log_text: bool) -> None:
+    """Emit the log lines of one /api/v1/transcribe request"""
+    logger.info(get_log_message("API", "REQUEST_RECEIVED", filename="recording.wav"), extra=SAMPLED)
+    logger.info(get_log_message("SERVICE", "FILE_SAVED", filepath="uploads/recording.wav"), extra=SAMPLED)
+    logger.info(get_log_message("SERVICE", "TRANSCRIPTION_STARTED", filepath="uploads/recording.wav"), extra=SAMPLED)
+    logger.info(get_log_message("SERVICE", "TRANSCRIPTION_COMPLETED", language="ko"), extra=SAMPLED)
+    if log_text:
+        logger.info(f"변환 결과 텍스트: '{TRANSCRIPT}'")
+    logger.info(get_log_message("SERVICE", "FILE_CLEANED", filepath="uploads/recording.wav"), extra=SAMPLED)
+    logger.info(get_log_message("API", "REQUEST_COMPLETED", filename="recording.wav"), extra=SAMPLED)
+    if log_text:
+        logger.info(f"API 응답 결과 - 텍스트: '{TRANSCRIPT}', 언어: 'ko'")
+
+
+def run_case(requests: int, log_file: str, log_text: bool, **config) -> tuple:
+    LoggerConfig(logging.INFO, log_file=log_file, **config).configure()
+    logger = logging.getLogger("bench")
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        simulate_request(logger, log_text)
+    elapsed = time.perf_counter() - start
+
+    # 백그라운드 리스너가 남은 로그를 모두 쓸 때까지 대기 (요청 경로 비용에는 포함하지 않음)
+    drain_start = time.perf_counter()
+    shutdown_logging()
+    drain = time.perf_counter() - drain_start
+
+    return elapsed / requests, drain
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-request logging overhead benchmark")
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    real_stdout = sys.stdout
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        log_file = os.path.join(tmp, "app.log")
+        cases = [
+            ("sync text + transcript", dict(use_queue=False), True),
+            ("sync text", dict(use_queue=False), False),
+            ("queue text", dict(use_queue=True), False),
+            ("queue json", dict(use_queue=True, json_format=True), False),
+            ("queue json, sample 10%", dict(use_queue=True, json_format=True, sample_rate=0.1), False),
+        ]
+        print(f"{'config':<32} {'us/request':>10} {'drain ms':>10}")
+        for name, config, log_text in cases:
+            sys.stdout = devnull  # 콘솔 핸들러 출력 버림
+            try:
+                per_request, drain = run_case(args.requests, log_file, log_text, **config)
+            finally:
+                sys.stdout = real_stdout
+            print(f"{name:<32} {per_request * 1e6:>10.1f} {drain * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
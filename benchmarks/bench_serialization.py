@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Response Serialization Micro-benchmark
+
+TranscriptionResponse를 직렬화하는 방식별 응답당 비용을 비교합니다.
+
+    python benchmarks/bench_serialization.py --segments 10 100 1000
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.responses import TranscriptionResponse
+from src.models.segments import SegmentBuffer
+from src.utils.serialization import build_transcription_payload, dumps_json, orjson, msgpack
+
+
+def make_result(segment_count: int) -> dict:
+    """Build a service result with synthetic segments"""
+    segments = SegmentBuffer.from_segments(
+        SimpleNamespace(start=i * 2.0, end=i * 2.0 + 1.8, text=f" 세그먼트 {i} 테스트 문장입니다.", avg_logprob=-0.25)
+        for i in range(segment_count)
+    )
+    return {
+        "text": segments.text,
+        "language": "ko",
+        "language_probability": 0.98,
+        "segments_count": len(segments),
+        "segments": segments,
+        "processing_time": 1.234,
+        "file_info": {"filename": "recording.wav", "content_type": "audio/wav", "size": 1024000},
+    }
+
+
+def pydantic_json(result: dict) -> bytes:
+    """Previous path: TranscriptionResponse(**result) plus default JSON encoding"""
+    payload = build_transcription_payload(result, include_segments=True)
+    return TranscriptionResponse(**payload).model_dump_json().encode("utf-8")
+
+
+def stdlib_json(result: dict) -> bytes:
+    payload = build_transcription_payload(result, include_segments=True)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def fast_json(result: dict) -> bytes:
+    return dumps_json(build_transcription_payload(result, include_segments=True))
+
+
+def msgpack_columns(result: dict) -> bytes:
+    payload = build_transcription_payload(result, include_segments=True, columnar=True)
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Response serialization micro-benchmark")
+    parser.add_argument("--segments", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    encoders = {"pydantic": pydantic_json, "json": stdlib_json}
+    if orjson is not None:
+        encoders["orjson"] = fast_json
+    if msgpack is not None:
+        encoders["msgpack"] = msgpack_columns
+
+    print(f"{'segments':>8} {'format':>10} {'us/response':>12} {'bytes':>10}")
+    for segment_count in args.segments:
+        result = make_result(segment_count)
+        number = max(10, 20000 // max(segment_count, 1))
+        for name, encoder in encoders.items():
+            best = min(timeit.repeat(lambda: encoder(result), number=number, repeat=args.repeat)) / number
+            size = len(encoder(result))
+            print(f"{segment_count:>8} {name:>10} {best * 1e6:>12.1f} {size:>10}")
+
+
+if __name__ == "__main__":
+    main()
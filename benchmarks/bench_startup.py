@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Startup Import-time Benchmark
+
+`python -X importtime`으로 설정 로드, 앱 import, 앱 생성, OpenAPI 스키마 생성까지의 시작 비용을
+매번 새 프로세스에서 측정합니다. 워커 fork·오토스케일링 반응 시간에 영향을 주는 시작 지연이
+늘어나지 않았는지, 모델 로드 전에 무거운 패키지(faster_whisper, ctranslate2, av 등)가
+import되지 않는지 확인하는 용도입니다.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 10 --output startup.json --max-ms 1500
+
+무거운 패키지가 import되었거나 --max-ms를 넘는 단계가 있으면 종료 코드 1로 끝납니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (단계 이름, 측정할 코드) - 앞 단계는 뒤 단계의 일부
+STAGES = [
+    ("config", "import src.core.config"),
+    ("app-import", "import src.core.app"),
+    ("app-create", "from src.core.app import create_app; create_app()"),
+    ("openapi", "from src.core.app import create_app; create_app().openapi()"),
+]
+
+# 모델 로드 전에 import되면 안 되는 패키지
+HEAVY_MODULES = ("faster_whisper", "ctranslate2", "av", "tokenizers", "huggingface_hub", "onnxruntime", "numpy")
+
+CHILD_TEMPLATE = "import time; _start = time.perf_counter()\n{code}\nprint(time.perf_counter() - _start)\n"
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Self time in microseconds per imported module"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        modules[fields[2].strip()] = int(fields[0])
+    return modules
+
+
+def run_stage(code: str) -> Tuple[float, float, Dict[str, int]]:
+    """Run one stage in a fresh interpreter: (process ms, in-process ms, per-module self us)"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_TEMPLATE.format(code=code)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    process_ms = (time.perf_counter() - start) * 1000
+    stage_ms = float(result.stdout.strip().splitlines()[-1]) * 1000
+    return process_ms, stage_ms, parse_importtime(result.stderr)
+
+
+def measure(name: str, code: str, repeat: int, top: int) -> Dict[str, Any]:
+    process, stage = [], []
+    self_us: Dict[str, List[int]] = defaultdict(list)
+    for _ in range(repeat):
+        process_ms, stage_ms, modules = run_stage(code)
+        process.append(process_ms)
+        stage.append(stage_ms)
+        for module, us in modules.items():
+            self_us[module].append(us)
+
+    slowest = sorted(((statistics.median(v), m) for m, v in self_us.items()), reverse=True)[:top]
+    return {
+        "stage": name,
+        "process_ms": round(statistics.median(process), 1),
+        "stage_ms": round(statistics.median(stage), 1),
+        "modules": len(self_us),
+        "heavy_imports": sorted(m for m in self_us if m in HEAVY_MODULES),
+        "slowest": [{"module": m, "self_ms": round(us / 1000, 1)} for us, m in slowest],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time startup cost per stage")
+    parser.add_argument("--repeat", type=int, default=5, help="단계별 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=10, help="표시할 느린 모듈 수")
+    parser.add_argument("--output", help="결과 JSON 파일")
+    parser.add_argument("--max-ms", type=float, help="단계 시간(중앙값)이 이 값을 넘으면 종료 코드 1")
+    args = parser.parse_args()
+
+    results = [measure(name, code, args.repeat, args.top) for name, code in STAGES]
+
+    print(f"{'stage':<12} {'process ms':>11} {'stage ms':>9} {'modules':>8}  heavy imports")
+    for result in results:
+        heavy = ", ".join(result["heavy_imports"]) or "-"
+        print(f"{result['stage']:<12} {result['process_ms']:>11.1f} {result['stage_ms']:>9.1f} {result['modules']:>8}  {heavy}")
+    print(f"\nslowest imports ({results[-1]['stage']}, self time):")
+    for item in results[-1]["slowest"]:
+        print(f"  {item['self_ms']:>8.1f} ms  {item['module']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "repeat": args.repeat, "results": results}, f, indent=2)
+
+    failures = [f"{r['stage']} imports {', '.join(r['heavy_imports'])}" for r in results if r["heavy_imports"]]
+    if args.max_ms is not None:
+        failures += [f"{r['stage']} {r['stage_ms']:.0f}ms > {args.max_ms:.0f}ms" for r in results if r["stage_ms"] > args.max_ms]
+    if failures:
+        print("\n" + "\n".join(failures), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Decode Configuration Evaluation
+
+라벨이 있는 로컬 코퍼스를 설정 조합별로 STTService에 통과시켜
+정확도(WER/CER)와 속도(RTF), 최대 메모리(RSS)를 함께 측정합니다.
+빔 크기, VAD, 연산 타입, 보조 디코딩 등 성능 기능이 정확도에 주는 영향을 배포 전에 확인하는 용도입니다.
+
+코퍼스는 두 가지 형식을 지원합니다.
+  - 폴더: 오디오 파일과 같은 이름의 .txt 정답 파일 (예: a.wav + a.txt)
+  - JSONL: 한 줄에 {"audio": "경로", "text": "정답", "language": "ko"} (audio 경로는 파일 기준 상대 경로 가능)
+
+설정 조합은 환경 변수(Settings 필드명) 덮어쓰기 목록이며, 각 조합은 별도 프로세스에서 실행되어
+모델 로딩과 최대 메모리가 서로 섞이지 않습니다. 첫 번째 조합이 비교 기준입니다.
+
+    python benchmarks/eval_decode.py --corpus data/eval --language ko --output eval.json
+    python benchmarks/eval_decode.py --corpus data/eval/manifest.jsonl --matrix matrix.json --max-wer-delta 0.01
+
+matrix.json 예시:
+    [{"name": "baseline", "env": {}},
+     {"name": "greedy", "env": {"WHISPER_BEAM_SIZE": "1"}},
+     {"name": "int8+vad", "env": {"WHISPER_COMPUTE_TYPE": "int8", "WHISPER_VAD_FILTER": "true"}}]
+"""
+import argparse
+import json
+import os
+import re
+import resource
+import statistics
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Dict, List, Optional, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".ogg")
+SAMPLE_RATE = 16000
+
+DEFAULT_MATRIX = [
+    {"name": "baseline", "env": {}},
+    {"name": "greedy", "env": {"WHISPER_BEAM_SIZE": "1"}},
+    {"name": "vad", "env": {"WHISPER_VAD_FILTER": "true"}},
+    {"name": "int8", "env": {"WHISPER_COMPUTE_TYPE": "int8"}},
+    {"name": "assisted", "env": {"ASSISTED_DECODING_ENABLED": "true"}},
+]
+
+# 평가 중에는 요청 간 캐시가 RTF를 왜곡하지 않도록 끔 (조합의 env로 덮어쓸 수 있음)
+EVAL_ENV = {
+    "ENCODER_CACHE_MAX_MB": "0",
+    "FEATURE_CACHE_MAX_MB": "0",
+}
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace before scoring"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return " ".join(_PUNCTUATION.sub(" ", text).split())
+
+
+def edit_distance(reference: Sequence, hypothesis: Sequence) -> int:
+    """Levenshtein distance between two token sequences"""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_token in enumerate(reference, 1):
+        current = [i] + [0] * len(hypothesis)
+        for j, hyp_token in enumerate(hypothesis, 1):
+            current[j] = min(
+                previous[j] + 1,  # 삭제
+                current[j - 1] + 1,  # 삽입
+                previous[j - 1] + (ref_token != hyp_token)  # 치환
+            )
+        previous = current
+    return previous[-1]
+
+
+def score(reference: str, hypothesis: str) -> Dict[str, int]:
+    """
+    Word and character edit counts
+
+    CER은 공백을 제외한 문자 기준으로 계산합니다 (한국어 띄어쓰기 차이를 오류로 세지 않음).
+    """
+    ref_words, hyp_words = normalize_text(reference).split(), normalize_text(hypothesis).split()
+    ref_chars, hyp_chars = "".join(ref_words), "".join(hyp_words)
+    return {
+        "word_errors": edit_distance(ref_words, hyp_words),
+        "words": len(ref_words),
+        "char_errors": edit_distance(ref_chars, hyp_chars),
+        "chars": len(ref_chars),
+    }
+
+
+def load_corpus(path: str, language: Optional[str], limit: int = 0) -> List[Dict[str, Any]]:
+    """Read a corpus folder or JSONL manifest"""
+    items = []
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            stem, ext = os.path.splitext(name)
+            transcript = os.path.join(path, stem + ".txt")
+            if ext.lower() in AUDIO_EXTENSIONS and os.path.exists(transcript):
+                with open(transcript, encoding="utf-8") as f:
+                    items.append({"audio": os.path.join(path, name), "text": f.read().strip(), "language": language})
+    else:
+        base = os.path.dirname(os.path.abspath(path))
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                items.append({
+                    "audio": os.path.join(base, item["audio"]),
+                    "text": item["text"],
+                    "language": item.get("language", language),
+                })
+    return items[:limit] if limit else items
+
+
+def run_config(config: Dict[str, Any], items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Evaluate one configuration (runs in a fresh process)
+
+    Settings와 전역 캐시는 import 시점에 환경 변수로 만들어지므로 import 전에 env를 적용합니다.
+    """
+    os.environ.update({**EVAL_ENV, **config.get("env", {})})
+    from faster_whisper import decode_audio
+    from src.services.stt_service import STTService
+
+    service = STTService()
+    load_start = time.perf_counter()
+    service.load_model()
+    load_seconds = time.perf_counter() - load_start
+    service.models.warmup(service.models.active.model)
+
+    utterances = []
+    for item in items:
+        duration = len(decode_audio(item["audio"], sampling_rate=SAMPLE_RATE)) / SAMPLE_RATE
+        start = time.perf_counter()
+        result = service.transcribe_audio(item["audio"], item["language"])
+        elapsed = time.perf_counter() - start
+        utterances.append({
+            "audio": item["audio"],
+            "reference": item["text"],
+            "hypothesis": result["text"].strip(),
+            "duration": round(duration, 3),
+            "processing_time": round(elapsed, 3),
+            **score(item["text"], result["text"]),
+        })
+
+    # Linux의 ru_maxrss 단위는 KB
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return summarize(config, utterances, load_seconds, peak_rss_mb)
+
+
+def summarize(config: Dict[str, Any], utterances: List[Dict[str, Any]],
+              load_seconds: float, peak_rss_mb: float) -> Dict[str, Any]:
+    """Corpus-level metrics (errors and time summed over utterances)"""
+    words = sum(u["words"] for u in utterances) or 1
+    chars = sum(u["chars"] for u in utterances) or 1
+    audio_seconds = sum(u["duration"] for u in utterances) or 1.0
+    processing = [u["processing_time"] for u in utterances]
+    return {
+        "name": config["name"],
+        "env": config.get("env", {}),
+        "utterances": len(utterances),
+        "wer": sum(u["word_errors"] for u in utterances) / words,
+        "cer": sum(u["char_errors"] for u in utterances) / chars,
+        "rtf": sum(processing) / audio_seconds,
+        "latency_p50": statistics.median(processing) if processing else 0.0,
+        "load_seconds": round(load_seconds, 2),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "details": utterances,
+    }
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    baseline = results[0]
+    print(f"{'config':<20} {'WER':>7} {'ΔWER':>7} {'CER':>7} {'ΔCER':>7} {'RTF':>7} {'speedup':>8} {'p50 s':>7} {'RSS MB':>8}")
+    for result in results:
+        speedup = baseline["rtf"] / result["rtf"] if result["rtf"] else 0.0
+        print(
+            f"{result['name']:<20} {result['wer']:>7.2%} {result['wer'] - baseline['wer']:>+7.2%} "
+            f"{result['cer']:>7.2%} {result['cer'] - baseline['cer']:>+7.2%} {result['rtf']:>7.3f} "
+            f"{speedup:>7.2f}x {result['latency_p50']:>7.2f} {result['peak_rss_mb']:>8.0f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WER/CER, RTF and peak memory per decode configuration")
+    parser.add_argument("--corpus", required=True, help="코퍼스 폴더 또는 JSONL 매니페스트")
+    parser.add_argument("--matrix", help="설정 조합 JSON 파일 (미지정 시 기본 조합)")
+    parser.add_argument("--language", help="코퍼스 기본 언어 (미지정 시 자동 감지)")
+    parser.add_argument("--limit", type=int, default=0, help="평가할 최대 파일 수")
+    parser.add_argument("--output", help="결과 JSON 파일 (발화별 결과 포함)")
+    parser.add_argument("--max-wer-delta", type=float, help="기준 대비 WER 증가가 이 값을 넘으면 종료 코드 1")
+    args = parser.parse_args()
+
+    items = load_corpus(args.corpus, args.language, args.limit)
+    if not items:
+        parser.error(f"no labelled audio found in {args.corpus}")
+    if args.matrix:
+        with open(args.matrix, encoding="utf-8") as f:
+            matrix = json.load(f)
+    else:
+        matrix = DEFAULT_MATRIX
+
+    results = []
+    for config in matrix:
+        print(f"[{config['name']}] {len(items)} files ...", file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            results.append(pool.submit(run_config, config, items).result())
+
+    print_table(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"corpus": args.corpus, "results": results}, f, ensure_ascii=False, indent=2)
+
+    if args.max_wer_delta is not None:
+        regressions = [r["name"] for r in results[1:] if r["wer"] - results[0]["wer"] > args.max_wer_delta]
+        if regressions:
+            print(f"WER regression over {args.max_wer_delta:.2%}: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+STT Server Python Client SDK
+
+    from stt_client import STTClient
+
+    with STTClient("http://localhost:8080") as client:
+        result = client.transcribe("recording.wav", language="ko")
+
+        for item in client.transcribe_directory("recordings/", concurrency=8):
+            print(item.path, item.result["text"] if item.ok else item.error)
+"""
+from .common import (
+    DEFAULT_BASE_URL, AUDIO_EXTENSIONS, RetryPolicy, BulkResult, STTClientError, find_audio_files
+)
+from .sync_client import STTClient
+from .async_client import AsyncSTTClient
+
+__all__ = [
+    "DEFAULT_BASE_URL", "AUDIO_EXTENSIONS", "RetryPolicy", "BulkResult", "STTClientError",
+    "find_audio_files", "STTClient", "AsyncSTTClient"
+]
@@ -0,0 +1,47 @@
+"""
+일괄 변환 CLI
+
+    python -m stt_client recordings/ --server http://stt-1:8080 --server http://stt-2:8080 --concurrency 16
+
+결과는 완료되는 순서대로 JSON Lines로 출력됩니다.
+"""
+import argparse
+import json
+import os
+import sys
+from .common import DEFAULT_BASE_URL, find_audio_files
+from .sync_client import STTClient
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk transcription with the STT server")
+    parser.add_argument("inputs", nargs="+", help="음성 파일 또는 디렉토리")
+    parser.add_argument("--server", action="append", dest="servers", help=f"서버 주소 (반복 지정 가능, 기본값: {DEFAULT_BASE_URL})")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--language", default=None)
+    parser.add_argument("--segments", action="store_true")
+    parser.add_argument("--no-recursive", action="store_true")
+    args = parser.parse_args()
+
+    def iter_paths():
+        for item in args.inputs:
+            if os.path.isdir(item):
+                yield from find_audio_files(item, recursive=not args.no_recursive)
+            else:
+                yield item
+
+    failures = 0
+    with STTClient(args.servers or DEFAULT_BASE_URL, pool_size=args.concurrency) as client:
+        for item in client.transcribe_many(iter_paths(), args.concurrency, args.language, args.segments):
+            record = {"path": item.path}
+            if item.ok:
+                record["result"] = item.result
+            else:
+                failures += 1
+                record["error"] = str(item.error)
+            print(json.dumps(record, ensure_ascii=False), flush=True)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
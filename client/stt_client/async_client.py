@@ -0,0 +1,144 @@
+"""
+Asyncio Client
+"""
+import asyncio
+import os
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Sequence, Union
+from .common import (
+    DEFAULT_BASE_URL, TRANSCRIBE_PATH, BulkResult, RetryPolicy, ServerPool, STTClientError,
+    build_params, error_from_response, find_audio_files
+)
+
+
+class AsyncSTTClient:
+    """
+    asyncio STT 클라이언트 (httpx 필요)
+
+    하나의 httpx.AsyncClient 연결 풀을 공유하며 세마포어로 동시 요청 수를 max_concurrency
+    (기본값 pool_size)로 제한합니다. transcribe_many를 거치지 않고 transcribe_bytes를 직접 동시에
+    호출해도 제한이 적용되며, 재시도 대기 중에는 자리를 차지하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        base_urls: Union[str, Sequence[str]] = DEFAULT_BASE_URL,
+        timeout: float = 300.0,
+        connect_timeout: float = 5.0,
+        pool_size: int = 16,
+        retry: Optional[RetryPolicy] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("AsyncSTTClient requires httpx: pip install httpx") from e
+
+        self._httpx = httpx
+        self.servers = ServerPool(base_urls)
+        self.retry = retry or RetryPolicy()
+        self.max_concurrency = max(1, max_concurrency or pool_size)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncSTTClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def transcribe(self, path: str, language: Optional[str] = None, segments: bool = False) -> Dict[str, Any]:
+        """Transcribe one audio file"""
+        content = await asyncio.to_thread(_read_file, path)
+        return await self.transcribe_bytes(content, os.path.basename(path), language, segments)
+
+    async def transcribe_bytes(
+        self,
+        content: bytes,
+        filename: str,
+        language: Optional[str] = None,
+        segments: bool = False
+    ) -> Dict[str, Any]:
+        """Transcribe in-memory audio, retrying on 429/503 and connection errors"""
+        params = build_params(language, segments)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        attempt = 0
+        while True:
+            url = self.servers.next_url(TRANSCRIBE_PATH)
+            try:
+                async with self._semaphore:
+                    response = await self.client.post(url, params=params, files={"file": (filename, content)})
+            except self._httpx.TransportError as e:
+                if not self.retry.should_retry(attempt):
+                    raise STTClientError(f"{url}: {e}") from e
+                await asyncio.sleep(self.retry.delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code == 200:
+                return response.json()
+            if self.retry.should_retry(attempt, response.status_code):
+                await asyncio.sleep(self.retry.delay(attempt, response.headers.get("Retry-After")))
+                attempt += 1
+                continue
+
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = None
+            raise error_from_response(response.status_code, payload, response.text)
+
+    async def transcribe_many(
+        self,
+        paths: Iterable[str],
+        concurrency: int = 8,
+        language: Optional[str] = None,
+        segments: bool = False
+    ) -> AsyncIterator[BulkResult]:
+        """Transcribe files with bounded concurrency, yielding results as they finish"""
+        path_iter = iter(paths)
+        pending: Dict[asyncio.Task, str] = {}
+
+        def submit_next() -> bool:
+            for path in path_iter:
+                pending[asyncio.ensure_future(self.transcribe(path, language, segments))] = path
+                return True
+            return False
+
+        for _ in range(concurrency):
+            if not submit_next():
+                break
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    path = pending.pop(task)
+                    error = task.exception()
+                    yield BulkResult(path, None if error else task.result(), error)
+                    submit_next()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def transcribe_directory(
+        self,
+        directory: str,
+        concurrency: int = 8,
+        recursive: bool = True,
+        language: Optional[str] = None,
+        segments: bool = False
+    ) -> AsyncIterator[BulkResult]:
+        """Transcribe every audio file in a directory, yielding results as they finish"""
+        return self.transcribe_many(find_audio_files(directory, recursive), concurrency, language, segments)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
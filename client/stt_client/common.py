@@ -0,0 +1,124 @@
+"""
+Client Common Utilities
+"""
+import itertools
+import os
+import random
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+DEFAULT_BASE_URL = "http://localhost:8080"
+TRANSCRIBE_PATH = "/api/v1/transcribe"
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".flac", ".ogg"}
+
+
+class STTClientError(Exception):
+    """STT 서버 요청 실패"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, payload: Optional[Dict[str, Any]] = None):
+        self.message = message
+        self.status_code = status_code
+        self.payload = payload or {}
+        super().__init__(message)
+
+
+class RetryPolicy:
+    """
+    재시도 정책
+
+    429/503 응답과 연결 오류를 지수 백오프(지터 포함)로 재시도하며,
+    서버가 Retry-After 헤더를 보내면 그 값을 우선합니다.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: Sequence[int] = (429, 503)
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = set(retry_statuses)
+
+    def should_retry(self, attempt: int, status_code: Optional[int] = None) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next attempt"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        # full jitter: 동시에 실패한 클라이언트들이 같은 시점에 재시도하지 않도록 분산
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+class BulkResult:
+    """일괄 변환 결과 한 건"""
+
+    __slots__ = ("path", "result", "error")
+
+    def __init__(self, path: str, result: Optional[Dict[str, Any]] = None, error: Optional[Exception] = None):
+        self.path = path
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BulkResult(path={self.path!r}, {status})"
+
+
+class ServerPool:
+    """여러 서버 주소를 라운드 로빈으로 순환"""
+
+    def __init__(self, base_urls: Union[str, Sequence[str]]):
+        urls = [base_urls] if isinstance(base_urls, str) else list(base_urls)
+        if not urls:
+            raise ValueError("base_urls must not be empty")
+        self.base_urls: List[str] = [url.rstrip("/") for url in urls]
+        self._cycle = itertools.cycle(self.base_urls)
+        self._lock = threading.Lock()
+
+    def next_url(self, path: str) -> str:
+        with self._lock:
+            return next(self._cycle) + path
+
+
+def build_params(language: Optional[str], segments: bool) -> Dict[str, str]:
+    params = {}
+    if language:
+        params["language"] = language
+    if segments:
+        params["segments"] = "true"
+    return params
+
+
+def error_from_response(status_code: int, payload: Any, text: str) -> STTClientError:
+    if isinstance(payload, dict):
+        message = payload.get("error") or payload.get("detail") or text
+        return STTClientError(str(message), status_code, payload)
+    return STTClientError(text or f"HTTP {status_code}", status_code)
+
+
+def find_audio_files(directory: str, recursive: bool = True) -> Iterator[str]:
+    """Yield audio files under a directory in sorted order"""
+    if recursive:
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() in AUDIO_EXTENSIONS:
+                    yield os.path.join(root, name)
+    else:
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if os.path.isfile(path) and os.path.splitext(name)[1].lower() in AUDIO_EXTENSIONS:
+                yield path
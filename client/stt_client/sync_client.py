@@ -0,0 +1,138 @@
+"""
+Synchronous Client
+"""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Set, Union
+import requests
+from requests.adapters import HTTPAdapter
+from .common import (
+    DEFAULT_BASE_URL, TRANSCRIBE_PATH, BulkResult, RetryPolicy, ServerPool, STTClientError,
+    build_params, error_from_response, find_audio_files
+)
+
+
+class STTClient:
+    """
+    동기 STT 클라이언트
+
+    keep-alive 연결 풀을 공유하는 requests.Session을 사용하며,
+    여러 서버 주소를 주면 요청을 라운드 로빈으로 분산합니다.
+    """
+
+    def __init__(
+        self,
+        base_urls: Union[str, Sequence[str]] = DEFAULT_BASE_URL,
+        timeout: float = 300.0,
+        connect_timeout: float = 5.0,
+        pool_size: int = 16,
+        retry: Optional[RetryPolicy] = None
+    ):
+        self.servers = ServerPool(base_urls)
+        self.timeout = (connect_timeout, timeout)
+        self.retry = retry or RetryPolicy()
+        self.pool_size = pool_size
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(self.servers.base_urls), pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "STTClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def transcribe(self, path: str, language: Optional[str] = None, segments: bool = False) -> Dict[str, Any]:
+        """Transcribe one audio file"""
+        with open(path, "rb") as f:
+            content = f.read()
+        return self.transcribe_bytes(content, os.path.basename(path), language, segments)
+
+    def transcribe_bytes(
+        self,
+        content: bytes,
+        filename: str,
+        language: Optional[str] = None,
+        segments: bool = False
+    ) -> Dict[str, Any]:
+        """Transcribe in-memory audio, retrying on 429/503 and connection errors"""
+        params = build_params(language, segments)
+        attempt = 0
+        while True:
+            url = self.servers.next_url(TRANSCRIBE_PATH)
+            try:
+                response = self.session.post(
+                    url, params=params, files={"file": (filename, content)}, timeout=self.timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not self.retry.should_retry(attempt):
+                    raise STTClientError(f"{url}: {e}") from e
+                time.sleep(self.retry.delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code == 200:
+                return response.json()
+            if self.retry.should_retry(attempt, response.status_code):
+                time.sleep(self.retry.delay(attempt, response.headers.get("Retry-After")))
+                attempt += 1
+                continue
+
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = None
+            raise error_from_response(response.status_code, payload, response.text)
+
+    def transcribe_many(
+        self,
+        paths: Iterable[str],
+        concurrency: int = 8,
+        language: Optional[str] = None,
+        segments: bool = False
+    ) -> Iterator[BulkResult]:
+        """
+        Transcribe files with bounded concurrency, yielding results as they finish
+
+        동시에 진행 중인 요청은 concurrency개로 제한되며, 입력이 아무리 많아도
+        대기 작업은 그 범위 안에서만 만들어집니다.
+        """
+        path_iter = iter(paths)
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="stt-client") as executor:
+            pending: Dict[Future, str] = {}
+
+            def submit_next() -> bool:
+                for path in path_iter:
+                    pending[executor.submit(self.transcribe, path, language, segments)] = path
+                    return True
+                return False
+
+            for _ in range(concurrency):
+                if not submit_next():
+                    break
+
+            while pending:
+                done: Set[Future]
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    error = future.exception()
+                    yield BulkResult(path, None if error else future.result(), error)
+                    submit_next()
+
+    def transcribe_directory(
+        self,
+        directory: str,
+        concurrency: int = 8,
+        recursive: bool = True,
+        language: Optional[str] = None,
+        segments: bool = False
+    ) -> Iterator[BulkResult]:
+        """Transcribe every audio file in a directory, yielding results as they finish"""
+        return self.transcribe_many(find_audio_files(directory, recursive), concurrency, language, segments)
@@ -1,4 +1,3 @@
-import requests
 import json
 import os
 import time
@@ -6,14 +5,18 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 import urllib.parse
 import webbrowser
 import threading
+from stt_client import STTClient, STTClientError, DEFAULT_BASE_URL
 
 class STTWebClient:
-    def __init__(self, server_url="http://localhost:7926"):
+    def __init__(self, server_url=DEFAULT_BASE_URL):
         self.server_url = server_url
         self.server = None
         self.port = 3000
+        self.client = STTClient(server_url)
     
     def start_web_server(self):
+        client = self.client
+        
         class STTRequestHandler(BaseHTTPRequestHandler):
             def do_GET(self):
                 if self.path == '/':
@@ -59,18 +62,9 @@ class STTWebClient:
             
             def transcribe_file(self, file_path):
                 try:
-                    with open(file_path, 'rb') as audio_file:
-                        files = {'file': audio_file}
-                        response = requests.post(
-                            f"{self.server_url}/api/v1/stt/transcribe",
-                            files=files
-                        )
-                        
-                        if response.status_code == 200:
-                            return response.json()
-                        else:
-                            return {"error": f"서버 오류: {response.status_code}"}
-                            
+                    return client.transcribe(file_path)
+                except STTClientError as e:
+                    return {"error": f"서버 오류: {e.status_code} {e.message}"}
                 except Exception as e:
                     return {"error": f"파일 처리 오류: {e}"}
             
@@ -96,6 +90,8 @@ class STTWebClient:
             print("\n웹 클라이언트를 종료합니다.")
             if self.server:
                 self.server.shutdown()
+        finally:
+            self.client.close()
 
 if __name__ == "__main__":
     client = STTWebClient()
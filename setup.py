@@ -13,6 +13,9 @@ setup(
         "pydantic==2.5.0",
         "pydantic-settings==2.1.0",
         "requests==2.31.0",
+        "orjson",
+        "msgpack",
+        "httpx==0.27.2",
     ],
     author="STT Server Developer",
     description="FastWhisper를 사용한 STT 서버",
@@ -0,0 +1,148 @@
+"""
+Admin API Routes
+"""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+from src.api.dependencies import require_admin
+from src.core.config import settings
+from src.services.stt_service import stt_service
+from src.services.vocabulary import vocabulary_registry
+from src.utils.logger import get_logger
+from src.utils.profiling import profiler
+from src.utils.log_messages import get_log_message
+from src.models.requests import ModelSwapRequest, VocabularyRequest
+from src.models.responses import ModelStatusResponse, VocabularyResponse
+
+logger = get_logger(__name__)
+
+# Create router
+admin_router = APIRouter(
+    prefix="/api/v1/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin)]
+)
+
+@admin_router.get("/model", response_model=ModelStatusResponse)
+async def get_model_status():
+    """
+    모델 상태 조회
+    
+    현재 요청을 처리 중인 모델과 모델 교체 진행 상태를 조회합니다.
+    `X-Admin-Key` 헤더가 필요합니다.
+    """
+    return ModelStatusResponse(**stt_service.get_model_status())
+
+@admin_router.post("/model", response_model=ModelStatusResponse, status_code=202)
+async def swap_model(request: ModelSwapRequest):
+    """
+    무중단 모델 교체
+    
+    새 모델 설정을 백그라운드에서 로드하고 워밍업한 뒤, 새 요청부터 새 모델로 전환합니다.
+    이전 모델은 처리 중인 요청이 모두 끝난 후 해제됩니다.
+    진행 상태는 `GET /api/v1/admin/model`로 확인할 수 있습니다.
+    
+    Raises:
+        403: 관리자 인증 실패
+        409: 이미 모델 교체가 진행 중
+    
+    Example:
+        ```json
+        {
+            "model": "small",
+            "compute_type": "int8"
+        }
+        ```
+    """
+    logger.info(get_log_message("API", "MODEL_SWAP_REQUESTED", model=request.model))
+    status = stt_service.swap_model(request.model, request.device, request.compute_type)
+    return ModelStatusResponse(**status)
+
+@admin_router.get("/vocabularies", response_model=List[VocabularyResponse])
+async def list_vocabularies():
+    """
+    어휘 목록 조회
+    
+    등록된 어휘 목록을 조회합니다.
+    """
+    return [VocabularyResponse(**vocabulary.to_dict()) for vocabulary in vocabulary_registry.list()]
+
+@admin_router.put("/vocabularies", response_model=VocabularyResponse)
+async def register_vocabulary(request: VocabularyRequest):
+    """
+    어휘 목록 등록
+    
+    이름이 붙은 어휘 목록을 등록하거나 교체합니다. 변환 요청에서 `vocabulary=<이름>`으로 지정하거나,
+    `tenant_id`를 지정하면 `X-Tenant-ID` 헤더가 같은 요청에 기본으로 적용됩니다.
+    용어 목록은 모델별로 한 번만 토큰화되어 캐시되며, 프롬프트 길이 제한을 넘는 뒤쪽 용어는 적용되지 않습니다.
+    
+    Raises:
+        400: 용어 목록이 비어 있거나 너무 많음
+        403: 관리자 인증 실패
+    
+    Example:
+        ```json
+        {
+            "name": "projectvg",
+            "terms": ["ProjectVG", "Whisper", "CTranslate2"],
+            "tenant_id": "acme"
+        }
+        ```
+    """
+    vocabulary = vocabulary_registry.register(request.name, request.terms, request.tenant_id)
+    return VocabularyResponse(**vocabulary.to_dict())
+
+@admin_router.delete("/vocabularies/{name}", status_code=204)
+async def delete_vocabulary(name: str):
+    """
+    어휘 목록 삭제
+    
+    Raises:
+        403: 관리자 인증 실패
+        404: 등록되지 않은 어휘 목록
+    """
+    vocabulary_registry.delete(name)
+    logger.info(get_log_message("API", "VOCABULARY_DELETED", name=name))
+
+@admin_router.get("/profile/cpu", response_class=PlainTextResponse)
+async def profile_cpu(
+    seconds: float = Query(10.0, gt=0, le=settings.PROFILE_MAX_SECONDS, description="샘플링 시간 (초)"),
+    interval: Optional[float] = Query(None, ge=0.001, le=1.0, description="샘플링 간격 (초, 기본값: PROFILE_SAMPLE_INTERVAL)"),
+    format: str = Query("text", pattern="^(text|folded)$", description="text: 함수별 요약, folded: 플레임그래프용 접힌 스택"),
+    idle: bool = Query(False, description="유휴 대기 중인 스레드 스택 포함 여부"),
+    limit: int = Query(30, ge=1, le=500, description="text 형식에서 표시할 함수 수")
+):
+    """
+    CPU 프로파일 수집
+    
+    지정한 시간 동안 서버의 모든 스레드 스택을 주기적으로 샘플링합니다.
+    요청 처리 중인 서버에서 실행하여 `process_audio_file` 등의 병목 구간을 확인하는 용도이며,
+    샘플링 스레드는 요청 시간 동안만 실행됩니다.
+    `format=folded` 결과는 flamegraph.pl, speedscope, inferno 등에 그대로 넣을 수 있습니다.
+    
+    Raises:
+        403: 관리자 인증 실패
+        409: 이미 프로파일링이 진행 중
+    """
+    profile = await profiler.profile_cpu(seconds, interval or settings.PROFILE_SAMPLE_INTERVAL, include_idle=idle)
+    return profile.folded() if format == "folded" else profile.report(limit)
+
+@admin_router.get("/profile/heap", response_class=PlainTextResponse)
+async def profile_heap(
+    seconds: float = Query(10.0, gt=0, le=settings.PROFILE_MAX_SECONDS, description="할당 추적 시간 (초)"),
+    frames: int = Query(10, ge=1, le=100, description="할당 위치별로 기록할 호출 스택 깊이"),
+    group_by: str = Query("lineno", pattern="^(lineno|filename|traceback)$", description="할당 집계 기준"),
+    limit: int = Query(30, ge=1, le=500, description="표시할 할당 위치 수")
+):
+    """
+    힙 프로파일 수집
+    
+    지정한 시간 동안 tracemalloc으로 메모리 할당을 추적하고, 끝난 시점에 남아 있는 할당을
+    위치별로 크기 순 정렬하여 반환합니다 (`diff`는 추적 시작 대비 증가량).
+    추적 중에는 할당마다 오버헤드가 있으므로 필요한 시간만 지정하세요.
+    
+    Raises:
+        403: 관리자 인증 실패
+        409: 이미 프로파일링이 진행 중
+    """
+    return await profiler.profile_heap(seconds, frames, limit, group_by)
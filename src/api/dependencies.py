@@ -0,0 +1,27 @@
+"""
+API Dependencies
+"""
+import hmac
+from typing import Optional
+from fastapi import Header
+from src.core.config import settings
+from src.utils.exceptions import AdminAccessDeniedException
+from src.utils.error_messages import get_error_message
+
+
+async def require_admin(x_admin_key: Optional[str] = Header(None, description="관리자 API 키")) -> None:
+    """관리자 API 키 검증"""
+    if not settings.ADMIN_API_KEY:
+        raise AdminAccessDeniedException(get_error_message("API", "ADMIN_DISABLED"))
+    
+    if not x_admin_key or not hmac.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise AdminAccessDeniedException(get_error_message("API", "ADMIN_UNAUTHORIZED"))
+
+
+async def require_cluster_token(x_cluster_token: Optional[str] = Header(None, description="클러스터 내부 토큰")) -> None:
+    """클러스터 내부 API 토큰 검증 (CLUSTER_TOKEN 미설정 시 검증 안 함)"""
+    if not settings.CLUSTER_TOKEN:
+        return
+    
+    if not x_cluster_token or not hmac.compare_digest(x_cluster_token, settings.CLUSTER_TOKEN):
+        raise AdminAccessDeniedException(get_error_message("API", "CLUSTER_UNAUTHORIZED"))
@@ -0,0 +1,83 @@
+"""
+Dispatcher API Routes
+"""
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from src.core.lifecycle import lifecycle
+from src.services.dispatcher import cluster_dispatcher, HOP_BY_HOP_HEADERS, INTERNAL_PREFIX, NODE_HEADER
+from src.utils.error_messages import get_error_message
+from src.utils.logger import get_logger
+from src.models.responses import HealthResponse, ReadinessResponse, ClusterStatusResponse
+
+logger = get_logger(__name__)
+
+# Create router
+dispatcher_router = APIRouter()
+
+PROXY_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
+
+@dispatcher_router.get("/api/v1/health", response_model=HealthResponse, tags=["Dispatcher"])
+async def health_check():
+    """
+    디스패처 상태 확인
+
+    요청을 보낼 수 있는 워커가 하나 이상 있으면 healthy입니다.
+    """
+    ready_nodes = cluster_dispatcher.status()["ready_nodes"]
+    return HealthResponse(
+        status="healthy" if ready_nodes else "unhealthy",
+        model_loaded=ready_nodes > 0,
+        service="STT Dispatcher"
+    )
+
+@dispatcher_router.get("/api/v1/ready", response_model=ReadinessResponse, tags=["Dispatcher"])
+async def readiness_check():
+    """
+    준비 상태 확인
+
+    준비된 워커가 있고 종료 대기 중이 아닐 때만 200을 반환합니다.
+    """
+    ready = cluster_dispatcher.status()["ready_nodes"] > 0 and not lifecycle.draining
+    response = ReadinessResponse(ready=ready, state=lifecycle.state, in_flight=lifecycle.in_flight)
+    if ready:
+        return response
+    return JSONResponse(status_code=503, content=response.model_dump())
+
+@dispatcher_router.get("/api/v1/cluster", response_model=ClusterStatusResponse, tags=["Dispatcher"])
+async def get_cluster_status():
+    """
+    워커 목록과 분배 상태 조회
+
+    각 워커의 마지막 부하 보고(처리 중 요청, 동시 추론 수, 상주 모델), 부하 점수,
+    이 디스패처가 보낸 요청 수를 확인할 수 있습니다.
+    """
+    return ClusterStatusResponse(**cluster_dispatcher.status())
+
+@dispatcher_router.api_route("/{path:path}", methods=PROXY_METHODS, include_in_schema=False)
+async def proxy(request: Request, path: str):
+    """
+    워커로 요청 전달
+
+    `X-STT-Node` 헤더로 워커를 지정하거나 `X-STT-Model` 헤더로 필요한 모델을 지정할 수 있으며,
+    응답에는 처리한 워커가 `X-STT-Node` 헤더로 표시됩니다. 자막 형식 응답은 워커가 보내는 대로 스트리밍합니다.
+    """
+    # 워커 내부 API는 디스패처만 호출하며 외부로 노출하지 않음
+    if (request.url.path.rstrip("/") + "/").startswith(INTERNAL_PREFIX):
+        raise HTTPException(status_code=404, detail=get_error_message("API", "NOT_FOUND"))
+    body = await request.body()
+    node, upstream = await cluster_dispatcher.forward(
+        request.method, request.url.path, request.url.query, request.headers, body,
+        client_host=request.client.host if request.client else None
+    )
+    headers = {name: value for name, value in upstream.headers.items() if name.lower() not in HOP_BY_HOP_HEADERS}
+    headers[NODE_HEADER] = node.node
+
+    content = await cluster_dispatcher.track(node, request.method, request.url.path, upstream)
+    if content is not None:
+        await upstream.aclose()
+        return Response(content=content, status_code=upstream.status_code, headers=headers)
+    return StreamingResponse(
+        upstream.aiter_raw(), status_code=upstream.status_code, headers=headers,
+        background=BackgroundTask(upstream.aclose)
+    )
@@ -0,0 +1,43 @@
+"""
+Internal API Routes
+"""
+import socket
+from fastapi import APIRouter, Depends
+from src.api.dependencies import require_cluster_token
+from src.core.lifecycle import lifecycle
+from src.services.stt_service import stt_service
+from src.services.audio_buffers import audio_budget
+from src.services.jobs import job_store
+from src.core.config import settings
+from src.models.responses import WorkerLoadResponse
+
+# Create router
+internal_router = APIRouter(
+    prefix="/api/v1/internal",
+    tags=["Internal"],
+    dependencies=[Depends(require_cluster_token)]
+)
+
+@internal_router.get("/load", response_model=WorkerLoadResponse)
+async def get_load():
+    """
+    워커 부하 및 상주 모델 보고
+
+    디스패처(`SERVER_ROLE=dispatcher`)가 주기적으로 폴링하여 요청을 보낼 워커를 고릅니다.
+    `CLUSTER_TOKEN`이 설정된 경우 `X-Cluster-Token` 헤더가 필요합니다.
+    """
+    status = stt_service.get_model_status()
+    active = stt_service.models.active
+    return WorkerLoadResponse(
+        node_id=settings.NODE_ID or socket.gethostname(),
+        state=lifecycle.state,
+        ready=active is not None and not lifecycle.draining,
+        in_flight=lifecycle.in_flight,
+        inference_in_flight=status["in_flight"],
+        capacity=active.config.num_workers if active else 0,
+        jobs_active=job_store.active_count(),
+        models=[active.config.model] if active else [],
+        generation=status["generation"],
+        swap_state=status["swap"]["state"],
+        audio_buffers=audio_budget.status()
+    )
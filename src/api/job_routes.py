@@ -0,0 +1,30 @@
+"""
+Job API Routes
+"""
+from fastapi import APIRouter
+from src.services.jobs import job_store
+from src.utils.logger import get_logger
+from src.models.responses import JobResponse
+
+logger = get_logger(__name__)
+
+# Create router
+job_router = APIRouter(prefix="/api/v1/jobs", tags=["Jobs"])
+
+@job_router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """
+    비동기 변환 작업 조회
+
+    `callback_url`을 지정한 변환 요청이 반환한 작업의 상태와 결과를 조회합니다.
+    웹훅을 받지 못한 경우에도 완료 후 `JOB_RESULT_TTL`초 동안 결과를 조회할 수 있습니다.
+
+    - queued / running: 변환 대기 또는 진행 중
+    - completed: `result`에 동기 요청과 같은 형식의 변환 결과
+    - failed: `error`와 `status_code`에 실패 사유
+    - callback: 웹훅 전송 상태 (pending/delivered/failed, 시도 횟수, 마지막 응답)
+
+    Raises:
+        404: 작업이 없거나 결과 보관 기간이 지남
+    """
+    return JobResponse(**job_store.get(job_id).to_dict())
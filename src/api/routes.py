@@ -1,16 +1,35 @@
 """
 API Routes
 """
-from typing import Optional
-from fastapi import APIRouter, File, UploadFile, Depends, Query, HTTPException
-from fastapi.responses import JSONResponse
+import os
+from typing import Iterator, Optional
+from urllib.parse import quote
+from fastapi import APIRouter, File, UploadFile, Depends, Query, HTTPException, Header
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from src.services.stt_service import stt_service
+from src.services.vocabulary import vocabulary_registry, PromptSpec
+from src.services.audio_buffers import audio_budget
+from src.services.sessions import session_store, ConversationSession
+from src.services.jobs import job_runner
+from src.services.webhooks import validate_callback_url
 from src.core.config import settings
-from src.utils.logger import get_logger
+from src.core.lifecycle import lifecycle
+from src.utils.logger import get_logger, SAMPLED
 from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+from src.utils.tracing import span
+from src.utils.exceptions import NotAcceptableException, JobException
+from src.utils.error_messages import get_error_message
+from src.utils.subtitles import render_subtitles, SUBTITLE_MEDIA_TYPES
+from src.utils.serialization import (
+    negotiate_media_type, render_transcription, JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE
+)
 from src.models.responses import (
-    TranscriptionResponse, HealthResponse, ServiceInfoResponse
+    TranscriptionResponse, HealthResponse, ServiceInfoResponse, MetricsResponse, ReadinessResponse,
+    TranscriptionSegment, JobResponse
 )
+from src.models.segments import SegmentStream
 
 logger = get_logger(__name__)
 
@@ -49,14 +68,46 @@ async def health_check():
         service="STT Server"
     )
 
-@router.post("/transcribe", response_model=TranscriptionResponse)
+@router.get("/ready", response_model=ReadinessResponse)
+async def readiness_check():
+    """
+    준비 상태 확인
+    
+    모델이 로드되어 있고 종료 대기 중이 아닐 때만 200을 반환합니다.
+    종료 신호를 받은 뒤에는 503을 반환하여 로드 밸런서가 새 요청을 보내지 않도록 합니다.
+    """
+    ready = stt_service.is_model_loaded() and not lifecycle.draining
+    response = ReadinessResponse(ready=ready, state=lifecycle.state, in_flight=lifecycle.in_flight)
+    if ready:
+        return response
+    return JSONResponse(status_code=503, content=response.model_dump())
+
+@router.post(
+    "/transcribe",
+    response_model=TranscriptionResponse,
+    responses={200: {"content": {
+        MSGPACK_MEDIA_TYPE: {}, **{media_type: {} for media_type in SUBTITLE_MEDIA_TYPES.values()}
+    }}, 202: {"model": JobResponse, "description": "callback_url 지정 시 작업 접수"}}
+)
 async def transcribe_audio(
     file: UploadFile = File(..., description="음성 파일 (WAV, MP3, M4A, FLAC, OGG)"),
     language: Optional[str] = Query(
         None, 
         description="언어 코드 (예: ko, en, ja, zh 등). 미지정 시 자동 감지",
         example="ko"
-    )
+    ),
+    segments: bool = Query(False, description="세그먼트 상세 정보 포함 여부"),
+    vocabulary: Optional[str] = Query(None, description="적용할 등록 어휘 목록 이름. 미지정 시 테넌트 기본 어휘 목록"),
+    hotwords: Optional[str] = Query(None, description="이번 요청에만 적용할 핫워드 (쉼표로 구분)"),
+    initial_prompt: Optional[str] = Query(None, description="이번 요청에만 적용할 초기 프롬프트"),
+    task: str = Query("transcribe", pattern="^(transcribe|translate|both)$", description="transcribe: 원문, translate: 영어 번역, both: 원문과 영어 번역"),
+    format: str = Query("json", pattern="^(json|srt|vtt|tsv|txt)$", description="응답 형식 (json 또는 자막 형식 srt/vtt/tsv/txt)"),
+    channels: str = Query("mix", pattern="^(mix|split)$", description="mix: 채널을 합쳐 변환, split: 채널별로 변환 후 시간순 병합"),
+    session_id: Optional[str] = Query(None, description="대화 세션 ID (POST /api/v1/sessions로 생성)"),
+    callback_url: Optional[str] = Query(None, description="지정 시 202로 즉시 응답하고 변환 결과를 이 URL로 POST"),
+    accept: Optional[str] = Header(None, description="응답 형식 (application/json 또는 application/msgpack)"),
+    x_tenant_id: Optional[str] = Header(None, description="테넌트 ID (기본 어휘 목록 선택)"),
+    x_session_id: Optional[str] = Header(None, description="대화 세션 ID (session_id 파라미터 대신 사용 가능)")
 ):
     """
     음성 파일을 텍스트로 변환
@@ -66,6 +117,25 @@ async def transcribe_audio(
     Args:
         file: 변환할 음성 파일
         language: 언어 코드 (선택사항)
+        segments: 세그먼트 상세 정보 포함 여부
+        vocabulary: 등록된 어휘 목록 이름 (`PUT /api/v1/admin/vocabularies`로 등록)
+        hotwords: 요청별 핫워드
+        initial_prompt: 요청별 초기 프롬프트
+        task: `translate`는 영어 번역만, `both`는 원문(text)과 영어 번역(translation)을 함께 반환.
+            `both`는 오디오 디코딩과 특징·인코더 계산을 두 작업이 공유하므로 번역은 디코더 비용만 추가됨
+        format: `srt`, `vtt`, `tsv`, `txt` 지정 시 자막 파일로 응답. 세그먼트가 디코딩되는 대로 스트리밍되며
+            (채널 분리·task=both·보조 디코딩은 스트리밍하지 않고 변환 완료 후 전송), task=both에서는 원문 자막을 반환.
+            channels=split이면 자막마다 채널 번호를 표시 (SRT/TXT `[ch0]`, VTT `<v ch0>`, TSV channel 열)
+        channels: `split` 지정 시 스테레오의 각 채널(예: 상담원/고객)을 병렬로 따로 변환하고,
+            세그먼트에 채널 번호를 붙여 시간순으로 병합함. 무음 채널은 추론 없이 건너뜀
+        accept: `application/msgpack` 지정 시 msgpack으로 응답하며, segments는 열 배열
+            ({"start": [...], "end": [...], "text": [...], "confidence": [...]})로 인코딩됨
+        x_tenant_id: vocabulary 미지정 시 이 테넌트의 기본 어휘 목록 적용
+        session_id: 지정 시 세션의 언어(첫 턴에서 감지)와 직전 턴 텍스트(초기 프롬프트)를 사용하고,
+            변환 후 세션 상태를 갱신함. 요청에 지정한 language/vocabulary/initial_prompt가 우선함
+        callback_url: 지정 시 업로드 검증·저장 후 202와 작업 ID를 반환하고 백그라운드에서 변환함.
+            결과는 `GET /api/v1/jobs/{job_id}`로 JOB_RESULT_TTL 동안 조회할 수 있고, 완료되면
+            같은 형식의 본문을 callback_url로 POST함 (실패 시 지수 백오프로 재시도, format=json만 지원)
     
     Returns:
         TranscriptionResponse: 변환 결과
@@ -75,10 +145,17 @@ async def transcribe_audio(
             - segments_count: 세그먼트 개수
             - processing_time: 처리 시간 (초)
             - file_info: 파일 정보
+            - task: 수행한 작업
+            - translation: 영어 번역 결과 (task=both인 경우)
+            - vocabulary: 적용된 어휘 목록 이름
+            - channels: 채널별 변환 정보 (channels=split인 경우)
     
     Raises:
-        400: 파일 형식이 지원되지 않거나 파일이 너무 큼
+        400: 파일 형식이 지원되지 않거나 파일이 너무 큼, 잘못된 callback_url
+        404: 등록되지 않은 어휘 목록 또는 만료된 세션
+        406: 지원하지 않는 응답 형식
         422: 파일 업로드 실패
+        429: 대기 중인 비동기 작업이 JOB_MAX_QUEUED를 넘음
         500: 모델 로딩 실패 또는 변환 오류
     
     Example:
@@ -93,15 +170,90 @@ async def transcribe_audio(
                 "filename": "recording.wav",
                 "content_type": "audio/wav",
                 "size": 1024000
-            }
+            },
+            "vocabulary": "projectvg"
         }
         ```
     """
-    logger.info(get_log_message("API", "REQUEST_RECEIVED", filename=file.filename))
-    result = await stt_service.process_audio_file(file, language)
-    logger.info(get_log_message("API", "REQUEST_COMPLETED", filename=file.filename))
-    logger.info(f"API 응답 결과 - 텍스트: '{result.get('text', 'N/A')}', 언어: '{result.get('language', 'N/A')}'")
-    return TranscriptionResponse(**result)
+    media_type = SUBTITLE_MEDIA_TYPES[format] if format != "json" else negotiate_media_type(accept)
+    if media_type is None:
+        raise NotAcceptableException(
+            get_error_message("API", "NOT_ACCEPTABLE", formats=f"{JSON_MEDIA_TYPE}, {MSGPACK_MEDIA_TYPE}")
+        )
+    
+    logger.info(get_log_message("API", "REQUEST_RECEIVED", filename=file.filename), extra=SAMPLED)
+    session = session_store.get(session_id or x_session_id) if session_id or x_session_id else None
+    if session is not None:
+        language, vocabulary, initial_prompt = session_store.resolve_turn(session, language, vocabulary, initial_prompt)
+    prompt = PromptSpec(vocabulary_registry.resolve(vocabulary, x_tenant_id), initial_prompt, hotwords)
+    
+    if callback_url is not None:
+        if format != "json":
+            raise JobException(get_error_message("API", "CALLBACK_FORMAT_UNSUPPORTED"), status_code=400)
+        # 호스트 이름 해석이 이벤트 루프를 막지 않도록 스레드에서 검증
+        callback_url = await run_in_threadpool(validate_callback_url, callback_url)
+        job = job_runner.submit(
+            file, callback_url, language, prompt, split_channels=channels == "split",
+            task=task, include_segments=segments,
+            on_result=_session_turn_recorder(session, task) if session is not None else None
+        )
+        headers = {"Location": f"{router.prefix}/jobs/{job.job_id}"}
+        if session is not None:
+            headers["X-Session-ID"] = session.session_id
+        return JSONResponse(
+            status_code=202, content=JobResponse(**job.to_dict()).model_dump(mode="json"), headers=headers
+        )
+    
+    if format != "json":
+        segment_iterator = await stt_service.transcribe_segments(
+            file, language, prompt, split_channels=channels == "split", task=task
+        )
+        filename = f"{os.path.splitext(os.path.basename(file.filename))[0] or 'transcript'}.{format}"
+        headers = {"Content-Disposition": f"inline; filename*=UTF-8''{quote(filename)}"}
+        if session is not None:
+            segment_iterator = _record_session_turn(segment_iterator, session, task)
+            headers["X-Session-ID"] = session.session_id
+        return StreamingResponse(
+            render_subtitles(segment_iterator, format, with_channels=channels == "split"),
+            media_type=media_type,
+            headers=headers
+        )
+    
+    result = await stt_service.process_audio_file(
+        file, language, prompt, split_channels=channels == "split", task=task
+    )
+    logger.info(get_log_message("API", "REQUEST_COMPLETED", filename=file.filename), extra=SAMPLED)
+    if settings.LOG_TRANSCRIPT_TEXT:
+        logger.info(f"API 응답 결과 - 텍스트: '{result.get('text', 'N/A')}', 언어: '{result.get('language', 'N/A')}'")
+    if session is not None:
+        _session_turn_recorder(session, task)(result)
+    with span("serialize", media_type=media_type):
+        response = render_transcription(result, media_type, include_segments=segments)
+    if session is not None:
+        response.headers["X-Session-ID"] = session.session_id
+    return response
+
+def _session_turn_recorder(session: ConversationSession, task: str):
+    """Store a finished JSON result as the session's latest turn"""
+    def record(result):
+        session_store.record_turn(
+            session, result["text"] if task != "translate" else None,
+            result["language"], result["language_probability"], model=stt_service.get_active_model_config().model
+        )
+    return record
+
+def _record_session_turn(segments: SegmentStream, session: ConversationSession,
+                         task: str) -> Iterator[TranscriptionSegment]:
+    """Pass streamed segments through and store the turn text and detected language when the stream ends"""
+    texts = []
+    for segment in segments:
+        texts.append(segment.text)
+        yield segment
+    # 번역 결과는 원문 프롬프트로 쓸 수 없으므로 저장하지 않음
+    session_store.record_turn(
+        session, "".join(texts) if task != "translate" else None,
+        segments.language, segments.language_probability, model=stt_service.get_active_model_config().model
+    )
 
 @router.get("/info", response_model=ServiceInfoResponse)
 async def get_service_info():
@@ -133,12 +285,39 @@ async def get_service_info():
         }
         ```
     """
+    model_config = stt_service.get_active_model_config()
+    features = ["transcription", "language_detection", "segment_analysis", "custom_vocabulary", "translation", "sessions", "async_jobs"]
+    if stt_service.draft_models.active is not None:
+        features.append("assisted_decoding")
     return ServiceInfoResponse(
         service="STT Server",
         version="1.0.0",
-        model=settings.WHISPER_MODEL,
-        device=settings.WHISPER_DEVICE,
+        model=model_config.model,
+        device=model_config.device,
         supported_formats=list(settings.ALLOWED_EXTENSIONS),
         max_file_size_mb=settings.MAX_FILE_SIZE // (1024*1024),
-        features=["transcription", "language_detection", "segment_analysis"]
-    ) 
\ No newline at end of file
+        features=features,
+        audio_buffers=audio_budget.status()
+    )
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def get_metrics():
+    """
+    서비스 메트릭 조회
+    
+    요청 처리와 관련된 누적 카운터와 현재 게이지 값을 조회합니다.
+    
+    Example:
+        ```json
+        {
+            "counters": {
+                "assisted_segments_drafted_total": 120,
+                "assisted_segments_accepted_total": 96
+            },
+            "gauges": {
+                "assisted_accept_rate": 0.8
+            }
+        }
+        ```
+    """
+    return MetricsResponse(**metrics.snapshot()) 
\ No newline at end of file
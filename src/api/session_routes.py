@@ -0,0 +1,57 @@
+"""
+Session API Routes
+"""
+from typing import Optional
+from fastapi import APIRouter, Body
+from src.services.sessions import session_store
+from src.services.vocabulary import vocabulary_registry
+from src.utils.logger import get_logger
+from src.models.requests import SessionRequest
+from src.models.responses import SessionResponse
+
+logger = get_logger(__name__)
+
+# Create router
+session_router = APIRouter(prefix="/api/v1/sessions", tags=["Sessions"])
+
+@session_router.post("", response_model=SessionResponse, status_code=201)
+async def create_session(request: Optional[SessionRequest] = Body(None)):
+    """
+    대화 세션 생성
+
+    음성 대화처럼 한 사용자의 발화가 여러 번의 변환 요청으로 나뉘어 들어오는 경우 사용합니다.
+    변환 요청에 `session_id`를 지정하면 서버가 턴 사이의 상태를 유지합니다.
+
+    - 언어: 첫 턴에서 감지한 언어를 이후 턴에 고정하여 언어 감지를 생략
+    - 프롬프트: 직전 턴 변환 텍스트를 다음 턴의 초기 프롬프트로 사용하여 문맥 유지
+
+    세션은 마지막 사용 후 `SESSION_TTL`초가 지나면 만료됩니다.
+
+    Raises:
+        404: 등록되지 않은 어휘 목록
+    """
+    request = request or SessionRequest()
+    if request.vocabulary:
+        vocabulary_registry.get(request.vocabulary)
+    session = session_store.create(request.language, request.vocabulary)
+    return SessionResponse(**session.to_dict())
+
+@session_router.get("/{session_id}", response_model=SessionResponse)
+async def get_session(session_id: str):
+    """
+    대화 세션 조회
+
+    Raises:
+        404: 세션이 없거나 만료됨
+    """
+    return SessionResponse(**session_store.get(session_id).to_dict())
+
+@session_router.delete("/{session_id}", status_code=204)
+async def delete_session(session_id: str):
+    """
+    대화 세션 종료
+
+    Raises:
+        404: 세션이 없거나 만료됨
+    """
+    session_store.delete(session_id)
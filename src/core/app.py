@@ -4,7 +4,12 @@ FastAPI Application Factory
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.core.config import settings
+from src.core.middleware import RequestTracingMiddleware, AdmissionMiddleware
 from src.api.routes import router
+from src.api.admin_routes import admin_router
+from src.api.session_routes import session_router
+from src.api.job_routes import job_router
+from src.api.internal_routes import internal_router
 from src.utils.logger import get_logger
 from src.utils.exception_handlers import register_exception_handlers
 from src.utils.log_messages import get_log_message
@@ -12,7 +17,12 @@ from src.utils.log_messages import get_log_message
 logger = get_logger(__name__)
 
 def create_app() -> FastAPI:
-    """Create FastAPI application"""
+    """
+    Create FastAPI application
+    
+    import 시점에 앱을 만들지 않으므로 설정이나 OpenAPI 스키마만 필요한 경우에도 호출한 곳에서만 비용이 듭니다.
+    uvicorn으로 직접 실행할 때는 `uvicorn --factory src.core.app:create_app`을 사용합니다.
+    """
     
     # Create FastAPI app
     app = FastAPI(
@@ -84,6 +94,10 @@ def create_app() -> FastAPI:
                     "url": "https://github.com/guillaumekln/faster-whisper",
                 },
             },
+            {
+                "name": "Admin",
+                "description": "운영 관리 API (`X-Admin-Key` 헤더 필요)",
+            },
         ]
     )
     
@@ -96,8 +110,18 @@ def create_app() -> FastAPI:
         allow_headers=settings.CORS_HEADERS,
     )
     
+    # Add admission middleware (종료 중 새 작업 거절 및 처리 중 요청 집계)
+    app.add_middleware(AdmissionMiddleware)
+    
+    # Add request tracing middleware (요청 ID 부여 및 단계별 타임라인 수집)
+    app.add_middleware(RequestTracingMiddleware)
+    
     # Include API routes
     app.include_router(router)
+    app.include_router(admin_router)
+    app.include_router(session_router)
+    app.include_router(job_router)
+    app.include_router(internal_router)
     
     # Root endpoint
     @app.get("/", tags=["Root"])
@@ -122,6 +146,3 @@ def create_app() -> FastAPI:
     
     logger.info(get_log_message("SYSTEM", "APP_CREATED"))
     return app
-
-# Create app instance
-app = create_app() 
\ No newline at end of file
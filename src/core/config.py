@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     
     # File Upload Settings
     UPLOAD_FOLDER: str = Field(default="uploads", env="UPLOAD_FOLDER")
+    UPLOAD_TMPFS_DIR: Optional[str] = Field(default="/dev/shm", env="UPLOAD_TMPFS_DIR")  # 쓸 수 있으면 메모리 기반 임시 저장 (빈 값이면 비활성화)
     MAX_FILE_SIZE: int = Field(default=16 * 1024 * 1024, env="MAX_FILE_SIZE")  # 16MB
     ALLOWED_EXTENSIONS: set = Field(default={".wav", ".mp3", ".m4a", ".flac", ".ogg"})
     
@@ -27,6 +28,109 @@ class Settings(BaseSettings):
     WHISPER_DEVICE: str = Field(default="cpu", env="WHISPER_DEVICE")
     WHISPER_COMPUTE_TYPE: str = Field(default="float32", env="WHISPER_COMPUTE_TYPE")
     WHISPER_LANGUAGE: Optional[str] = Field(default=None, env="WHISPER_LANGUAGE")
+    WHISPER_BEAM_SIZE: int = Field(default=5, env="WHISPER_BEAM_SIZE")  # 1이면 greedy 디코딩
+    WHISPER_VAD_FILTER: bool = Field(default=False, env="WHISPER_VAD_FILTER")  # Silero VAD로 무음 구간 제외 후 디코딩
+    WHISPER_CPU_THREADS: int = Field(default=0, env="WHISPER_CPU_THREADS")  # 추론당 스레드 수, 0이면 CPU 한도 / 동시 추론 수
+    WHISPER_NUM_WORKERS: int = Field(default=1, env="WHISPER_NUM_WORKERS")  # 동시 추론 수
+    
+    # Model Swap Settings
+    MODEL_WARMUP_ENABLED: bool = Field(default=True, env="MODEL_WARMUP_ENABLED")
+    MODEL_DRAIN_TIMEOUT: float = Field(default=300.0, env="MODEL_DRAIN_TIMEOUT")  # seconds
+    
+    # Request Coalescing Settings (동일 오디오·동일 조건의 동시 요청은 한 번만 디코딩)
+    COALESCING_ENABLED: bool = Field(default=True, env="COALESCING_ENABLED")
+    
+    # Channel Split Settings (channels=split 요청에서 RMS가 이 값보다 작은 채널은 무음으로 보고 건너뜀)
+    CHANNEL_SILENCE_RMS: float = Field(default=0.001, env="CHANNEL_SILENCE_RMS")  # 약 -60 dBFS
+    
+    # Multi-task Settings (task=both 요청에서 transcribe/translate가 공유하는 인코더 출력 수, 30초 구간 단위)
+    ENCODER_REUSE_MAX_WINDOWS: int = Field(default=20, env="ENCODER_REUSE_MAX_WINDOWS")
+    
+    # Encoder/Feature Cache Settings (반복·접두사 공유 오디오의 특징 추출과 인코딩 생략, 0이면 비활성화)
+    ENCODER_CACHE_MAX_MB: int = Field(default=128, env="ENCODER_CACHE_MAX_MB")  # 30초 구간 인코더 출력 (LRU)
+    FEATURE_CACHE_MAX_MB: int = Field(default=32, env="FEATURE_CACHE_MAX_MB")  # 오디오 전체 log-mel 특징 (LRU)
+    ENCODER_CACHE_TTL: float = Field(default=0.0, env="ENCODER_CACHE_TTL")  # seconds, 0이면 만료 없음
+    
+    # Vocabulary Settings (등록된 어휘 목록을 initial_prompt 토큰으로 적용)
+    VOCABULARY_STORE_PATH: Optional[str] = Field(default=None, env="VOCABULARY_STORE_PATH")  # 미설정 시 메모리에만 보관
+    VOCABULARY_MAX_TERMS: int = Field(default=1000, env="VOCABULARY_MAX_TERMS")
+    
+    # Assisted Decoding Settings (초안 모델이 디코딩하고 저신뢰 구간만 기본 모델로 재디코딩)
+    ASSISTED_DECODING_ENABLED: bool = Field(default=False, env="ASSISTED_DECODING_ENABLED")
+    DRAFT_MODEL: str = Field(default="tiny", env="DRAFT_MODEL")
+    DRAFT_COMPUTE_TYPE: str = Field(default="int8", env="DRAFT_COMPUTE_TYPE")
+    DRAFT_BEAM_SIZE: int = Field(default=1, env="DRAFT_BEAM_SIZE")
+    DRAFT_ACCEPT_LOGPROB: float = Field(default=-0.5, env="DRAFT_ACCEPT_LOGPROB")
+    DRAFT_MAX_COMPRESSION_RATIO: float = Field(default=2.4, env="DRAFT_MAX_COMPRESSION_RATIO")
+    DRAFT_MAX_NO_SPEECH_PROB: float = Field(default=0.6, env="DRAFT_MAX_NO_SPEECH_PROB")
+    
+    # Logging Settings
+    LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
+    LOG_FILE: Optional[str] = Field(default=None, env="LOG_FILE")
+    LOG_FORMAT: str = Field(default="text", env="LOG_FORMAT")  # text 또는 json
+    LOG_ASYNC: bool = Field(default=True, env="LOG_ASYNC")  # QueueHandler로 I/O를 백그라운드 스레드에서 처리
+    LOG_SAMPLE_RATE: float = Field(default=1.0, env="LOG_SAMPLE_RATE")  # 요청별 고빈도 로그 샘플링 비율
+    LOG_TRANSCRIPT_TEXT: bool = Field(default=False, env="LOG_TRANSCRIPT_TEXT")  # 변환 결과 텍스트 로그 여부 (디버그용)
+    
+    # Tracing Settings
+    TRACING_ENABLED: bool = Field(default=True, env="TRACING_ENABLED")
+    TRACE_SERVICE_NAME: str = Field(default="stt-server", env="TRACE_SERVICE_NAME")
+    TRACE_EXPORT_PATH: Optional[str] = Field(default=None, env="TRACE_EXPORT_PATH")  # OTLP/JSON 파일 (한 줄에 trace 하나)
+    TRACE_COLLECTOR_URL: Optional[str] = Field(default=None, env="TRACE_COLLECTOR_URL")  # 예: http://localhost:4318/v1/traces
+    SLOW_REQUEST_THRESHOLD: float = Field(default=10.0, env="SLOW_REQUEST_THRESHOLD")  # seconds
+    SLOW_REQUEST_DIR: str = Field(default="logs/slow_requests", env="SLOW_REQUEST_DIR")
+    
+    # Profiling Settings (관리자 API로 요청한 시간 동안만 CPU 샘플링/힙 추적)
+    PROFILE_MAX_SECONDS: float = Field(default=60.0, env="PROFILE_MAX_SECONDS")  # 프로파일 1회 최대 시간
+    PROFILE_SAMPLE_INTERVAL: float = Field(default=0.01, env="PROFILE_SAMPLE_INTERVAL")  # CPU 샘플링 간격 (초)
+    
+    # Session Settings (대화 턴 간 언어·직전 텍스트 유지)
+    SESSION_TTL: float = Field(default=300.0, env="SESSION_TTL")  # 마지막 사용 후 유지 시간 (초)
+    SESSION_MAX_COUNT: int = Field(default=10000, env="SESSION_MAX_COUNT")
+    SESSION_PROMPT_CHARS: int = Field(default=200, env="SESSION_PROMPT_CHARS")  # 다음 턴 프롬프트로 쓸 직전 텍스트 길이
+    SESSION_LANGUAGE_MIN_PROBABILITY: float = Field(default=0.8, env="SESSION_LANGUAGE_MIN_PROBABILITY")  # 감지 언어를 세션에 고정할 최소 확률
+    
+    # Async Job Settings (callback_url 지정 요청은 202로 즉시 응답 후 백그라운드 변환, 결과 보관 및 웹훅 전송)
+    JOB_RESULT_TTL: float = Field(default=3600.0, env="JOB_RESULT_TTL")  # 완료 후 결과 보관 시간 (초)
+    JOB_MAX_COUNT: int = Field(default=10000, env="JOB_MAX_COUNT")  # 보관할 완료 작업 수 상한
+    JOB_MAX_CONCURRENCY: int = Field(default=2, env="JOB_MAX_CONCURRENCY")  # 동시에 실행할 백그라운드 변환 수
+    JOB_MAX_QUEUED: int = Field(default=100, env="JOB_MAX_QUEUED")  # 대기·실행 중 작업 상한 (초과 시 429)
+    JOB_STORE_PATH: Optional[str] = Field(default=None, env="JOB_STORE_PATH")  # 종료 시 작업 결과 저장 파일 (미설정 시 메모리에만 보관)
+    JOB_CALLBACK_TIMEOUT: float = Field(default=10.0, env="JOB_CALLBACK_TIMEOUT")  # 웹훅 요청 1회 제한 시간 (초)
+    JOB_CALLBACK_RETRIES: int = Field(default=5, env="JOB_CALLBACK_RETRIES")  # 첫 시도 이후 재시도 횟수
+    JOB_CALLBACK_BACKOFF: float = Field(default=1.0, env="JOB_CALLBACK_BACKOFF")  # 재시도 대기 기본값 (초, 시도마다 2배)
+    JOB_CALLBACK_BACKOFF_MAX: float = Field(default=300.0, env="JOB_CALLBACK_BACKOFF_MAX")  # 재시도 대기 상한 (초)
+    JOB_CALLBACK_WORKERS: int = Field(default=4, env="JOB_CALLBACK_WORKERS")  # 동시 웹훅 전송 수 (HTTP 연결 풀 크기)
+    JOB_CALLBACK_SECRET: Optional[str] = Field(default=None, env="JOB_CALLBACK_SECRET")  # 설정 시 본문 HMAC-SHA256 서명 헤더 추가
+    JOB_CALLBACK_ALLOWED_HOSTS: list = Field(default=[], env="JOB_CALLBACK_ALLOWED_HOSTS")  # 비어 있으면 공인 주소 호스트만 허용, 목록의 호스트는 내부 주소여도 허용
+
+    # Cluster Settings (dispatcher 역할은 모델 없이 워커 인스턴스들의 부하·상주 모델을 폴링하여 요청을 분배)
+    SERVER_ROLE: str = Field(default="worker", env="SERVER_ROLE")  # worker 또는 dispatcher
+    NODE_ID: Optional[str] = Field(default=None, env="NODE_ID")  # 부하 보고에 표시할 워커 이름 (미설정 시 호스트 이름)
+    CLUSTER_TOKEN: Optional[str] = Field(default=None, env="CLUSTER_TOKEN")  # 설정 시 내부 API에 X-Cluster-Token 헤더 필요
+    DISPATCHER_WORKERS: list = Field(default=[], env="DISPATCHER_WORKERS")  # 예: ["http://127.0.0.1:8081", "http://127.0.0.1:8082"]
+    DISPATCHER_POLL_INTERVAL: float = Field(default=1.0, env="DISPATCHER_POLL_INTERVAL")  # 워커 부하 폴링 간격 (초)
+    DISPATCHER_POLL_TIMEOUT: float = Field(default=2.0, env="DISPATCHER_POLL_TIMEOUT")
+    DISPATCHER_REQUEST_TIMEOUT: float = Field(default=600.0, env="DISPATCHER_REQUEST_TIMEOUT")  # 워커 응답 대기 최대 시간 (초)
+    DISPATCHER_MAX_CONNECTIONS: int = Field(default=100, env="DISPATCHER_MAX_CONNECTIONS")  # 워커 연결 풀 크기
+    DISPATCHER_AFFINITY_TTL: float = Field(default=3600.0, env="DISPATCHER_AFFINITY_TTL")  # 세션·작업 ID → 워커 매핑 유지 시간 (초)
+    DISPATCHER_AFFINITY_MAX: int = Field(default=100000, env="DISPATCHER_AFFINITY_MAX")
+
+    # Audio Buffer Settings (디코딩된 PCM 메모리 예산, 큰 입력은 창 단위로 디코딩)
+    AUDIO_MEMORY_BUDGET_MB: int = Field(default=512, env="AUDIO_MEMORY_BUDGET_MB")  # 동시 요청 전체의 디코딩 버퍼 합계 상한
+    AUDIO_MAX_REQUEST_MB: int = Field(default=64, env="AUDIO_MAX_REQUEST_MB")  # 이보다 크면 창 단위 처리 (float32 기준 약 17분)
+    AUDIO_WINDOW_SECONDS: int = Field(default=600, env="AUDIO_WINDOW_SECONDS")  # 창 단위 처리 시 창 길이
+    AUDIO_BUDGET_WAIT: float = Field(default=30.0, env="AUDIO_BUDGET_WAIT")  # 예산 대기 최대 시간 (초, 초과 시 503)
+    
+    # Audio Preprocessing Settings (PCM WAV는 FFmpeg 없이 메모리 매핑 후 NumPy로 다운믹스·리샘플링)
+    AUDIO_FAST_PATH: bool = Field(default=True, env="AUDIO_FAST_PATH")
+    AUDIO_NORMALIZE_DBFS: Optional[float] = Field(default=None, env="AUDIO_NORMALIZE_DBFS")  # 예: -20 (미설정 시 음량 정규화 안 함)
+    AUDIO_MAX_GAIN_DB: float = Field(default=30.0, env="AUDIO_MAX_GAIN_DB")  # 음량 정규화 최대 증폭
+    
+    # Shutdown Settings (종료 신호 수신 시 새 작업 거절 후 처리 중 요청 대기)
+    SHUTDOWN_DRAIN_TIMEOUT: float = Field(default=60.0, env="SHUTDOWN_DRAIN_TIMEOUT")  # seconds
+    SHUTDOWN_RETRY_AFTER: int = Field(default=5, env="SHUTDOWN_RETRY_AFTER")  # 거절 응답의 Retry-After (초)
+    UPLOAD_SWEEP_MIN_AGE: float = Field(default=0.0, env="UPLOAD_SWEEP_MIN_AGE")  # 시작 시 종료된 프로세스의 업로드 파일 중 이보다 오래된 것만 삭제 (초)
     
     # CORS Settings
     CORS_ORIGINS: list = Field(default=["*"], env="CORS_ORIGINS")
@@ -36,6 +140,7 @@ class Settings(BaseSettings):
     
     # Security Settings
     SECRET_KEY: str = Field(default="dev-secret-key", env="SECRET_KEY")
+    ADMIN_API_KEY: Optional[str] = Field(default=None, env="ADMIN_API_KEY")  # 미설정 시 관리자 API 비활성화
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,69 @@
+"""
+Dispatcher Application Factory
+"""
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from src.core.config import settings
+from src.core.middleware import RequestTracingMiddleware, AdmissionMiddleware
+from src.api.dispatcher_routes import dispatcher_router
+from src.services.dispatcher import cluster_dispatcher
+from src.utils.logger import get_logger
+from src.utils.exception_handlers import register_exception_handlers
+from src.utils.log_messages import get_log_message
+
+logger = get_logger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await cluster_dispatcher.start()
+    try:
+        yield
+    finally:
+        await cluster_dispatcher.stop()
+
+def create_dispatcher_app() -> FastAPI:
+    """
+    Create the dispatcher application (SERVER_ROLE=dispatcher)
+    
+    모델을 로드하지 않고 DISPATCHER_WORKERS의 워커 인스턴스로 요청을 전달합니다.
+    uvicorn으로 직접 실행할 때는 `uvicorn --factory src.core.dispatcher_app:create_dispatcher_app`을 사용합니다.
+    """
+    app = FastAPI(
+        title="STT Dispatcher",
+        description="""
+        STT 워커 인스턴스 앞에서 요청을 분배하는 디스패처입니다.
+        
+        * 워커의 처리 중 요청 수와 상주 모델을 폴링하여 부하가 가장 낮은 워커로 전달
+        * 세션·비동기 작업은 생성한 워커로 고정 전달
+        * 워커 API는 `/api/v1/...` 경로 그대로 사용하며, 디스패처 상태는 `GET /api/v1/cluster`로 조회
+        """,
+        version="1.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/openapi.json",
+        lifespan=lifespan
+    )
+    
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=settings.CORS_CREDENTIALS,
+        allow_methods=settings.CORS_METHODS,
+        allow_headers=settings.CORS_HEADERS,
+    )
+    
+    # Add admission middleware (종료 중 새 작업 거절 및 전달 중 요청 집계)
+    app.add_middleware(AdmissionMiddleware)
+    
+    # Add request tracing middleware (요청 ID는 워커로 전달되어 같은 ID로 추적)
+    app.add_middleware(RequestTracingMiddleware)
+    
+    app.include_router(dispatcher_router)
+    
+    # Register exception handlers
+    register_exception_handlers(app)
+    
+    logger.info(get_log_message("SYSTEM", "APP_CREATED"))
+    return app
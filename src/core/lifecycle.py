@@ -0,0 +1,142 @@
+"""
+Service Lifecycle
+"""
+import asyncio
+import os
+import threading
+import time
+from typing import Callable, List, Optional
+from src.core.config import settings
+from src.utils.logger import get_logger
+from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+from src.utils.upload_storage import upload_storage, OWNER_LOCK_FILE
+
+logger = get_logger(__name__)
+
+STATE_RUNNING = "running"
+STATE_DRAINING = "draining"
+STATE_STOPPED = "stopped"
+
+
+class ServiceLifecycle:
+    """
+    서비스 수명 주기 관리
+
+    종료 신호를 받으면 준비 상태를 해제하고 새 작업 요청을 거절한 뒤,
+    처리 중인 요청이 끝날 때까지(최대 SHUTDOWN_DRAIN_TIMEOUT) 기다립니다.
+    대기 중인 작업은 등록된 종료 훅에서 저장하거나 반환합니다.
+    """
+
+    def __init__(self):
+        self.state = STATE_RUNNING
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._shutdown_hooks: List[Callable[[], None]] = []
+
+    @property
+    def draining(self) -> bool:
+        return self.state in (STATE_DRAINING, STATE_STOPPED)
+
+    def try_admit(self) -> bool:
+        """Count a new work request unless the service is draining"""
+        with self._lock:
+            if self.draining:
+                metrics.increment("requests_rejected_draining_total")
+                return False
+            self.in_flight += 1
+            metrics.set_gauge("requests_in_flight", self.in_flight)
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            metrics.set_gauge("requests_in_flight", self.in_flight)
+
+    def on_shutdown(self, hook: Callable[[], None]) -> None:
+        """Register a hook that persists or hands back queued work after draining"""
+        self._shutdown_hooks.append(hook)
+
+    def begin_shutdown(self) -> None:
+        if not self.draining:
+            self.state = STATE_DRAINING
+            logger.info(get_log_message("SYSTEM", "SHUTDOWN_STARTED", in_flight=self.in_flight))
+
+    async def drain(self, timeout: float, should_abort: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Stop admitting work and wait for in-flight requests
+
+        Returns:
+            제한 시간 안에 모든 요청이 끝났는지 여부
+        """
+        self.begin_shutdown()
+        deadline = time.monotonic() + timeout
+        while self.in_flight > 0 and time.monotonic() < deadline:
+            if should_abort is not None and should_abort():
+                break
+            await asyncio.sleep(0.1)
+
+        drained = self.in_flight == 0
+        if drained:
+            logger.info(get_log_message("SYSTEM", "SHUTDOWN_DRAINED"))
+        else:
+            logger.warning(get_log_message("SYSTEM", "SHUTDOWN_DRAIN_TIMEOUT", in_flight=self.in_flight))
+
+        for hook in self._shutdown_hooks:
+            try:
+                hook()
+            except Exception as e:
+                logger.error(get_log_message("SYSTEM", "SHUTDOWN_HOOK_FAILED", error=str(e)))
+        self.state = STATE_STOPPED
+        return drained
+
+
+def sweep_upload_folder(folder: Optional[str] = None, min_age: Optional[float] = None) -> int:
+    """
+    Remove upload files left behind by exited processes
+
+    같은 머신의 다른 프로세스가 처리 중인 파일은 남겨 두도록 소유 프로세스가 종료된 폴더만 정리합니다.
+
+    Args:
+        folder: 정리할 폴더 (기본값: 업로드 저장소의 tmpfs 폴더와 UPLOAD_FOLDER에서 소유 프로세스가 없는 폴더)
+        min_age: 이 시간(초)보다 오래된 파일만 삭제
+    """
+    min_age = settings.UPLOAD_SWEEP_MIN_AGE if min_age is None else min_age
+    cutoff = time.time() - min_age
+    if folder:
+        targets = [folder]
+    else:
+        upload_storage.claim()
+        targets = upload_storage.orphaned()
+
+    removed = 0
+    for target in targets:
+        if not os.path.isdir(target):
+            continue
+        count = 0
+        for root, _, files in os.walk(target, topdown=False):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.path.getmtime(path) <= cutoff:
+                        os.remove(path)
+                        if name != OWNER_LOCK_FILE:
+                            count += 1
+                except OSError:
+                    continue
+            if root != folder:
+                try:
+                    os.rmdir(root)  # 비어 있을 때만 삭제됨
+                except OSError:
+                    pass
+        if count:
+            logger.info(get_log_message("SYSTEM", "UPLOADS_SWEPT", count=count, folder=target))
+        removed += count
+
+    if removed:
+        metrics.increment("uploads_swept_total", removed)
+    return removed
+
+
+# Global lifecycle instance
+lifecycle = ServiceLifecycle()
@@ -0,0 +1,106 @@
+"""
+ASGI Middleware
+"""
+import json
+import re
+from datetime import datetime
+from src.core.config import settings
+from src.core.lifecycle import lifecycle
+from src.utils.error_messages import get_error_message
+from src.utils.tracing import start_trace, end_trace
+
+REQUEST_ID_HEADER = b"x-request-id"
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._\-]{1,128}$")
+
+
+class RequestTracingMiddleware:
+    """
+    요청 ID 부여 및 trace 수집 미들웨어
+
+    클라이언트가 보낸 `X-Request-ID`를 그대로 사용하거나 새로 생성하고,
+    응답 헤더에도 같은 값을 돌려줍니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.TRACING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", []):
+            if name == REQUEST_ID_HEADER:
+                candidate = value.decode("latin-1")
+                if _REQUEST_ID_PATTERN.match(candidate):
+                    request_id = candidate
+                break
+
+        trace = start_trace(request_id, f"{scope['method']} {scope['path']}")
+        trace.set_attribute("http.method", scope["method"])
+        trace.set_attribute("http.target", scope["path"])
+        status_code = 500
+
+        async def send_with_request_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER, trace.request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            end_trace(trace, status_code)
+
+
+class AdmissionMiddleware:
+    """
+    작업 요청 수용 제어 미들웨어
+
+    조회가 아닌 요청(POST/PUT/PATCH/DELETE)을 작업으로 보고 응답 본문 전송이 끝날 때까지
+    처리 중으로 집계합니다. 종료 중에는 새 작업 요청을 503으로 거절하여
+    클라이언트나 로드밸런서가 다른 인스턴스로 재시도하도록 합니다.
+    """
+
+    READ_ONLY_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in self.READ_ONLY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        if not lifecycle.try_admit():
+            await self._reject(send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            lifecycle.release()
+
+    async def _reject(self, send):
+        body = json.dumps({
+            "error": get_error_message("SERVER", "SERVICE_SHUTTING_DOWN"),
+            "status_code": 503,
+            "type": "ServiceUnavailableException",
+            "details": {},
+            "timestamp": datetime.now().isoformat()
+        }, ensure_ascii=False).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(settings.SHUTDOWN_RETRY_AFTER).encode("latin-1")),
+                (b"connection", b"close")
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
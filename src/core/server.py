@@ -0,0 +1,22 @@
+"""
+Uvicorn Server
+"""
+from typing import List, Optional
+import socket
+import uvicorn
+from src.core.config import settings
+from src.core.lifecycle import lifecycle
+
+
+class GracefulServer(uvicorn.Server):
+    """
+    종료 전에 처리 중인 요청을 기다리는 Uvicorn 서버
+
+    기본 Uvicorn은 종료 신호를 받으면 즉시 리스닝 소켓을 닫습니다.
+    여기서는 소켓을 닫기 전에 준비 상태를 해제하고 새 작업을 503으로 거절하면서
+    처리 중인 변환이 끝나기를 기다립니다. 두 번째 종료 신호를 받으면 대기를 중단합니다.
+    """
+
+    async def shutdown(self, sockets: Optional[List[socket.socket]] = None) -> None:
+        await lifecycle.drain(settings.SHUTDOWN_DRAIN_TIMEOUT, should_abort=lambda: self.force_exit)
+        await super().shutdown(sockets)
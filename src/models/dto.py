@@ -2,9 +2,14 @@
 DTO 모듈 통합 import
 """
 from .responses import (
-    TranscriptionResponse, HealthResponse, ServiceInfoResponse, ErrorResponse
+    TranscriptionResponse, HealthResponse, ServiceInfoResponse, ErrorResponse,
+    ModelStatusResponse, MetricsResponse, VocabularyResponse, ReadinessResponse,
+    SessionResponse, JobResponse, WorkerLoadResponse, ClusterStatusResponse
 )
+from .requests import ModelSwapRequest, VocabularyRequest, SessionRequest
 
 __all__ = [
-    "TranscriptionResponse", "HealthResponse", "ServiceInfoResponse", "ErrorResponse"
+    "TranscriptionResponse", "HealthResponse", "ServiceInfoResponse", "ErrorResponse",
+    "ModelStatusResponse", "MetricsResponse", "VocabularyResponse", "ReadinessResponse",
+    "SessionResponse", "JobResponse", "WorkerLoadResponse", "ClusterStatusResponse", "ModelSwapRequest", "VocabularyRequest", "SessionRequest"
 ] 
\ No newline at end of file
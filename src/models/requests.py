@@ -1,11 +1,25 @@
 """
 Request DTOs
 """
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 class TranscribeRequest(BaseModel):
     filename: str = Field(...)
     file_size: Optional[int] = Field(None)
     content_type: Optional[str] = Field(None)
-    language: Optional[str] = Field(None, description="언어 코드 (예: ko, en, ja, zh 등)") 
\ No newline at end of file
+    language: Optional[str] = Field(None, description="언어 코드 (예: ko, en, ja, zh 등)") 
+
+class ModelSwapRequest(BaseModel):
+    model: str = Field(..., description="교체할 Whisper 모델 (예: small, medium, large-v3)")
+    device: Optional[str] = Field(None, description="디바이스 (미지정 시 현재 설정 유지)")
+    compute_type: Optional[str] = Field(None, description="연산 타입 (미지정 시 현재 설정 유지)")
+
+class VocabularyRequest(BaseModel):
+    name: str = Field(..., min_length=1, max_length=64, pattern=r"^[A-Za-z0-9_.-]+$", description="어휘 목록 이름")
+    terms: List[str] = Field(..., description="인식 정확도를 높일 용어 목록 (제품명, 고유명사 등). 앞쪽 용어가 우선 적용됨")
+    tenant_id: Optional[str] = Field(None, description="지정 시 해당 테넌트의 기본 어휘 목록으로 사용")
+
+class SessionRequest(BaseModel):
+    language: Optional[str] = Field(None, description="대화 언어 (미지정 시 첫 턴에서 감지한 언어를 이후 턴에 사용)")
+    vocabulary: Optional[str] = Field(None, description="세션의 모든 턴에 적용할 등록 어휘 목록 이름")
@@ -11,6 +11,14 @@ class TranscriptionSegment(BaseModel):
     end: float = Field(..., description="종료 시간 (초)")
     text: str = Field(..., description="변환된 텍스트")
     confidence: Optional[float] = Field(None, description="신뢰도 (0.0 ~ 1.0)")
+    channel: Optional[int] = Field(None, description="채널 번호 (channels=split 요청에서만 포함)")
+
+class TranslationResult(BaseModel):
+    """번역 결과 (task=both 요청)"""
+    text: str = Field(..., description="영어 번역 텍스트")
+    language: str = Field("en", description="번역 언어 코드")
+    segments_count: int = Field(..., description="세그먼트 개수")
+    segments: Optional[List[TranscriptionSegment]] = Field(None, description="세그먼트 상세 정보")
 
 class TranscriptionResponse(BaseModel):
     """음성 변환 응답"""
@@ -21,6 +29,62 @@ class TranscriptionResponse(BaseModel):
     segments: Optional[List[TranscriptionSegment]] = Field(None, description="세그먼트 상세 정보")
     processing_time: Optional[float] = Field(None, description="처리 시간 (초)")
     file_info: Optional[Dict[str, Any]] = Field(None, description="업로드된 파일 정보")
+    task: str = Field("transcribe", description="수행한 작업 (transcribe/translate/both)")
+    translation: Optional[TranslationResult] = Field(None, description="영어 번역 결과 (task=both인 경우)")
+    vocabulary: Optional[str] = Field(None, description="적용된 어휘 목록 이름")
+    channels: Optional[List[Dict[str, Any]]] = Field(None, description="채널별 변환 정보 (channels=split 요청에서만 포함)")
+
+class JobCallbackStatus(BaseModel):
+    """웹훅 전송 상태"""
+    url: str = Field(..., description="결과를 전송할 callback_url")
+    status: str = Field(..., description="전송 상태 (pending/delivered/failed)")
+    attempts: int = Field(..., description="전송 시도 횟수")
+    last_status_code: Optional[int] = Field(None, description="마지막 시도의 응답 상태 코드")
+    last_error: Optional[str] = Field(None, description="마지막 실패 사유")
+
+class JobResponse(BaseModel):
+    """비동기 변환 작업 응답 (callback_url 요청의 202 응답, 작업 조회, 웹훅 본문)"""
+    job_id: str = Field(..., description="작업 ID (GET /api/v1/jobs/{job_id}로 조회)")
+    status: str = Field(..., description="작업 상태 (queued/running/completed/failed)")
+    created_at: datetime = Field(..., description="접수 시간")
+    started_at: Optional[datetime] = Field(None, description="변환 시작 시간")
+    finished_at: Optional[datetime] = Field(None, description="완료 시간")
+    result: Optional[TranscriptionResponse] = Field(None, description="변환 결과 (completed인 경우)")
+    error: Optional[str] = Field(None, description="실패 사유 (failed인 경우)")
+    status_code: Optional[int] = Field(None, description="실패 시 동기 요청이었다면 받았을 상태 코드")
+    callback: Optional[JobCallbackStatus] = Field(None, description="웹훅 전송 상태")
+    expires_in: Optional[float] = Field(None, description="결과 보관 만료까지 남은 시간 (초, 완료 후 표시)")
+
+class WorkerLoadResponse(BaseModel):
+    """워커 부하 보고 (디스패처 폴링용 내부 API)"""
+    node_id: str = Field(..., description="워커 이름")
+    state: str = Field(..., description="서비스 상태 (running/draining/stopped)")
+    ready: bool = Field(..., description="새 요청을 받을 수 있는지 여부")
+    in_flight: int = Field(..., description="처리 중인 작업 요청 수 (백그라운드 작업 포함)")
+    inference_in_flight: int = Field(..., description="현재 모델에서 추론 중인 요청 수")
+    capacity: int = Field(..., description="동시 추론 수")
+    jobs_active: int = Field(..., description="대기·실행 중인 비동기 작업 수")
+    models: List[str] = Field(..., description="요청을 처리 중인(상주) 모델")
+    generation: int = Field(..., description="모델 교체 세대 번호")
+    swap_state: str = Field(..., description="모델 교체 진행 상태")
+    audio_buffers: Optional[Dict[str, Any]] = Field(None, description="디코딩 오디오 메모리 예산 사용량")
+
+class ClusterNodeStatus(BaseModel):
+    """디스패처가 본 워커 상태"""
+    node: str = Field(..., description="워커 주소 (X-STT-Node 헤더로 지정 가능)")
+    url: str = Field(..., description="워커 URL")
+    healthy: bool = Field(..., description="마지막 폴링 성공 여부")
+    ready: bool = Field(..., description="요청 분배 대상 여부")
+    score: float = Field(..., description="부하 점수 ((처리 중 + 폴링 이후 전달) / 동시 추론 수, 낮을수록 우선)")
+    dispatched: int = Field(..., description="이 디스패처가 전달한 누적 요청 수")
+    last_error: Optional[str] = Field(None, description="마지막 폴링·전달 오류")
+    load: Optional[WorkerLoadResponse] = Field(None, description="마지막 부하 보고")
+
+class ClusterStatusResponse(BaseModel):
+    """디스패처 클러스터 상태 응답"""
+    nodes: List[ClusterNodeStatus] = Field(..., description="워커 목록")
+    ready_nodes: int = Field(..., description="요청 분배 가능한 워커 수")
+    affinities: int = Field(..., description="세션·작업 ID → 워커 매핑 수")
 
 class HealthResponse(BaseModel):
     """서버 상태 응답"""
@@ -30,6 +94,12 @@ class HealthResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now, description="응답 시간")
     uptime: Optional[float] = Field(None, description="서버 가동 시간 (초)")
 
+class ReadinessResponse(BaseModel):
+    """준비 상태 응답 모델"""
+    ready: bool = Field(..., description="새 요청을 받을 수 있는지 여부")
+    state: str = Field(..., description="서비스 상태 (running/draining/stopped)")
+    in_flight: int = Field(..., description="처리 중인 작업 요청 수")
+
 class ServiceInfoResponse(BaseModel):
     """서비스 정보 응답"""
     service: str = Field(..., description="서비스 이름")
@@ -39,6 +109,7 @@ class ServiceInfoResponse(BaseModel):
     supported_formats: List[str] = Field(..., description="지원하는 파일 형식 목록")
     max_file_size_mb: int = Field(..., description="최대 파일 크기 (MB)")
     features: Optional[List[str]] = Field(None, description="지원하는 기능 목록")
+    audio_buffers: Optional[Dict[str, Any]] = Field(None, description="디코딩 오디오 메모리 예산 및 현재/최대 사용량 (바이트)")
 
 class ErrorResponse(BaseModel):
     """에러 응답"""
@@ -46,4 +117,35 @@ class ErrorResponse(BaseModel):
     status_code: int = Field(..., description="HTTP 상태 코드")
     type: str = Field(..., description="에러 타입")
     details: Optional[Dict[str, Any]] = Field(None, description="상세 에러 정보")
-    timestamp: datetime = Field(default_factory=datetime.now, description="에러 발생 시간") 
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=datetime.now, description="에러 발생 시간") 
+
+class ModelStatusResponse(BaseModel):
+    """모델 상태 응답"""
+    active: Optional[Dict[str, Any]] = Field(None, description="현재 요청을 처리 중인 모델 설정 (스레드 분할 포함)")
+    generation: int = Field(..., description="모델 교체 세대 번호")
+    in_flight: int = Field(..., description="현재 모델에서 처리 중인 요청 수")
+    swap: Dict[str, Any] = Field(..., description="모델 교체 진행 상태 (idle/loading/warming/completed/failed)")
+    retiring: List[Dict[str, Any]] = Field(default_factory=list, description="처리 중인 요청이 끝나기를 기다리는 이전 모델")
+    cpu: Optional[Dict[str, Any]] = Field(None, description="감지된 CPU 한도 (코어 수)")
+
+class MetricsResponse(BaseModel):
+    """서비스 메트릭 응답"""
+    counters: Dict[str, float] = Field(..., description="누적 카운터")
+    gauges: Dict[str, float] = Field(..., description="현재 게이지 값")
+
+class VocabularyResponse(BaseModel):
+    """어휘 목록 응답"""
+    name: str = Field(..., description="어휘 목록 이름")
+    terms: List[str] = Field(..., description="용어 목록")
+    version: int = Field(..., description="등록 버전 (같은 이름으로 다시 등록할 때마다 증가)")
+    tenant_id: Optional[str] = Field(None, description="기본 어휘 목록으로 지정된 테넌트")
+
+class SessionResponse(BaseModel):
+    """대화 세션 응답"""
+    session_id: str = Field(..., description="세션 ID (변환 요청의 session_id 파라미터 또는 X-Session-ID 헤더로 전달)")
+    language: Optional[str] = Field(None, description="세션 언어 (다음 턴부터 언어 감지 생략)")
+    vocabulary: Optional[str] = Field(None, description="세션 어휘 목록 이름")
+    model: Optional[str] = Field(None, description="직전 턴을 처리한 모델")
+    turns: int = Field(..., description="처리한 턴 수")
+    previous_text: Optional[str] = Field(None, description="직전 턴 변환 텍스트 (다음 턴 프롬프트로 사용)")
+    expires_in: float = Field(..., description="만료까지 남은 시간 (초, 턴마다 갱신)")
@@ -0,0 +1,117 @@
+"""
+Segment Buffer
+"""
+import math
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+def segment_confidence(segment: Any) -> Optional[float]:
+    """Segment confidence from a faster-whisper segment's average log-probability"""
+    avg_logprob = getattr(segment, "avg_logprob", None)
+    return math.exp(avg_logprob) if avg_logprob is not None else None
+
+
+class SegmentBuffer:
+    """
+    세그먼트 내부 표현
+
+    세그먼트마다 객체를 만들지 않고 열(column) 단위 배열에 보관하여
+    직렬화 직전까지 메모리와 변환 비용을 줄입니다.
+    """
+
+    __slots__ = ("starts", "ends", "confidences", "texts", "channels")
+
+    def __init__(self, with_channels: bool = False):
+        self.starts = array("d")
+        self.ends = array("d")
+        self.confidences = array("d")  # 신뢰도 없음은 NaN
+        self.texts: List[str] = []
+        self.channels = array("h") if with_channels else None  # 채널 분리 변환에서만 사용
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Any]) -> "SegmentBuffer":
+        """Build from faster-whisper segments"""
+        buffer = cls()
+        for segment in segments:
+            buffer.append(segment.start, segment.end, segment.text, segment_confidence(segment))
+        return buffer
+
+    @classmethod
+    def from_channels(cls, channel_segments: Sequence[Tuple[int, List[Any]]]) -> "SegmentBuffer":
+        """Merge per-channel segments into one time-ordered buffer tagged with channel indexes"""
+        tagged = [(segment.start, channel, segment) for channel, segments in channel_segments for segment in segments]
+        tagged.sort(key=lambda item: (item[0], item[1]))
+
+        buffer = cls(with_channels=True)
+        for _, channel, segment in tagged:
+            buffer.append(segment.start, segment.end, segment.text, segment_confidence(segment), channel)
+        return buffer
+
+    def append(self, start: float, end: float, text: str, confidence: Optional[float] = None,
+               channel: Optional[int] = None) -> None:
+        self.starts.append(start)
+        self.ends.append(end)
+        self.confidences.append(math.nan if confidence is None else confidence)
+        self.texts.append(text)
+        if self.channels is not None:
+            self.channels.append(-1 if channel is None else channel)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[Tuple[float, float, str, Optional[float]]]:
+        for start, end, text, confidence in zip(self.starts, self.ends, self.texts, self.confidences):
+            yield start, end, text, None if math.isnan(confidence) else confidence
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.texts)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Row-oriented form matching TranscriptionSegment"""
+        rows = [
+            {"start": start, "end": end, "text": text, "confidence": confidence}
+            for start, end, text, confidence in self
+        ]
+        if self.channels is not None:
+            for row, channel in zip(rows, self.channels):
+                row["channel"] = channel
+        return rows
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Column-oriented form for compact binary encodings"""
+        columns = {
+            "start": self.starts.tolist(),
+            "end": self.ends.tolist(),
+            "text": list(self.texts),
+            "confidence": [None if math.isnan(c) else c for c in self.confidences]
+        }
+        if self.channels is not None:
+            columns["channel"] = self.channels.tolist()
+        return columns
+
+
+class SegmentStream:
+    """
+    스트리밍 응답용 세그먼트 이터레이터와 감지된 언어
+
+    긴 오디오는 첫 창을 디코딩할 때 언어가 정해지므로, 언어는 첫 세그먼트를 받은 뒤부터 유효합니다.
+    """
+
+    def __init__(self, segments: Optional[Iterator[Any]] = None, language: Optional[str] = None,
+                 language_probability: float = 0.0):
+        self.segments = segments
+        self.language = language
+        self.language_probability = language_probability
+
+    def set_info(self, info: Any) -> None:
+        """Record language detection from a faster-whisper TranscriptionInfo"""
+        self.language = info.language
+        self.language_probability = info.language_probability
+
+    def __iter__(self) -> "SegmentStream":
+        return self
+
+    def __next__(self) -> Any:
+        return next(self.segments)
@@ -0,0 +1,48 @@
+"""
+Assisted Decoding
+
+작은 초안(draft) 모델이 먼저 전체 오디오를 디코딩하고, 신뢰도가 낮은 구간만
+큰 모델이 다시 디코딩하는 방식입니다. CTranslate2 Whisper는 토큰 단위 검증 훅을
+제공하지 않으므로 세그먼트 단위로 초안을 채택/검증합니다.
+"""
+from typing import Any, List, Sequence, Tuple
+from src.core.config import settings
+
+
+def is_confident(segment: Any) -> bool:
+    """Check whether a draft segment can be accepted without verification"""
+    if segment.avg_logprob < settings.DRAFT_ACCEPT_LOGPROB:
+        return False
+    if segment.compression_ratio > settings.DRAFT_MAX_COMPRESSION_RATIO:
+        return False
+    if segment.no_speech_prob > settings.DRAFT_MAX_NO_SPEECH_PROB:
+        return False
+    return True
+
+
+def plan_verification(segments: Sequence[Any]) -> Tuple[List[Any], List[float]]:
+    """
+    Split draft segments into accepted ones and clips to re-decode
+
+    연속된 저신뢰 세그먼트는 하나의 구간으로 합쳐 큰 모델 호출 횟수를 줄입니다.
+
+    Returns:
+        (채택된 초안 세그먼트, clip_timestamps 형식의 [start, end, start, end, ...])
+    """
+    accepted: List[Any] = []
+    clips: List[float] = []
+
+    for segment in segments:
+        if is_confident(segment):
+            accepted.append(segment)
+        elif clips and abs(clips[-1] - segment.start) < 1e-3:
+            clips[-1] = segment.end
+        else:
+            clips.extend([segment.start, segment.end])
+
+    return accepted, clips
+
+
+def merge_segments(accepted: Sequence[Any], verified: Sequence[Any]) -> List[Any]:
+    """Merge accepted draft segments and verified segments in time order"""
+    return sorted([*accepted, *verified], key=lambda segment: segment.start)
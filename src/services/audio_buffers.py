@@ -0,0 +1,179 @@
+"""
+Decoded Audio Buffer Accounting
+"""
+import gc
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+from src.core.config import settings
+from src.utils.exceptions import AudioBufferException
+from src.utils.error_messages import get_error_message
+from src.utils.metrics import metrics
+from src.utils.tracing import set_trace_attribute
+
+SAMPLE_RATE = 16000
+PCM_BYTES_PER_SAMPLE = 4  # float32
+# faster-whisper decode_audio는 s16 버퍼(2바이트)를 모은 뒤 float32(4바이트)로 변환하므로 디코딩 중 최대 6바이트/샘플
+DECODE_BYTES_PER_SAMPLE = 6
+
+
+class AudioBufferBudget:
+    """
+    요청들이 디코딩한 PCM 버퍼의 전역 메모리 예산
+
+    요청은 디코딩 전에 예상 크기만큼 예약하고, 예산이 부족하면 다른 요청이 버퍼를 반환할 때까지
+    최대 AUDIO_BUDGET_WAIT초 기다린 뒤 503으로 거절됩니다. 현재/최대 사용량은 메트릭으로 노출됩니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.peak_bytes = 0
+        self.active = 0
+        self._condition = threading.Condition()
+
+    def _update_gauges(self) -> None:
+        self.peak_bytes = max(self.peak_bytes, self.current_bytes)
+        metrics.set_gauge("audio_buffer_bytes", self.current_bytes)
+        metrics.set_gauge("audio_buffer_peak_bytes", self.peak_bytes)
+        metrics.set_gauge("audio_buffer_requests", self.active)
+
+    def _acquire(self, nbytes: int, timeout: float) -> None:
+        with self._condition:
+            if self.current_bytes + nbytes > self.max_bytes:
+                metrics.increment("audio_budget_waits_total")
+                # 예산보다 큰 단일 예약은 다른 요청이 없을 때만 허용 (호출 측에서 창 단위 처리로 크기를 제한)
+                if not self._condition.wait_for(
+                    lambda: self.current_bytes + nbytes <= self.max_bytes or self.current_bytes == 0, timeout=timeout
+                ):
+                    metrics.increment("audio_budget_rejections_total")
+                    raise AudioBufferException(get_error_message("SERVER", "AUDIO_MEMORY_EXHAUSTED"))
+            self.current_bytes += nbytes
+            self.active += 1
+            self._update_gauges()
+
+    def _resize(self, old: int, new: int) -> None:
+        with self._condition:
+            self.current_bytes += new - old
+            self._update_gauges()
+            if new < old:
+                self._condition.notify_all()
+
+    def _release(self, nbytes: int) -> None:
+        with self._condition:
+            self.current_bytes -= nbytes
+            self.active -= 1
+            self._update_gauges()
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, nbytes: int, timeout: Optional[float] = None) -> Iterator["BufferReservation"]:
+        """Hold nbytes of the budget for the duration of the block"""
+        reservation = BufferReservation(self, nbytes)
+        self._acquire(nbytes, settings.AUDIO_BUDGET_WAIT if timeout is None else timeout)
+        set_trace_attribute("audio.buffer_bytes", nbytes)
+        try:
+            yield reservation
+        finally:
+            self._release(reservation.nbytes)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "budget_bytes": self.max_bytes,
+            "current_bytes": self.current_bytes,
+            "peak_bytes": self.peak_bytes,
+            "active_requests": self.active
+        }
+
+
+class BufferReservation:
+    """요청 하나가 예약한 버퍼 크기 (디코딩 후 실제 크기로 조정)"""
+
+    def __init__(self, budget: AudioBufferBudget, nbytes: int):
+        self.budget = budget
+        self.nbytes = nbytes
+
+    def resize(self, nbytes: int) -> None:
+        self.budget._resize(self.nbytes, nbytes)
+        self.nbytes = nbytes
+        set_trace_attribute("audio.buffer_bytes", nbytes)
+
+
+def probe_duration(audio_path: str) -> Optional[float]:
+    """Container duration in seconds without decoding, None if unknown"""
+    import av
+
+    try:
+        with av.open(audio_path, mode="r", metadata_errors="ignore") as container:
+            if container.duration:
+                return container.duration / av.time_base
+            stream = container.streams.audio[0]
+            if stream.duration and stream.time_base:
+                return float(stream.duration * stream.time_base)
+    except (av.error.FFmpegError, IndexError):
+        pass
+    return None
+
+
+def estimate_samples(audio_path: str) -> Optional[int]:
+    duration = probe_duration(audio_path)
+    return int(duration * SAMPLE_RATE) + SAMPLE_RATE if duration is not None else None
+
+
+def iter_pcm_windows(audio_path: str, window_samples: int) -> Iterator[Tuple[float, Any]]:
+    """
+    Decode audio into consecutive 16kHz mono float32 windows
+
+    전체 오디오를 메모리에 올리지 않고 창 하나 크기의 버퍼만 사용합니다.
+
+    Yields:
+        (창 시작 시간(초), PCM 배열)
+    """
+    import av
+    import numpy as np
+
+    resampler = av.audio.resampler.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+    window = np.empty(window_samples, dtype=np.float32)
+    filled = 0
+    offset = 0
+
+    def frames(container):
+        iterator = container.decode(audio=0)
+        while True:
+            try:
+                frame = next(iterator)
+            except StopIteration:
+                return
+            except av.error.InvalidDataError:
+                continue
+            frame.pts = None  # 타임스탬프 불연속 검사 생략 (faster-whisper와 동일)
+            yield frame
+
+    try:
+        with av.open(audio_path, mode="r", metadata_errors="ignore") as container:
+            # None을 넣어 리샘플러에 남은 샘플을 비움
+            for frame in itertools.chain(frames(container), [None]):
+                for resampled in resampler.resample(frame):
+                    pcm = resampled.to_ndarray().reshape(-1)
+                    position = 0
+                    while position < len(pcm):
+                        take = min(window_samples - filled, len(pcm) - position)
+                        window[filled:filled + take] = pcm[position:position + take] / 32768.0
+                        filled += take
+                        position += take
+                        if filled == window_samples:
+                            yield offset / SAMPLE_RATE, window
+                            offset += filled
+                            window = np.empty(window_samples, dtype=np.float32)
+                            filled = 0
+        if filled:
+            yield offset / SAMPLE_RATE, window[:filled]
+    finally:
+        # 리샘플러 관련 객체가 GC 전까지 해제되지 않는 문제 회피 (faster-whisper #390)
+        del resampler
+        gc.collect()
+
+
+# Global decoded-audio budget
+audio_budget = AudioBufferBudget(settings.AUDIO_MEMORY_BUDGET_MB * 1024 * 1024)
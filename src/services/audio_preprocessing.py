@@ -0,0 +1,323 @@
+"""
+Audio Preprocessing
+
+업로드 오디오를 모델 입력(16kHz 모노 float32 PCM)으로 변환합니다.
+
+- 이미 16kHz 모노인 WAV: 헤더만 읽고 데이터 구간을 메모리 매핑 (float32는 복사 없음, 정수 PCM은 변환 한 번)
+- 그 밖의 PCM WAV: NumPy 벡터 연산으로 채널 다운믹스와 폴리페이즈 리샘플링
+- 압축 포맷(MP3, M4A, FLAC, OGG 등)이나 지원하지 않는 WAV: faster-whisper(FFmpeg) 디코딩
+
+numpy는 모델 로드 전 import를 피하기 위해 함수 안에서 import합니다.
+"""
+import math
+import os
+import struct
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from src.core.config import settings
+from src.services.audio_buffers import SAMPLE_RATE, iter_pcm_windows
+from src.utils.metrics import metrics
+from src.utils.tracing import span, set_trace_attribute
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# (포맷, 샘플 비트) -> (NumPy dtype, 정규화 배율, 오프셋)
+PCM_DTYPES = {
+    (WAVE_FORMAT_PCM, 8): ("u1", 1 / 128, 128),
+    (WAVE_FORMAT_PCM, 16): ("<i2", 1 / 32768, 0),
+    (WAVE_FORMAT_PCM, 32): ("<i4", 1 / 2147483648, 0),
+    (WAVE_FORMAT_IEEE_FLOAT, 32): ("<f4", 1.0, 0),
+    (WAVE_FORMAT_IEEE_FLOAT, 64): ("<f8", 1.0, 0),
+}
+
+RESAMPLE_HALF_WIDTH = 16  # 리샘플링 커널의 한쪽 영교차 수 (품질/속도 균형)
+RESAMPLE_KAISER_BETA = 8.6
+RESAMPLE_BLOCK = 65536  # 블록당 출력 샘플 수 (약 4초)
+MAX_RESAMPLE_PHASES = 4096  # 샘플레이트 비율이 이보다 복잡하면 FFmpeg 경로 사용
+
+
+class WavInfo:
+    """RIFF/WAVE 헤더에서 읽은 PCM 데이터 위치와 형식"""
+
+    __slots__ = ("sample_rate", "channels", "dtype", "scale", "bias", "data_offset", "frames")
+
+    def __init__(self, sample_rate: int, channels: int, dtype: str, scale: float, bias: int,
+                 data_offset: int, frames: int):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.dtype = dtype
+        self.scale = scale
+        self.bias = bias
+        self.data_offset = data_offset
+        self.frames = frames
+
+    @property
+    def is_native(self) -> bool:
+        """Already 16kHz mono: no downmix or resampling needed"""
+        return self.sample_rate == SAMPLE_RATE and self.channels == 1
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate
+
+
+def read_wav_info(audio_path: str) -> Optional[WavInfo]:
+    """
+    Parse a WAV header without decoding
+
+    Returns:
+        빠른 경로로 처리할 수 있는 PCM WAV이면 WavInfo, 아니면 None
+    """
+    try:
+        file_size = os.path.getsize(audio_path)
+        with open(audio_path, "rb") as f:
+            header = f.read(12)
+            if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+                return None
+            fmt = None
+            while True:
+                chunk = f.read(8)
+                if len(chunk) < 8:
+                    return None
+                chunk_id, chunk_size = chunk[:4], struct.unpack("<I", chunk[4:])[0]
+                if chunk_id == b"fmt ":
+                    fmt = f.read(chunk_size)
+                    if chunk_size % 2:
+                        f.seek(1, os.SEEK_CUR)
+                elif chunk_id == b"data":
+                    data_offset = f.tell()
+                    break
+                else:
+                    f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+    except OSError:
+        return None
+
+    if fmt is None or len(fmt) < 16:
+        return None
+    audio_format, channels, sample_rate, _, block_align, bits = struct.unpack("<HHIIHH", fmt[:16])
+    if audio_format == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        audio_format = struct.unpack("<H", fmt[24:26])[0]  # SubFormat GUID의 앞 2바이트
+    dtype = PCM_DTYPES.get((audio_format, bits))
+    if dtype is None or channels < 1 or sample_rate < 1 or block_align != channels * bits // 8:
+        return None
+    # 스트리밍으로 기록된 WAV는 data 크기가 0 또는 0xFFFFFFFF일 수 있으므로 파일 크기로 제한
+    available = file_size - data_offset
+    data_size = chunk_size if 0 < chunk_size <= available else available
+    frames = data_size // block_align
+    return WavInfo(sample_rate, channels, dtype[0], dtype[1], dtype[2], data_offset, frames)
+
+
+def _map_frames(audio_path: str, info: WavInfo) -> Any:
+    """Memory-map the data chunk as a (frames, channels) array"""
+    import numpy as np
+
+    if info.frames == 0:
+        return np.zeros((0, info.channels), dtype=info.dtype)
+    return np.memmap(audio_path, dtype=info.dtype, mode="r", offset=info.data_offset,
+                     shape=(info.frames, info.channels))
+
+
+def _to_float32(samples: Any, info: WavInfo) -> Any:
+    """Integer or float64 PCM to float32 in [-1, 1] (float32 input is returned as-is)"""
+    import numpy as np
+
+    samples = np.asarray(samples)
+    if samples.dtype == np.float32:
+        return samples
+    audio = samples.astype(np.float32)
+    if info.bias:
+        audio -= info.bias
+    if info.scale != 1.0:
+        audio *= np.float32(info.scale)
+    return audio
+
+
+def downmix(frames: Any, info: WavInfo) -> Any:
+    """Average channels into one float32 signal"""
+    import numpy as np
+
+    audio = _to_float32(frames[:, 0], info)
+    if info.channels == 1:
+        return audio
+    if not audio.flags.writeable:
+        audio = audio.copy()  # float32 메모리 매핑은 읽기 전용
+    for channel in range(1, info.channels):
+        audio += _to_float32(frames[:, channel], info)
+    audio *= np.float32(1 / info.channels)
+    return audio
+
+
+@lru_cache(maxsize=16)
+def _resample_kernel(orig_sr: int, target_sr: int) -> Tuple[int, int, Any]:
+    """(up, down, per-phase Kaiser-windowed sinc coefficients of shape (up, taps))"""
+    import numpy as np
+
+    gcd = math.gcd(orig_sr, target_sr)
+    up, down = target_sr // gcd, orig_sr // gcd
+    # 다운샘플링 시 차단 주파수를 목표 나이퀴스트로 낮추고 그만큼 커널을 넓혀 에일리어싱 방지
+    scale = min(1.0, target_sr / orig_sr)
+    taps = 2 * math.ceil(RESAMPLE_HALF_WIDTH / scale)
+    half = taps // 2
+    # 위상 p의 출력은 입력 위치 floor(t) + p/up에 있으며, x[floor(t) - half + 1 .. floor(t) + half]를 사용
+    offsets = np.arange(up, dtype=np.float64)[:, None] / up + (half - 1) - np.arange(taps)[None, :]
+    window = np.i0(RESAMPLE_KAISER_BETA * np.sqrt(np.clip(1 - (offsets / half) ** 2, 0, None))) / np.i0(RESAMPLE_KAISER_BETA)
+    kernel = np.sinc(offsets * scale) * window
+    return up, down, (kernel / kernel.sum(axis=1, keepdims=True)).astype(np.float32)  # 위상별 DC 이득 1
+
+
+def _resample_blocks(read: Callable[[int, int], Any], length: int, orig_sr: int, target_sr: int = SAMPLE_RATE) -> Any:
+    """
+    Band-limited polyphase resampling, RESAMPLE_BLOCK output samples at a time
+
+    비율을 기약분수 up/down으로 만든 뒤, 출력 샘플을 위상(up개)별로 묶어 위상마다 행렬-벡터 곱 한 번으로 계산합니다.
+    입력은 read(start, stop)으로 블록 단위로만 읽으므로 원본 전체를 float32로 변환해 두지 않습니다.
+    """
+    import numpy as np
+
+    if orig_sr == target_sr:
+        return read(0, length)
+    up, down, kernel = _resample_kernel(orig_sr, target_sr)
+    taps = kernel.shape[1]
+    half = taps // 2
+    n_out = math.ceil(length * up / down)
+    output = np.empty(n_out, dtype=np.float32)
+    block = up * max(1, RESAMPLE_BLOCK // up)  # 블록 시작이 up의 배수이면 위상 배치가 블록마다 같음
+    for block_start in range(0, n_out, block):
+        block_end = min(block_start + block, n_out)
+        low = block_start * down // up - half + 1
+        high = (block_end - 1) * down // up + half + 1
+        chunk = np.asarray(read(max(low, 0), min(high, length)), dtype=np.float32)
+        lead = max(0, -low)
+        padded = np.zeros(high - low, dtype=np.float32)
+        padded[lead:lead + len(chunk)] = chunk
+        windows = np.lib.stride_tricks.sliding_window_view(padded, taps)
+        for first in range(min(up, block_end - block_start)):
+            start = first * down // up
+            count = len(range(first, block_end - block_start, up))
+            # 행 간격(down)이 커널보다 짧은 겹친 뷰는 BLAS를 쓸 수 없어 einsum이 matmul보다 빠름
+            output[block_start + first:block_end:up] = np.einsum(
+                "ij,j->i", windows[start:start + count * down:down], kernel[first * down % up]
+            )
+    return output
+
+
+def resample(audio: Any, orig_sr: int, target_sr: int = SAMPLE_RATE) -> Any:
+    """Resample a float32 mono signal to target_sr"""
+    return _resample_blocks(lambda start, stop: audio[start:stop], len(audio), orig_sr, target_sr)
+
+
+def normalize_loudness(audio: Any, target_dbfs: float) -> Any:
+    """
+    Scale audio so its RMS level is target_dbfs
+
+    무음에 가까운 신호(CHANNEL_SILENCE_RMS 미만)는 잡음만 키우므로 그대로 두고,
+    이득은 AUDIO_MAX_GAIN_DB와 피크 클리핑 한도 안으로 제한합니다.
+    """
+    import numpy as np
+
+    if len(audio) == 0:
+        return audio
+    rms = float(np.sqrt(np.mean(np.square(audio, dtype=np.float64))))
+    if rms < settings.CHANNEL_SILENCE_RMS:
+        return audio
+    gain = min(10 ** ((target_dbfs - 20 * math.log10(rms)) / 20), 10 ** (settings.AUDIO_MAX_GAIN_DB / 20))
+    peak = float(np.max(np.abs(audio)))
+    if peak > 0:
+        gain = min(gain, 0.99 / peak)
+    if abs(gain - 1.0) < 1e-3:
+        return audio
+    return (audio * np.float32(gain)).astype(np.float32, copy=False)
+
+
+def _fast_path_info(audio_path: str) -> Optional[WavInfo]:
+    if not settings.AUDIO_FAST_PATH:
+        return None
+    info = read_wav_info(audio_path)
+    if info is None or info.channels > 2:
+        # 3채널 이상은 FFmpeg 다운믹스 행렬(LFE 제외 등)과 결과를 맞추기 위해 기존 경로 사용
+        return None
+    gcd = math.gcd(info.sample_rate, SAMPLE_RATE)
+    if SAMPLE_RATE // gcd > MAX_RESAMPLE_PHASES:
+        return None
+    return info
+
+
+def _load_wav(audio_path: str, info: WavInfo, split_stereo: bool) -> Any:
+    import numpy as np
+
+    frames = _map_frames(audio_path, info)
+    if split_stereo:
+        channels = [
+            _resample_blocks(lambda start, stop: _to_float32(frames[start:stop, index], info), info.frames, info.sample_rate)
+            for index in range(info.channels)
+        ]
+        if info.channels == 1:
+            # FFmpeg와 동일하게 모노는 -3dB로 양쪽 채널에 복제
+            mono = channels[0] * np.float32(math.sqrt(0.5))
+            return mono, mono
+        return tuple(channels)
+    return _resample_blocks(lambda start, stop: downmix(frames[start:stop], info), info.frames, info.sample_rate)
+
+
+def load_audio(audio_path: str, split_stereo: bool = False) -> Any:
+    """
+    Load audio as 16kHz float32 PCM (mono, or a (left, right) pair when split_stereo)
+
+    16kHz 모노 float32 WAV는 파일을 메모리 매핑한 읽기 전용 배열을 그대로 반환합니다.
+    """
+    info = _fast_path_info(audio_path)
+    if info is not None:
+        set_trace_attribute("audio.decoder", "native" if info.is_native else "numpy")
+        metrics.increment("audio_fast_path_total" if info.is_native else "audio_numpy_resample_total")
+        audio = _load_wav(audio_path, info, split_stereo)
+    else:
+        from faster_whisper.audio import decode_audio
+
+        set_trace_attribute("audio.decoder", "ffmpeg")
+        metrics.increment("audio_ffmpeg_decode_total")
+        audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE, split_stereo=split_stereo)
+
+    if settings.AUDIO_NORMALIZE_DBFS is not None:
+        with span("normalize"):
+            if split_stereo:
+                audio = tuple(normalize_loudness(channel, settings.AUDIO_NORMALIZE_DBFS) for channel in audio)
+            else:
+                audio = normalize_loudness(audio, settings.AUDIO_NORMALIZE_DBFS)
+    return audio
+
+
+def iter_audio_windows(audio_path: str, window_samples: int) -> Iterator[Tuple[float, Any]]:
+    """
+    Consecutive 16kHz mono windows of a long file
+
+    16kHz 모노 WAV는 메모리 매핑한 데이터를 창 단위로 잘라 변환하고, 그 밖에는 FFmpeg로 창 단위 디코딩합니다.
+    """
+    info = _fast_path_info(audio_path)
+    if info is None or not info.is_native:
+        windows = iter_pcm_windows(audio_path, window_samples)
+    else:
+        frames = _map_frames(audio_path, info)
+        windows = (
+            (start / SAMPLE_RATE, _to_float32(frames[start:start + window_samples, 0], info))
+            for start in range(0, info.frames, window_samples)
+        )
+    for offset, window in windows:
+        if settings.AUDIO_NORMALIZE_DBFS is not None:
+            window = normalize_loudness(window, settings.AUDIO_NORMALIZE_DBFS)
+        yield offset, window
+
+
+def describe(audio_path: str) -> Dict[str, Any]:
+    """Which preprocessing path a file takes (for benchmarks and diagnostics)"""
+    info = _fast_path_info(audio_path)
+    if info is None:
+        return {"path": "ffmpeg"}
+    return {
+        "path": "native" if info.is_native else "numpy",
+        "sample_rate": info.sample_rate,
+        "channels": info.channels,
+        "dtype": info.dtype,
+        "duration": round(info.duration, 3),
+    }
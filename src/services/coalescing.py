@@ -0,0 +1,50 @@
+"""
+Request Coalescing
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+from src.utils.metrics import metrics
+
+
+class SingleFlight:
+    """
+    동일 키의 동시 작업을 하나로 합치는 single-flight 그룹
+
+    같은 키로 진행 중인 작업이 있으면 새로 시작하지 않고 그 작업에 합류합니다.
+    작업은 요청과 분리된 Task로 실행되므로 먼저 시작한 요청이 취소되어도
+    합류한 요청들은 결과를 받을 수 있습니다. 이벤트 루프 스레드에서만 사용합니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def join_or_start(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Tuple[asyncio.Task, bool]:
+        """
+        Join the in-flight task for key or start a new one
+
+        Returns:
+            (작업 Task, 기존 작업에 합류했는지 여부)
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            metrics.increment(f"{self.name}_coalesced_total")
+            return task, True
+
+        task = asyncio.ensure_future(factory())
+        self._inflight[key] = task
+        metrics.increment(f"{self.name}_started_total")
+        metrics.set_gauge(f"{self.name}_inflight", len(self._inflight))
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task, False
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        metrics.set_gauge(f"{self.name}_inflight", len(self._inflight))
+        # 모든 대기 요청이 취소된 경우에도 예외 미확인 경고가 남지 않도록 처리
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,83 @@
+"""
+CPU Thread Allocation
+"""
+import os
+from typing import List, Optional
+from src.core.config import settings
+
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_DIRS = ("/sys/fs/cgroup/cpu", "/sys/fs/cgroup/cpu,cpuacct")
+
+
+def _cgroup_quota() -> Optional[float]:
+    """CPU quota in cores from cgroup v2 or v1, None if unlimited or unavailable"""
+    try:
+        with open(CGROUP_V2_CPU_MAX) as f:
+            quota, period = f.read().split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+
+    for directory in CGROUP_V1_CPU_DIRS:
+        try:
+            with open(os.path.join(directory, "cpu.cfs_quota_us")) as f:
+                quota = int(f.read())
+            with open(os.path.join(directory, "cpu.cfs_period_us")) as f:
+                period = int(f.read())
+            return quota / period if quota > 0 and period > 0 else None
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def detect_cpu_limit() -> int:
+    """
+    Number of cores this process may actually use
+
+    CPU affinity(cpuset)와 cgroup CPU quota 중 작은 값을 사용합니다.
+    quota가 소수이면 내림하여 과할당을 피합니다 (최소 1).
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cores = float(len(os.sched_getaffinity(0)))
+    else:
+        cores = float(os.cpu_count() or 1)
+    quota = _cgroup_quota()
+    if quota is not None:
+        cores = min(cores, quota)
+    return max(1, int(cores))
+
+
+def worker_options(cores: int) -> List[int]:
+    """Candidate concurrency levels (powers of two up to the core count)"""
+    options = [1]
+    while options[-1] * 2 <= cores:
+        options.append(options[-1] * 2)
+    return options
+
+
+class ThreadPlan:
+    """추론당 스레드 수(cpu_threads)와 동시 추론 수(num_workers)"""
+
+    def __init__(self, cpu_threads: int, num_workers: int):
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+
+    @classmethod
+    def split(cls, cores: int, num_workers: int) -> "ThreadPlan":
+        """Divide cores evenly between concurrent inferences"""
+        num_workers = max(1, min(num_workers, cores))
+        return cls(cpu_threads=max(1, cores // num_workers), num_workers=num_workers)
+
+    @classmethod
+    def from_settings(cls, device: str) -> "ThreadPlan":
+        """
+        Static plan from settings and the detected CPU limit
+
+        GPU에서는 cpu_threads를 CTranslate2 기본값(0)으로 둡니다.
+        """
+        num_workers = max(1, settings.WHISPER_NUM_WORKERS)
+        if device != "cpu":
+            return cls(cpu_threads=settings.WHISPER_CPU_THREADS, num_workers=num_workers)
+        if settings.WHISPER_CPU_THREADS > 0:
+            return cls(cpu_threads=settings.WHISPER_CPU_THREADS, num_workers=num_workers)
+        return cls.split(detect_cpu_limit(), num_workers)
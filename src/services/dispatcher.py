@@ -0,0 +1,329 @@
+"""
+Request Dispatcher
+"""
+import asyncio
+import itertools
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+import httpx
+from pydantic import ValidationError
+from src.core.config import settings
+from src.models.responses import WorkerLoadResponse
+from src.utils.logger import get_logger
+from src.utils.exceptions import DispatchException
+from src.utils.error_messages import get_error_message
+from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+from src.utils.tracing import get_current_trace
+
+logger = get_logger(__name__)
+
+NODE_HEADER = "X-STT-Node"
+MODEL_HEADER = "X-STT-Model"
+CLUSTER_TOKEN_HEADER = "X-Cluster-Token"
+INTERNAL_PREFIX = "/api/v1/internal/"
+LOAD_PATH = INTERNAL_PREFIX + "load"
+SESSIONS_PATH = "/api/v1/sessions"
+
+# 프록시가 그대로 전달하면 안 되는 헤더 (연결 단위 헤더, 다시 계산되는 길이, 디스패처가 다시 붙이는 요청 ID,
+# 클라이언트가 보낸 클러스터 토큰)
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailers",
+    "transfer-encoding", "upgrade", "host", "content-length", "x-request-id", CLUSTER_TOKEN_HEADER.lower()
+}
+
+# 상태가 특정 워커의 메모리에만 있는 리소스 (세션, 비동기 작업)
+_AFFINITY_PATH = re.compile(r"^/api/v1/(sessions|jobs)/([^/]+)")
+_KIND_BY_COLLECTION = {"sessions": "session", "jobs": "job"}
+
+
+class WorkerNode:
+    """
+    디스패처가 보는 워커 하나
+
+    부하 점수는 마지막 폴링의 처리 중 요청 수에 그 이후 이 디스패처가 보낸 요청 수를 더해
+    동시 추론 수로 나눈 값입니다. 폴링 사이에 요청이 한 워커로 몰리지 않도록 보낸 요청을 바로 반영합니다.
+    """
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.node = urlsplit(self.url).netloc
+        self.healthy = False
+        self.load: Optional[Dict[str, Any]] = None
+        self.last_error: Optional[str] = None
+        self.sent_since_poll = 0
+        self.dispatched = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.healthy and self.load is not None and self.load["ready"]
+
+    def matches(self, name: str) -> bool:
+        return name in (self.node, self.url) or (self.load is not None and self.load.get("node_id") == name)
+
+    def has_model(self, model: str) -> bool:
+        return self.load is not None and model in self.load["models"]
+
+    def score(self) -> float:
+        load = self.load or {}
+        return (load.get("in_flight", 0) + self.sent_since_poll) / max(1, load.get("capacity", 1))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "node": self.node,
+            "url": self.url,
+            "healthy": self.healthy,
+            "ready": self.ready,
+            "score": round(self.score(), 3),
+            "dispatched": self.dispatched,
+            "last_error": self.last_error,
+            "load": self.load
+        }
+
+
+class ClusterDispatcher:
+    """
+    워커 인스턴스 앞에서 요청을 분배하는 디스패처
+
+    각 워커의 내부 API(`/api/v1/internal/load`)를 DISPATCHER_POLL_INTERVAL마다 폴링하여
+    준비 상태·처리 중 요청 수·상주 모델을 파악하고, 요청마다 다음 순서로 워커를 고릅니다.
+
+    1. `X-STT-Node` 헤더로 지정한 워커
+    2. 세션·비동기 작업 ID를 만든 워커 (해당 상태는 그 워커의 메모리에만 있음)
+    3. `X-STT-Model` 헤더(또는 model 파라미터)의 모델을 이미 로드한 워커 중 부하 점수가 가장 낮은 워커
+
+    업로드 본문은 메모리에 받아 두므로 연결 실패나 종료 중(503 + Retry-After) 응답이면 다른 워커로 다시 보냅니다.
+    """
+
+    def __init__(self, urls: Iterable[str]):
+        self.nodes: List[WorkerNode] = [WorkerNode(url) for url in urls]
+        self._client: Optional[httpx.AsyncClient] = None
+        self._poller: Optional[asyncio.Task] = None
+        self._affinity: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._rotation = itertools.count()
+
+    async def start(self) -> None:
+        # 초당 폴링마다 httpx가 남기는 요청 로그가 쌓이지 않도록 경고 이상만 기록
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.DISPATCHER_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.DISPATCHER_MAX_CONNECTIONS
+            ),
+            timeout=httpx.Timeout(settings.DISPATCHER_REQUEST_TIMEOUT, connect=settings.DISPATCHER_POLL_TIMEOUT)
+        )
+        await self.poll()
+        self._poller = asyncio.create_task(self._poll_loop())
+        logger.info(get_log_message("SYSTEM", "DISPATCHER_STARTED", count=len(self.nodes)))
+
+    async def stop(self) -> None:
+        if self._poller is not None:
+            self._poller.cancel()
+            self._poller = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.DISPATCHER_POLL_INTERVAL)
+            try:
+                await self.poll()
+            except Exception as e:
+                # 예상하지 못한 오류로 루프가 끝나면 워커 상태가 더 이상 갱신되지 않으므로 기록만 하고 계속
+                logger.error(get_log_message("SYSTEM", "DISPATCHER_POLL_FAILED", error=_describe(e)))
+
+    async def poll(self) -> None:
+        """Refresh load and resident models of every worker"""
+        await asyncio.gather(*(self._poll_node(node) for node in self.nodes))
+        metrics.set_gauge("cluster_ready_nodes", sum(node.ready for node in self.nodes))
+
+    async def _poll_node(self, node: WorkerNode) -> None:
+        try:
+            response = await self._client.get(
+                node.url + LOAD_PATH, headers=self._internal_headers(), timeout=settings.DISPATCHER_POLL_TIMEOUT
+            )
+            response.raise_for_status()
+            # 형식이 다른(이전 버전 등) 워커의 응답은 응답 없음으로 처리 (ValidationError는 ValueError의 하위 클래스)
+            load = WorkerLoadResponse.model_validate(response.json()).model_dump()
+        except (httpx.HTTPError, ValueError) as e:
+            if node.healthy or node.last_error is None:
+                logger.warning(get_log_message("SYSTEM", "WORKER_DOWN", node=node.node, error=_describe(e)))
+            node.healthy = False
+            node.last_error = _describe(e)
+            return
+        if not node.healthy:
+            logger.info(get_log_message(
+                "SYSTEM", "WORKER_UP", node=node.node, models=",".join(load["models"]) or "-", in_flight=load["in_flight"]
+            ))
+        node.healthy = True
+        node.load = load
+        node.last_error = None
+        node.sent_since_poll = 0
+
+    def _internal_headers(self) -> Dict[str, str]:
+        # 디스패처 자신의 폴링에만 사용 (클라이언트 요청에 붙이면 외부에서 내부 API를 호출할 수 있음)
+        return {CLUSTER_TOKEN_HEADER: settings.CLUSTER_TOKEN} if settings.CLUSTER_TOKEN else {}
+
+    def choose(self, model: Optional[str] = None, affinity_key: Optional[str] = None, pinned: Optional[str] = None,
+               exclude: Iterable[WorkerNode] = ()) -> WorkerNode:
+        """Pick the worker for one request"""
+        if pinned:
+            node = next((node for node in self.nodes if node.matches(pinned)), None)
+            if node is None:
+                raise DispatchException(get_error_message("API", "UNKNOWN_NODE", node=pinned), status_code=404)
+            if not node.healthy or node in exclude:
+                raise DispatchException(get_error_message("SERVER", "WORKER_UNREACHABLE", node=node.node))
+            return node
+
+        if affinity_key:
+            owner = self._lookup(affinity_key)
+            node = next((node for node in self.nodes if node.node == owner), None)
+            if node is not None and node.healthy and node not in exclude:
+                return node
+
+        candidates = [node for node in self.nodes if node.ready and node not in exclude]
+        if model:
+            with_model = [node for node in candidates if node.has_model(model)]
+            if candidates and not with_model:
+                raise DispatchException(get_error_message("SERVER", "NO_WORKER_WITH_MODEL", model=model))
+            candidates = with_model
+        if not candidates:
+            raise DispatchException(get_error_message("SERVER", "NO_WORKER_AVAILABLE"))
+
+        # 점수가 같으면 시작 위치를 돌려가며 골라 한 워커에 몰리지 않게 함
+        offset = next(self._rotation) % len(candidates)
+        return min(candidates[offset:] + candidates[:offset], key=WorkerNode.score)
+
+    async def forward(self, method: str, path: str, query: str, headers: Mapping[str, str], body: bytes,
+                      client_host: Optional[str] = None) -> Tuple[WorkerNode, httpx.Response]:
+        """
+        Send a request to the chosen worker and return its streaming response
+
+        연결 자체가 실패했거나 워커가 종료 중이면 요청이 처리되지 않았으므로 다른 워커로 다시 보냅니다.
+        """
+        pinned = headers.get(NODE_HEADER.lower())
+        model = headers.get(MODEL_HEADER.lower()) or _query_value(query, "model")
+        affinity_key = self.affinity_key(path, query, headers)
+        outgoing = self._outgoing_headers(headers, client_host)
+        url_suffix = f"{path}?{query}" if query else path
+
+        tried: List[WorkerNode] = []
+        while True:
+            node = self.choose(model, affinity_key, pinned, exclude=tried)
+            tried.append(node)
+            node.sent_since_poll += 1
+            node.dispatched += 1
+            try:
+                request = self._client.build_request(method, node.url + url_suffix, headers=outgoing, content=body)
+                response = await self._client.send(request, stream=True)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                node.healthy = False
+                node.last_error = _describe(e)
+                metrics.increment("dispatcher_failovers_total")
+                logger.warning(get_log_message("SYSTEM", "WORKER_FAILOVER", node=node.node, error=node.last_error))
+                if pinned:
+                    raise DispatchException(get_error_message("SERVER", "WORKER_UNREACHABLE", node=node.node), status_code=502)
+                continue
+            except httpx.HTTPError as e:
+                node.last_error = _describe(e)
+                raise DispatchException(get_error_message("SERVER", "WORKER_UNREACHABLE", node=node.node), status_code=502)
+
+            if response.status_code == 503 and "retry-after" in response.headers and not pinned:
+                # 종료 중인 워커는 다음 폴링 전까지 분배 대상에서 제외
+                await response.aclose()
+                if node.load is not None:
+                    node.load["ready"] = False
+                metrics.increment("dispatcher_failovers_total")
+                continue
+
+            metrics.increment("dispatcher_requests_total")
+            return node, response
+
+    async def track(self, node: WorkerNode, method: str, path: str, response: httpx.Response) -> Optional[bytes]:
+        """
+        Remember sessions and jobs created by a worker response
+
+        세션 생성 응답은 본문에서 세션 ID를 읽어야 하므로 본문을 모두 받아 반환하고,
+        그 밖의 응답은 헤더(X-Session-ID, 작업 Location)만 확인하고 None을 반환합니다.
+        """
+        session_id = response.headers.get("x-session-id")
+        if session_id:
+            self.remember(f"session:{session_id}", node)
+        match = _AFFINITY_PATH.match(response.headers.get("location", ""))
+        if match:
+            self.remember(f"{_KIND_BY_COLLECTION[match.group(1)]}:{match.group(2)}", node)
+
+        if method == "POST" and path.rstrip("/") == SESSIONS_PATH and response.status_code == 201:
+            body = await response.aread()
+            try:
+                self.remember(f"session:{json.loads(body)['session_id']}", node)
+            except (ValueError, KeyError, TypeError):
+                pass
+            return body
+        return None
+
+    def _outgoing_headers(self, headers: Mapping[str, str], client_host: Optional[str]) -> Dict[str, str]:
+        outgoing = {name: value for name, value in headers.items() if name.lower() not in HOP_BY_HOP_HEADERS}
+        trace = get_current_trace()
+        if trace is not None:
+            # 워커 로그와 trace가 디스패처와 같은 요청 ID를 사용하도록 전달
+            outgoing["X-Request-ID"] = trace.request_id
+        if client_host:
+            forwarded = headers.get("x-forwarded-for")
+            outgoing["X-Forwarded-For"] = f"{forwarded}, {client_host}" if forwarded else client_host
+        return outgoing
+
+    def affinity_key(self, path: str, query: str, headers: Mapping[str, str]) -> Optional[str]:
+        """Resource id whose state lives on a single worker, if the request refers to one"""
+        session_id = _query_value(query, "session_id") or headers.get("x-session-id")
+        if session_id:
+            return f"session:{session_id}"
+        match = _AFFINITY_PATH.match(path)
+        if match:
+            return f"{_KIND_BY_COLLECTION[match.group(1)]}:{match.group(2)}"
+        return None
+
+    def remember(self, key: str, node: WorkerNode) -> None:
+        """Route later requests for `key` to the worker that created it"""
+        self._affinity[key] = (node.node, time.monotonic() + settings.DISPATCHER_AFFINITY_TTL)
+        self._affinity.move_to_end(key)
+        while len(self._affinity) > settings.DISPATCHER_AFFINITY_MAX:
+            self._affinity.popitem(last=False)
+
+    def _lookup(self, key: str) -> Optional[str]:
+        entry = self._affinity.get(key)
+        if entry is None:
+            return None
+        if entry[1] < time.monotonic():
+            del self._affinity[key]
+            return None
+        return entry[0]
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "nodes": [node.to_dict() for node in self.nodes],
+            "ready_nodes": sum(node.ready for node in self.nodes),
+            "affinities": len(self._affinity)
+        }
+
+
+def _query_value(query: str, name: str) -> Optional[str]:
+    values = parse_qs(query).get(name)
+    return values[0] if values else None
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        fields = ", ".join(".".join(str(part) for part in item["loc"]) or "body" for item in error.errors())
+        return f"invalid load report ({fields})"
+    return str(error) or error.__class__.__name__
+
+
+# Global dispatcher
+cluster_dispatcher = ClusterDispatcher(settings.DISPATCHER_WORKERS)
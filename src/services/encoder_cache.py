@@ -0,0 +1,233 @@
+"""
+Encoder Output Reuse
+"""
+import hashlib
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+from src.core.config import settings
+from src.utils.metrics import metrics
+
+_current_memo: ContextVar[Optional["EncoderMemo"]] = ContextVar("encoder_memo", default=None)
+_model_tokens = itertools.count(1)
+
+_DTYPE_SIZES = {"float32": 4, "float16": 2, "bfloat16": 2, "int8": 1, "int16": 2, "int32": 4}
+
+
+def _digest(array: Any) -> str:
+    """Content hash of a numpy array (shape included)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(array.shape).encode("ascii"))
+    digest.update(memoryview(array).cast("B") if array.flags.c_contiguous else array.tobytes())
+    return digest.hexdigest()
+
+
+def _nbytes(value: Any) -> int:
+    """Approximate size of a numpy array or ctranslate2.StorageView"""
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    size = 1
+    for dim in getattr(value, "shape", ()):
+        size *= dim
+    return size * _DTYPE_SIZES.get(str(getattr(value, "dtype", "")).split(".")[-1], 4)
+
+
+class BoundedCache:
+    """
+    메모리 예산 내에서 LRU로 제거되는 캐시
+
+    항목 크기 합이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고,
+    ttl이 설정되면 만료된 항목은 조회 시 제거합니다. max_bytes가 0이면 비활성화됩니다.
+    """
+
+    def __init__(self, name: str, max_bytes: int, ttl: float = 0.0):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._lookups = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            self._lookups += 1
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl and time.monotonic() - entry[2] > self.ttl:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                metrics.increment(f"{self.name}_misses_total")
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                metrics.increment(f"{self.name}_hits_total")
+            metrics.set_gauge(f"{self.name}_hit_rate", self._hits / self._lookups)
+            return entry[0] if entry is not None else None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = _nbytes(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic())
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                metrics.increment(f"{self.name}_evictions_total")
+            self._update_gauges()
+
+    def purge(self, prefix: Hashable) -> None:
+        """Drop entries whose key starts with prefix (e.g. a released model)"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == prefix]:
+                self._remove(key)
+            self._update_gauges()
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _update_gauges(self) -> None:
+        metrics.set_gauge(f"{self.name}_bytes", self._bytes)
+        metrics.set_gauge(f"{self.name}_entries", len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class EncoderMemo:
+    """
+    요청 하나의 디코딩 작업들이 공유하는 log-mel 특징 / 인코더 출력 저장소
+
+    같은 오디오를 여러 작업(transcribe, translate)으로 디코딩할 때
+    동일한 30초 구간은 한 번만 인코딩하고 이후 작업은 디코더만 실행합니다.
+    """
+
+    def __init__(self, max_windows: int):
+        self.max_windows = max_windows
+        self.features: Dict[Any, Any] = {}
+        self.encoder_outputs: Dict[Tuple[int, str], Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_encoder_output(self, key: Tuple[int, str]) -> Optional[Any]:
+        output = self.encoder_outputs.get(key)
+        if output is not None:
+            self.hits += 1
+            metrics.increment("encoder_reuse_hits_total")
+        return output
+
+    def put_encoder_output(self, key: Tuple[int, str], output: Any) -> None:
+        self.misses += 1
+        metrics.increment("encoder_reuse_misses_total")
+        if len(self.encoder_outputs) < self.max_windows:
+            self.encoder_outputs[key] = output
+
+
+class _FeatureExtractorProxy:
+    """FeatureExtractor 호출을 요청 메모와 특징 캐시로 보내는 프록시 (나머지 속성은 그대로 위임)"""
+
+    def __init__(self, extractor: Any, token: int):
+        self._extractor = extractor
+        self._token = token
+
+    def __call__(self, audio: Any, *args: Any, **kwargs: Any) -> Any:
+        memo = _current_memo.get()
+        if memo is None and not feature_cache.enabled:
+            return self._extractor(audio, *args, **kwargs)
+
+        # log-mel 정규화가 오디오 전체 최댓값에 의존하므로 특징은 오디오 전체 해시 기준으로 캐시
+        key = (self._token, _digest(audio), args, tuple(sorted(kwargs.items())))
+        features = memo.features.get(key) if memo is not None else None
+        if features is None and feature_cache.enabled:
+            features = feature_cache.get(key)
+        if features is None:
+            features = self._extractor(audio, *args, **kwargs)
+            features.flags.writeable = False  # 캐시된 배열이 호출 측에서 변경되지 않도록 보호
+            if feature_cache.enabled:
+                feature_cache.put(key, features)
+        if memo is not None:
+            memo.features[key] = features
+        return features
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._extractor, name)
+
+
+def install_encoder_reuse(model: Any) -> None:
+    """
+    Route a WhisperModel's feature extraction and encoding through the request memo and caches
+
+    메모가 활성화되지 않고 캐시도 꺼져 있으면 원래 함수를 그대로 호출합니다.
+    """
+    if getattr(model, "_encoder_cache_token", None) is not None or not hasattr(model, "encode"):
+        return
+
+    token = next(_model_tokens)
+    encode = model.encode
+
+    def cached_encode(features: Any) -> Any:
+        memo = _current_memo.get()
+        if memo is None and not encoder_cache.enabled:
+            return encode(features)
+
+        # 패딩된 30초 구간 log-mel의 내용 해시를 키로 사용 (보조 디코딩의 초안 모델과 출력이 섞이지 않도록 모델별로 구분)
+        key = (token, _digest(features))
+        output = memo.get_encoder_output(key) if memo is not None else None
+        if output is not None:
+            return output
+        if encoder_cache.enabled:
+            output = encoder_cache.get(key)
+        if output is None:
+            output = encode(features)
+            if encoder_cache.enabled:
+                encoder_cache.put(key, output)
+        if memo is not None:
+            memo.put_encoder_output(key, output)
+        return output
+
+    model.encode = cached_encode
+    if hasattr(model, "feature_extractor"):
+        model.feature_extractor = _FeatureExtractorProxy(model.feature_extractor, token)
+    model._encoder_cache_token = token
+
+
+def release_encoder_cache(model: Any) -> None:
+    """Drop cached entries produced by a model that is being unloaded"""
+    token = getattr(model, "_encoder_cache_token", None)
+    if token is not None:
+        encoder_cache.purge(token)
+        feature_cache.purge(token)
+
+
+@contextmanager
+def reuse_encoder_outputs(max_windows: int) -> Iterator[EncoderMemo]:
+    """Share features and encoder outputs between decoding passes in this context"""
+    memo = EncoderMemo(max_windows)
+    token = _current_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _current_memo.reset(token)
+
+
+# Global caches shared across requests
+encoder_cache = BoundedCache(
+    "encoder_cache", settings.ENCODER_CACHE_MAX_MB * 1024 * 1024, settings.ENCODER_CACHE_TTL
+)
+feature_cache = BoundedCache(
+    "feature_cache", settings.FEATURE_CACHE_MAX_MB * 1024 * 1024, settings.ENCODER_CACHE_TTL
+)
@@ -0,0 +1,306 @@
+"""
+Async Transcription Jobs
+"""
+import asyncio
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set
+from fastapi import UploadFile
+from src.core.config import settings
+from src.core.lifecycle import lifecycle
+from src.services.stt_service import stt_service
+from src.services.vocabulary import PromptSpec
+from src.services.webhooks import Delivery, WebhookDispatcher, DELIVERY_PENDING
+from src.models.responses import JobResponse
+from src.utils.logger import get_logger, SAMPLED
+from src.utils.exceptions import STTException, JobException, ServiceUnavailableException
+from src.utils.error_messages import get_error_message
+from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+from src.utils.serialization import build_transcription_payload, dumps_json
+
+logger = get_logger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+
+class TranscriptionJob:
+    """
+    백그라운드 변환 작업 하나의 상태와 결과
+
+    시각은 재시작 후에도 보관 기간을 계산할 수 있도록 epoch 초로 기록합니다.
+    """
+
+    def __init__(self, job_id: str, callback_url: Optional[str] = None):
+        self.job_id = job_id
+        self.callback_url = callback_url
+        self.status = STATUS_QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.status_code: Optional[int] = None
+        self.delivery: Optional[Delivery] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (STATUS_COMPLETED, STATUS_FAILED)
+
+    def complete(self, result: Dict[str, Any]) -> None:
+        self.status = STATUS_COMPLETED
+        self.result = result
+        self.finished_at = time.time()
+
+    def fail(self, message: str, status_code: int) -> None:
+        self.status = STATUS_FAILED
+        self.error = message
+        self.status_code = status_code
+        self.finished_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        expires_in = None
+        if self.finished_at is not None:
+            expires_in = max(0.0, round(settings.JOB_RESULT_TTL - (time.time() - self.finished_at), 1))
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+            "status_code": self.status_code,
+            "callback": self.delivery.to_dict() if self.delivery else None,
+            "expires_in": expires_in
+        }
+
+    def callback_body(self) -> bytes:
+        """Webhook body: the job as returned by GET /api/v1/jobs/{job_id}, without delivery state"""
+        return dumps_json(JobResponse(**self.to_dict()).model_dump(mode="json", exclude={"callback", "expires_in"}))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TranscriptionJob":
+        job = cls(data["job_id"], (data.get("callback") or {}).get("url"))
+        for key in ("status", "created_at", "started_at", "finished_at", "result", "error", "status_code"):
+            setattr(job, key, data.get(key))
+        if data.get("callback"):
+            job.delivery = Delivery(job.job_id, **data["callback"])
+        return job
+
+
+class JobStore:
+    """
+    작업 저장소
+
+    대기·실행 중 작업과 완료된 작업을 나누어 보관합니다. 완료된 작업은 완료 순서대로 두고
+    JOB_RESULT_TTL이 지나거나 JOB_MAX_COUNT를 넘으면 오래된 것부터 제거합니다.
+    JOB_STORE_PATH를 설정하면 종료 시 파일에 저장하고 시작 시 다시 불러옵니다.
+    """
+
+    def __init__(self, ttl: float, max_jobs: int, store_path: Optional[str] = None):
+        self.ttl = ttl
+        self.max_jobs = max_jobs
+        self.store_path = store_path
+        self._lock = threading.Lock()
+        self._active: Dict[str, TranscriptionJob] = {}
+        self._finished: "OrderedDict[str, TranscriptionJob]" = OrderedDict()
+        if store_path:
+            self._load()
+
+    def add(self, job: TranscriptionJob) -> None:
+        with self._lock:
+            self._active[job.job_id] = job
+            metrics.set_gauge("jobs_active", len(self._active))
+
+    def finish(self, job: TranscriptionJob) -> None:
+        """Move a job that completed or failed to the expiring part of the store"""
+        with self._lock:
+            self._active.pop(job.job_id, None)
+            self._finished[job.job_id] = job
+            self._evict()
+            metrics.set_gauge("jobs_active", len(self._active))
+
+    def get(self, job_id: str) -> TranscriptionJob:
+        with self._lock:
+            self._evict()
+            job = self._active.get(job_id) or self._finished.get(job_id)
+        if job is None:
+            raise JobException(get_error_message("API", "JOB_NOT_FOUND", job_id=job_id))
+        return job
+
+    def active_count(self) -> int:
+        return len(self._active)
+
+    def unfinished(self) -> List[TranscriptionJob]:
+        with self._lock:
+            return list(self._active.values())
+
+    def pending_deliveries(self) -> List[TranscriptionJob]:
+        with self._lock:
+            return [job for job in self._finished.values() if job.delivery and job.delivery.status == DELIVERY_PENDING]
+
+    def _evict(self) -> None:
+        now = time.time()
+        expired = 0
+        while self._finished:
+            job = next(iter(self._finished.values()))
+            if now - job.finished_at <= self.ttl and len(self._finished) <= self.max_jobs:
+                break
+            self._finished.popitem(last=False)
+            expired += 1
+        if expired:
+            metrics.increment("jobs_expired_total", expired)
+
+    def _load(self) -> None:
+        if not os.path.exists(self.store_path):
+            return
+        with open(self.store_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for item in sorted(data.get("jobs", []), key=lambda item: item.get("finished_at") or 0):
+            job = TranscriptionJob.from_dict(item)
+            if job.finished:
+                self._finished[job.job_id] = job
+        self._evict()
+
+    def save(self) -> None:
+        if not self.store_path:
+            return
+        parent = os.path.dirname(self.store_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with self._lock:
+            jobs = [job.to_dict() for job in self._finished.values()]
+        tmp_path = f"{self.store_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"jobs": jobs}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.store_path)
+        logger.info(get_log_message("SYSTEM", "JOBS_SAVED", count=len(jobs), path=self.store_path))
+
+    def __len__(self) -> int:
+        return len(self._active) + len(self._finished)
+
+
+class JobRunner:
+    """
+    callback_url 요청을 백그라운드에서 처리하는 실행기
+
+    업로드 검증·저장까지는 요청 안에서 끝내고 202를 반환한 뒤, 이벤트 루프의 태스크로
+    변환을 실행합니다(동시 실행 JOB_MAX_CONCURRENCY). 작업은 접수부터 결과 저장까지
+    처리 중 요청으로 집계되므로 종료 시 drain이 완료를 기다립니다.
+    결과를 저장한 뒤 웹훅 전송은 WebhookDispatcher가 재시도와 함께 담당합니다.
+    """
+
+    def __init__(self, store: JobStore, dispatcher: WebhookDispatcher, max_concurrency: int):
+        self.store = store
+        self.dispatcher = dispatcher
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def submit(self, file: UploadFile, callback_url: Optional[str], language: Optional[str] = None,
+               prompt: Optional[PromptSpec] = None, split_channels: bool = False, task: str = "transcribe",
+               include_segments: bool = False,
+               on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> TranscriptionJob:
+        """Save the upload and start transcribing it in the background"""
+        if self.store.active_count() >= settings.JOB_MAX_QUEUED:
+            metrics.increment("jobs_rejected_total")
+            raise JobException(get_error_message("API", "JOB_QUEUE_FULL", max_queued=settings.JOB_MAX_QUEUED), status_code=429)
+
+        file_path, content_hash = stt_service.accept_upload(file)
+        if not lifecycle.try_admit():
+            stt_service.cleanup_file(file_path)
+            raise ServiceUnavailableException(get_error_message("SERVER", "SERVICE_SHUTTING_DOWN"))
+
+        job = TranscriptionJob(secrets.token_urlsafe(16), callback_url)
+        self.store.add(job)
+        # 요청 trace는 202 응답과 함께 끝나므로 작업은 새 컨텍스트에서 실행
+        background = asyncio.get_running_loop().create_task(
+            self._run(job, file_path, content_hash, stt_service.describe_upload(file), language, prompt,
+                      split_channels, task, include_segments, on_result),
+            context=contextvars.Context()
+        )
+        self._tasks.add(background)
+        background.add_done_callback(self._tasks.discard)
+        metrics.increment("jobs_submitted_total")
+        logger.info(get_log_message("SERVICE", "JOB_SUBMITTED", job_id=job.job_id, filename=file.filename), extra=SAMPLED)
+        return job
+
+    async def _run(self, job: TranscriptionJob, file_path: str, content_hash: str, file_info: Dict[str, Any],
+                   language: Optional[str], prompt: Optional[PromptSpec], split_channels: bool, task: str,
+                   include_segments: bool, on_result: Optional[Callable[[Dict[str, Any]], None]]) -> None:
+        try:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            async with self._semaphore:
+                job.status = STATUS_RUNNING
+                job.started_at = time.time()
+                result = await stt_service.transcribe_saved_file(file_path, content_hash, language, prompt, split_channels, task)
+            result["processing_time"] = round(time.time() - job.started_at, 3)
+            result["file_info"] = file_info
+            if on_result is not None:
+                on_result(result)
+            job.complete(build_transcription_payload(result, include_segments))
+        except STTException as e:
+            job.fail(e.message, e.status_code)
+        except asyncio.CancelledError:
+            job.fail(get_error_message("SERVER", "SERVICE_SHUTTING_DOWN"), 503)
+            raise
+        except Exception as e:
+            logger.error(get_log_message("SERVICE", "TRANSCRIPTION_FAILED", error=str(e)), exc_info=True)
+            job.fail(get_error_message("SERVER", "INTERNAL_ERROR"), 500)
+        finally:
+            if job.started_at is None:
+                # 실행 전에 끝난 작업은 업로드 파일을 직접 정리 (실행된 작업은 변환 경로에서 정리)
+                stt_service.cleanup_file(file_path)
+            self._finish(job)
+
+    def _finish(self, job: TranscriptionJob) -> None:
+        self.store.finish(job)
+        lifecycle.release()
+        metrics.increment(f"jobs_{job.status}_total")
+        logger.info(get_log_message(
+            "SERVICE", "JOB_COMPLETED", job_id=job.job_id, status=job.status,
+            duration=round(job.finished_at - job.created_at, 2)
+        ), extra=SAMPLED)
+        if job.callback_url:
+            job.delivery = self.dispatcher.schedule(Delivery(job.job_id, job.callback_url, job.callback_body()))
+
+    def resume(self) -> int:
+        """Re-send webhooks that were still pending when the previous process stopped"""
+        if not self.store.store_path:
+            return 0
+        jobs = self.store.pending_deliveries()
+        for job in jobs:
+            job.delivery.body = job.callback_body()
+            self.dispatcher.schedule(job.delivery)
+        logger.info(get_log_message("SYSTEM", "JOBS_LOADED", count=len(self.store), pending=len(jobs)))
+        return len(jobs)
+
+    def shutdown(self) -> None:
+        """
+        Shutdown hook: fail jobs that outlived the drain and persist the store
+
+        제한 시간 안에 끝나지 않은 작업은 실패로 기록하고, 웹훅 전송 대기 중인 작업과 함께 저장하여
+        다음 시작 시 resume()으로 전송합니다.
+        """
+        self.dispatcher.stop()
+        for job in self.store.unfinished():
+            job.fail(get_error_message("SERVER", "SERVICE_SHUTTING_DOWN"), 503)
+            if job.callback_url:
+                job.delivery = Delivery(job.job_id, job.callback_url)
+            self.store.finish(job)
+        self.store.save()
+
+
+# Global job runner
+job_store = JobStore(settings.JOB_RESULT_TTL, settings.JOB_MAX_COUNT, settings.JOB_STORE_PATH)
+job_runner = JobRunner(job_store, WebhookDispatcher(settings.JOB_CALLBACK_WORKERS), settings.JOB_MAX_CONCURRENCY)
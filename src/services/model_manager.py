@@ -0,0 +1,225 @@
+"""
+Model Manager
+"""
+import gc
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+from src.core.config import settings
+from src.services.encoder_cache import install_encoder_reuse, release_encoder_cache
+from src.services.cpu_allocation import ThreadPlan
+from src.utils.logger import get_logger
+from src.utils.exceptions import ModelNotLoadedException, ModelSwapException
+from src.utils.error_messages import get_error_message
+from src.utils.log_messages import get_log_message
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+logger = get_logger(__name__)
+
+
+class ModelConfig:
+    """Whisper 모델 로딩 설정"""
+
+    def __init__(self, model: str, device: str, compute_type: str, cpu_threads: int = 0, num_workers: int = 1):
+        self.model = model
+        self.device = device
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads  # 추론당 스레드 수 (0이면 CTranslate2 기본값)
+        self.num_workers = num_workers  # 동시 추론 수
+
+    @classmethod
+    def from_settings(cls) -> "ModelConfig":
+        """Build config from application settings"""
+        plan = ThreadPlan.from_settings(settings.WHISPER_DEVICE)
+        return cls(
+            model=settings.WHISPER_MODEL,
+            device=settings.WHISPER_DEVICE,
+            compute_type=settings.WHISPER_COMPUTE_TYPE,
+            cpu_threads=plan.cpu_threads,
+            num_workers=plan.num_workers
+        )
+
+    def with_threads(self, plan: ThreadPlan) -> "ModelConfig":
+        """Same model with a different thread split"""
+        return ModelConfig(self.model, self.device, self.compute_type, plan.cpu_threads, plan.num_workers)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "device": self.device,
+            "compute_type": self.compute_type,
+            "cpu_threads": self.cpu_threads,
+            "num_workers": self.num_workers
+        }
+
+
+class ModelSlot:
+    """로드된 모델과 해당 모델을 사용 중인 요청 수"""
+
+    def __init__(self, model: "WhisperModel", config: ModelConfig, generation: int):
+        self.model = model
+        self.config = config
+        self.generation = generation
+        self.in_flight = 0
+        self._drained = threading.Condition()
+
+    def enter(self) -> None:
+        with self._drained:
+            self.in_flight += 1
+
+    def exit(self) -> None:
+        with self._drained:
+            self.in_flight -= 1
+            if self.in_flight == 0:
+                self._drained.notify_all()
+
+    def wait_drained(self, timeout: float) -> bool:
+        """Wait until no request uses this slot"""
+        with self._drained:
+            return self._drained.wait_for(lambda: self.in_flight == 0, timeout=timeout)
+
+
+class ModelManager:
+    """
+    활성 모델 관리
+
+    새 모델은 백그라운드에서 로드 및 워밍업한 뒤 원자적으로 교체하며,
+    이전 모델은 별도 스레드에서 사용 중인 요청이 모두 끝나기를 기다린 후 해제합니다
+    (교체는 전환 즉시 완료되므로 이전 모델을 기다리는 동안에도 다음 교체를 시작할 수 있음).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active: Optional[ModelSlot] = None
+        self._generation = 0
+        self._swap_thread: Optional[threading.Thread] = None
+        self._swap_status: Dict[str, Any] = {"state": "idle"}
+        self._retiring: List[ModelSlot] = []
+
+    @property
+    def active(self) -> Optional[ModelSlot]:
+        return self._active
+
+    def build_model(self, config: ModelConfig) -> "WhisperModel":
+        """Construct a WhisperModel for the given config"""
+        # faster_whisper는 ctranslate2/av/tokenizers를 함께 불러오므로 모델 로드 시점까지 import를 미룸
+        from faster_whisper import WhisperModel
+
+        model = WhisperModel(
+            model_size_or_path=config.model,
+            device=config.device,
+            compute_type=config.compute_type,
+            cpu_threads=config.cpu_threads,
+            num_workers=config.num_workers
+        )
+        install_encoder_reuse(model)
+        return model
+
+    def warmup(self, model: "WhisperModel") -> None:
+        """Run a short silent clip through the model"""
+        import numpy as np
+
+        segments, _ = model.transcribe(np.zeros(16000, dtype=np.float32), language="en", beam_size=1)
+        list(segments)
+
+    def load(self, config: ModelConfig) -> ModelSlot:
+        """Load a model synchronously and make it active"""
+        model = self.build_model(config)
+        return self._activate(model, config)
+
+    def _activate(self, model: "WhisperModel", config: ModelConfig) -> ModelSlot:
+        with self._lock:
+            self._generation += 1
+            previous = self._active
+            self._active = ModelSlot(model, config, self._generation)
+            active = self._active
+            if previous is not None:
+                self._retiring.append(previous)
+        if previous is not None:
+            threading.Thread(target=self._release, args=(previous,), name="model-release", daemon=True).start()
+        return active
+
+    def _release(self, slot: ModelSlot) -> None:
+        """Drain in-flight requests on a retired slot and free it"""
+        logger.info(get_log_message("SERVICE", "MODEL_DRAINING", model=slot.config.model, in_flight=slot.in_flight))
+        release_encoder_cache(slot.model)
+        if slot.wait_drained(settings.MODEL_DRAIN_TIMEOUT):
+            unload = getattr(getattr(slot.model, "model", None), "unload_model", None)
+            if unload is not None:
+                unload()
+            slot.model = None
+        else:
+            # 남은 요청이 모델 참조를 갖고 있으므로 해당 요청 종료 시 해제됨
+            logger.warning(get_log_message("SERVICE", "MODEL_DRAIN_TIMEOUT", model=slot.config.model, in_flight=slot.in_flight))
+        with self._lock:
+            self._retiring.remove(slot)
+        gc.collect()
+        logger.info(get_log_message("SERVICE", "MODEL_RELEASED", model=slot.config.model))
+
+    @contextmanager
+    def acquire(self) -> Iterator[ModelSlot]:
+        """Pin the active model for the duration of a request"""
+        with self._lock:
+            slot = self._active
+            if slot is None:
+                raise ModelNotLoadedException()
+            slot.enter()
+        try:
+            yield slot
+        finally:
+            slot.exit()
+
+    def swap(self, config: ModelConfig) -> Dict[str, Any]:
+        """Start loading a new model in the background"""
+        with self._lock:
+            if self._swap_thread is not None and self._swap_thread.is_alive():
+                raise ModelSwapException(get_error_message("MODEL", "MODEL_SWAP_IN_PROGRESS"))
+            self._swap_status = {
+                "state": "loading",
+                "target": config.to_dict(),
+                "started_at": time.time()
+            }
+            self._swap_thread = threading.Thread(
+                target=self._run_swap, args=(config,), name="model-swap", daemon=True
+            )
+            self._swap_thread.start()
+        return self.status()
+
+    def _run_swap(self, config: ModelConfig) -> None:
+        try:
+            logger.info(get_log_message("SERVICE", "MODEL_SWAP_STARTED", model=config.model))
+            model = self.build_model(config)
+
+            if settings.MODEL_WARMUP_ENABLED:
+                self._swap_status["state"] = "warming"
+                logger.info(get_log_message("SERVICE", "MODEL_WARMUP", model=config.model))
+                self.warmup(model)
+
+            self._activate(model, config)
+            self._swap_status["state"] = "completed"
+            logger.info(get_log_message("SERVICE", "MODEL_SWAPPED", model=config.model))
+        except Exception as e:
+            self._swap_status["state"] = "failed"
+            self._swap_status["error"] = str(e)
+            logger.error(get_log_message("SERVICE", "MODEL_SWAP_FAILED", model=config.model, error=str(e)))
+        finally:
+            self._swap_status["finished_at"] = time.time()
+
+    def status(self) -> Dict[str, Any]:
+        """Current model and swap progress"""
+        active = self._active
+        with self._lock:
+            retiring = [
+                {"model": slot.config.model, "generation": slot.generation, "in_flight": slot.in_flight}
+                for slot in self._retiring
+            ]
+        return {
+            "active": active.config.to_dict() if active else None,
+            "generation": active.generation if active else 0,
+            "in_flight": active.in_flight if active else 0,
+            "swap": dict(self._swap_status),
+            "retiring": retiring
+        }
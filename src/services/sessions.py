@@ -0,0 +1,151 @@
+"""
+Conversation Sessions
+"""
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from src.core.config import settings
+from src.utils.logger import get_logger, SAMPLED
+from src.utils.exceptions import SessionException
+from src.utils.error_messages import get_error_message
+from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+
+class ConversationSession:
+    """
+    대화 하나의 단기 상태
+
+    - language: 첫 턴에서 감지한(또는 지정한) 언어. 이후 턴은 언어 감지를 생략
+    - previous_text: 직전 턴 변환 결과. 다음 턴의 initial_prompt로 사용하여 문맥 유지
+    - model: 세션을 처리한 모델 (모델 교체 여부 확인용)
+    """
+
+    def __init__(self, session_id: str, language: Optional[str] = None, vocabulary: Optional[str] = None):
+        self.session_id = session_id
+        self.language = language
+        self.vocabulary = vocabulary
+        self.previous_text: Optional[str] = None
+        self.model: Optional[str] = None
+        self.turns = 0
+        self.created_at = time.time()
+        self.last_used = time.monotonic()
+
+    def prompt(self, initial_prompt: Optional[str] = None) -> Optional[str]:
+        """Request prompt followed by the tail of the previous turn"""
+        previous = self.previous_text
+        if previous and len(previous) > settings.SESSION_PROMPT_CHARS:
+            # 단어 중간에서 잘리지 않도록 공백 기준으로 앞부분 제거
+            tail = previous[-settings.SESSION_PROMPT_CHARS:]
+            previous = tail.split(" ", 1)[-1] if " " in tail else tail
+        parts = [part for part in (initial_prompt, previous) if part]
+        return " ".join(parts) if parts else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "language": self.language,
+            "vocabulary": self.vocabulary,
+            "model": self.model,
+            "turns": self.turns,
+            "previous_text": self.previous_text,
+            "expires_in": max(0.0, round(settings.SESSION_TTL - (time.monotonic() - self.last_used), 1))
+        }
+
+
+class SessionStore:
+    """
+    메모리 내 대화 세션 저장소
+
+    마지막 사용 후 SESSION_TTL이 지난 세션은 조회 시 제거하고,
+    SESSION_MAX_COUNT를 넘으면 가장 오래 사용하지 않은 세션부터 제거합니다.
+    세션은 프로세스 메모리에만 있으므로 여러 인스턴스 앞에서는 X-Session-ID 기준 고정 라우팅이 필요합니다.
+    """
+
+    def __init__(self, ttl: float, max_sessions: int):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, ConversationSession]" = OrderedDict()
+
+    def create(self, language: Optional[str] = None, vocabulary: Optional[str] = None) -> ConversationSession:
+        session = ConversationSession(secrets.token_urlsafe(16), language, vocabulary)
+        with self._lock:
+            self._evict_expired()
+            self._sessions[session.session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                metrics.increment("sessions_evicted_total")
+            metrics.set_gauge("sessions_active", len(self._sessions))
+        logger.info(get_log_message("SERVICE", "SESSION_CREATED", session_id=session.session_id), extra=SAMPLED)
+        return session
+
+    def get(self, session_id: str) -> ConversationSession:
+        """Look up a live session and refresh its TTL"""
+        with self._lock:
+            self._evict_expired()
+            session = self._sessions.get(session_id)
+            if session is None:
+                raise SessionException(get_error_message("API", "SESSION_NOT_FOUND", session_id=session_id))
+            session.last_used = time.monotonic()
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            if self._sessions.pop(session_id, None) is None:
+                raise SessionException(get_error_message("API", "SESSION_NOT_FOUND", session_id=session_id))
+            metrics.set_gauge("sessions_active", len(self._sessions))
+
+    def resolve_turn(self, session: ConversationSession, language: Optional[str], vocabulary: Optional[str],
+                     initial_prompt: Optional[str]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Fill a turn's language, vocabulary and prompt from session state
+
+        요청에 지정한 값이 우선하며, 직전 턴 텍스트는 요청 프롬프트 뒤에 이어 붙입니다.
+        """
+        if session.language and not language:
+            metrics.increment("session_language_reused_total")
+        return language or session.language, vocabulary or session.vocabulary, session.prompt(initial_prompt)
+
+    def record_turn(self, session: ConversationSession, text: Optional[str], language: Optional[str] = None,
+                    language_probability: float = 1.0, model: Optional[str] = None) -> None:
+        """Remember a finished turn for the next one"""
+        with self._lock:
+            session.turns += 1
+            if text is not None:
+                session.previous_text = text.strip() or session.previous_text
+            # 짧은 발화의 불확실한 감지 결과로 대화 전체 언어가 고정되지 않도록 확률 기준 적용
+            if language and not session.language and language_probability >= settings.SESSION_LANGUAGE_MIN_PROBABILITY:
+                session.language = language
+            if model:
+                session.model = model
+            session.last_used = time.monotonic()
+            if session.session_id in self._sessions:
+                self._sessions.move_to_end(session.session_id)
+        metrics.increment("session_turns_total")
+
+    def _evict_expired(self) -> None:
+        # 사용할 때마다 뒤로 옮기므로 앞쪽부터 만료된 세션만 확인
+        now = time.monotonic()
+        expired = 0
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_used <= self.ttl:
+                break
+            self._sessions.popitem(last=False)
+            expired += 1
+        if expired:
+            metrics.increment("sessions_expired_total", expired)
+            metrics.set_gauge("sessions_active", len(self._sessions))
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+# Global session store
+session_store = SessionStore(settings.SESSION_TTL, settings.SESSION_MAX_COUNT)
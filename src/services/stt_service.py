@@ -1,20 +1,40 @@
 """
 STT Service
 """
+import asyncio
+import contextvars
+import copy
+import itertools
 import os
-import shutil
 import time
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
+from typing import Callable, Dict, Any, Iterator, List, Optional, Sequence, Tuple
 from fastapi import UploadFile
-from faster_whisper import WhisperModel
+from starlette.concurrency import run_in_threadpool
 from src.core.config import settings
-from src.utils.logger import get_logger
+from src.services.model_manager import ModelManager, ModelConfig
+from src.models.segments import SegmentBuffer, SegmentStream, segment_confidence
+from src.models.responses import TranscriptionSegment
+from src.services.assisted_decoding import plan_verification, merge_segments
+from src.services.coalescing import SingleFlight
+from src.services.vocabulary import PromptSpec
+from src.services.encoder_cache import reuse_encoder_outputs
+from src.services.cpu_allocation import ThreadPlan, detect_cpu_limit
+from src.services.audio_buffers import (
+    audio_budget, estimate_samples, SAMPLE_RATE, PCM_BYTES_PER_SAMPLE, DECODE_BYTES_PER_SAMPLE
+)
+from src.services.audio_preprocessing import load_audio, iter_audio_windows
+from src.utils.logger import get_logger, SAMPLED
 from src.utils.exceptions import (
     ModelNotLoadedException, FileValidationException, 
-    TranscriptionException, FileProcessingException
+    TranscriptionException, FileProcessingException, AudioBufferException
 )
 from src.utils.error_messages import get_error_message
 from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+from src.utils.tracing import span, set_trace_attribute
+from src.utils.upload_storage import upload_storage
 
 logger = get_logger(__name__)
 
@@ -22,19 +42,25 @@ class STTService:
     """Speech-to-Text Service"""
     
     def __init__(self):
-        self.model: Optional[WhisperModel] = None
-        self._is_loaded = False
+        self.models = ModelManager()
+        self.draft_models = ModelManager()
+        self.transcriptions = SingleFlight("transcriptions")
     
     def load_model(self) -> None:
         """Load FastWhisper model"""
         try:
             logger.info(get_log_message("SERVICE", "MODEL_LOADING", model=settings.WHISPER_MODEL))
-            self.model = WhisperModel(
-                model_size_or_path=settings.WHISPER_MODEL,
-                device=settings.WHISPER_DEVICE,
-                compute_type=settings.WHISPER_COMPUTE_TYPE
-            )
-            self._is_loaded = True
+            config = ModelConfig.from_settings()
+            self.models.load(config)
+            if settings.ASSISTED_DECODING_ENABLED:
+                logger.info(get_log_message("SERVICE", "MODEL_LOADING", model=settings.DRAFT_MODEL))
+                self.draft_models.load(ModelConfig(
+                    model=settings.DRAFT_MODEL,
+                    device=settings.WHISPER_DEVICE,
+                    compute_type=settings.DRAFT_COMPUTE_TYPE,
+                    cpu_threads=config.cpu_threads,
+                    num_workers=config.num_workers
+                ))
             logger.info(get_log_message("SERVICE", "MODEL_LOADED"))
         except ImportError:
             logger.error(get_log_message("SERVICE", "MODEL_LOAD_FAILED", error="faster-whisper 패키지 미설치"))
@@ -45,7 +71,32 @@ class STTService:
     
     def is_model_loaded(self) -> bool:
         """Check if model is loaded"""
-        return self._is_loaded and self.model is not None
+        return self.models.active is not None
+    
+    def swap_model(self, model: str, device: Optional[str] = None, compute_type: Optional[str] = None) -> Dict[str, Any]:
+        """Load a new model configuration in the background and switch to it"""
+        active = self.models.active
+        current = active.config if active else ModelConfig.from_settings()
+        device = device or current.device
+        # 디바이스가 같으면 현재 스레드 분할 유지
+        plan = ThreadPlan(current.cpu_threads, current.num_workers) if device == current.device else ThreadPlan.from_settings(device)
+        config = ModelConfig(
+            model=model,
+            device=device,
+            compute_type=compute_type or current.compute_type
+        ).with_threads(plan)
+        return self.models.swap(config)
+    
+    def get_model_status(self) -> Dict[str, Any]:
+        """Get active model and swap status"""
+        status = self.models.status()
+        status["cpu"] = {"cores": detect_cpu_limit()}
+        return status
+    
+    def get_active_model_config(self) -> ModelConfig:
+        """Get config of the model serving new requests"""
+        active = self.models.active
+        return active.config if active else ModelConfig.from_settings()
     
     def validate_file(self, file: UploadFile) -> None:
         """Validate uploaded file"""
@@ -70,114 +121,552 @@ class STTService:
                 get_error_message("FILE", "FILE_TOO_LARGE", max_size=max_size_mb)
             )
     
-    def save_uploaded_file(self, file: UploadFile) -> str:
-        """Save uploaded file to temporary location"""
+    def save_uploaded_file(self, file: UploadFile) -> Tuple[str, str]:
+        """
+        Save uploaded file to temporary location
+        
+        Returns:
+            (저장된 파일 경로, 파일 내용의 SHA-256 해시)
+        """
         try:
-            # Create upload directory
-            os.makedirs(settings.UPLOAD_FOLDER, exist_ok=True)
+            # Save file to a unique path (저장하면서 내용 해시를 함께 계산)
+            file_path, content_hash = upload_storage.save(file.file, file.filename)
             
-            # Generate unique filename
-            file_path = os.path.join(settings.UPLOAD_FOLDER, file.filename)
-            
-            # Save file
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            
-            logger.info(get_log_message("SERVICE", "FILE_SAVED", filepath=file_path))
-            return file_path
+            logger.info(get_log_message("SERVICE", "FILE_SAVED", filepath=file_path), extra=SAMPLED)
+            return file_path, content_hash
             
         except Exception as e:
             logger.error(get_log_message("SERVICE", "FILE_SAVE_FAILED", error=str(e)))
             raise FileProcessingException(get_error_message("FILE", "FILE_SAVE_FAILED"))
     
-    def transcribe_audio(self, audio_path: str, language: Optional[str] = None) -> Dict[str, Any]:
-        """Transcribe audio file"""
-        if not self.is_model_loaded():
-            raise ModelNotLoadedException()
+    def transcribe_audio(self, audio_path: str, language: Optional[str] = None, prompt: Optional[PromptSpec] = None,
+                         split_channels: bool = False, task: str = "transcribe") -> Dict[str, Any]:
+        """
+        Transcribe audio file
         
-        try:
-            logger.info(get_log_message("SERVICE", "TRANSCRIPTION_STARTED", filepath=audio_path))
-            
-            # 언어 설정 (설정 파일의 기본값 또는 파라미터로 전달된 값)
-            target_language = language or settings.WHISPER_LANGUAGE
-            
-            if target_language:
-                logger.info(get_log_message("SERVICE", "LANGUAGE_SET", language=target_language))
-                # 언어를 강제로 고정하기 위해 추가 옵션 사용
-                segments, info = self.model.transcribe(
-                    audio_path, 
-                    language=target_language,
-                    task="transcribe",  # 명시적으로 변환 작업 지정
-                    beam_size=5,  # 더 정확한 변환을 위해 빔 크기 증가
-                    condition_on_previous_text=False,  # 이전 텍스트에 의존하지 않음
-                    temperature=0.0  # 결정적 변환을 위해 온도 0으로 설정
-                )
-                # 언어가 고정되었으므로 결과의 언어 정보를 고정된 언어로 설정
-                detected_language = target_language
-                language_probability = 1.0  # 고정된 언어이므로 확률을 1.0으로 설정
-            else:
-                segments, info = self.model.transcribe(audio_path)
-                detected_language = info.language
-                language_probability = info.language_probability
-            
-            # Convert generator to list and combine all segments
-            segments_list = list(segments)
-            text = " ".join([segment.text for segment in segments_list])
-            
-            result = {
-                "text": text,
-                "language": detected_language,
-                "language_probability": language_probability,
-                "segments_count": len(segments_list)
+        Args:
+            task: transcribe(원문), translate(영어 번역), both(원문과 영어 번역을 함께 반환)
+        """
+        prompt = prompt or PromptSpec()
+        with self.models.acquire() as slot, self._acquire_draft() as draft:
+            set_trace_attribute("model", slot.config.model)
+            if prompt.vocabulary:
+                set_trace_attribute("vocabulary", prompt.vocabulary_name)
+                logger.info(get_log_message("SERVICE", "VOCABULARY_APPLIED", name=prompt.vocabulary_name), extra=SAMPLED)
+            try:
+                logger.info(get_log_message("SERVICE", "TRANSCRIPTION_STARTED", filepath=audio_path), extra=SAMPLED)
+                
+                # 언어 설정 (설정 파일의 기본값 또는 파라미터로 전달된 값)
+                target_language = language or settings.WHISPER_LANGUAGE
+                if target_language:
+                    logger.info(get_log_message("SERVICE", "LANGUAGE_SET", language=target_language), extra=SAMPLED)
+                
+                # 모델 교체 drain 시간이 지나 슬롯이 비워져도 이 요청은 시작할 때의 모델로 끝까지 처리
+                model = slot.model
+                draft_model = draft.model if draft is not None else None
+                
+                # 토큰화된 프롬프트는 모델 세대별로 캐시 (모델 교체 시 다시 토큰화)
+                prompt_options = prompt.decode_options(model, ("main", slot.generation))
+                primary_task = "translate" if task == "translate" else "transcribe"
+                if draft is None:
+                    def decode(audio, language=target_language):
+                        return self._transcribe_with_model(model, audio, language, prompt_options, primary_task)
+                else:
+                    draft_prompt_options = prompt.decode_options(draft_model, ("draft", draft.generation))
+                    def decode(audio, language=target_language):
+                        return self._transcribe_assisted(
+                            model, draft_model, audio, language, prompt_options, draft_prompt_options, primary_task
+                        )
+                
+                def transcribe(audio, language=target_language):
+                    if task != "both":
+                        return (*decode(audio, language), None)
+                    # 원문 변환에서 계산한 특징과 인코더 출력을 번역 디코딩에서 재사용
+                    with reuse_encoder_outputs(settings.ENCODER_REUSE_MAX_WINDOWS) as memo:
+                        segments, detected_language, language_probability = decode(audio, language)
+                        translated = self._translate_with_model(model, audio, detected_language, prompt_options)
+                    logger.info(get_log_message(
+                        "SERVICE", "TRANSLATION_COMPLETED", reused=memo.hits, encoded=memo.misses
+                    ), extra=SAMPLED)
+                    return segments, detected_language, language_probability, translated
+                
+                # 디코딩된 PCM은 전역 메모리 예산 안에서만 보유하고, 큰 입력은 창 단위로 처리
+                if split_channels:
+                    nbytes = self._whole_decode_bytes(audio_path, channels=2)
+                    if nbytes is None:
+                        max_minutes = self._max_whole_decode_samples(channels=2) // SAMPLE_RATE // 60
+                        raise FileValidationException(
+                            get_error_message("FILE", "AUDIO_TOO_LONG_FOR_SPLIT", max_minutes=max_minutes)
+                        )
+                    with audio_budget.reserve(nbytes) as reservation:
+                        channel_audio = self._decode_audio(audio_path, split_stereo=True)
+                        reservation.resize(sum(channel.nbytes for channel in channel_audio))
+                        result = self._transcribe_channels(channel_audio, transcribe)
+                else:
+                    nbytes = self._whole_decode_bytes(audio_path)
+                    if nbytes is None:
+                        result = self._transcribe_windows(audio_path, transcribe, target_language)
+                    else:
+                        with audio_budget.reserve(nbytes) as reservation:
+                            audio = self._decode_audio(audio_path)
+                            reservation.resize(audio.nbytes)
+                            result = self._build_result(*transcribe(audio))
+                
+            except (AudioBufferException, FileValidationException):
+                raise
+            except Exception as e:
+                logger.error(get_log_message("SERVICE", "TRANSCRIPTION_FAILED", error=str(e)))
+                raise TranscriptionException(get_error_message("MODEL", "TRANSCRIPTION_FAILED"))
+        
+        result["task"] = task
+        result["vocabulary"] = prompt.vocabulary_name
+        return result
+    
+    def _acquire_draft(self):
+        """Pin the draft model when assisted decoding is active"""
+        if self.draft_models.active is None:
+            return nullcontext()
+        return self.draft_models.acquire()
+    
+    def _decode_options(self, target_language: Optional[str], prompt_options: Optional[Dict[str, Any]] = None,
+                        task: str = "transcribe") -> Dict[str, Any]:
+        """Build transcribe() options for the target language, prompt and task"""
+        options = dict(prompt_options or {})
+        options["beam_size"] = settings.WHISPER_BEAM_SIZE
+        if settings.WHISPER_VAD_FILTER:
+            options["vad_filter"] = True
+        if task != "transcribe":
+            options["task"] = task
+        if not target_language:
+            return options
+        # 언어를 강제로 고정하기 위해 추가 옵션 사용
+        options.update({
+            "language": target_language,
+            "task": task,  # 명시적으로 작업 지정
+            "condition_on_previous_text": False,  # 이전 텍스트에 의존하지 않음
+            "temperature": 0.0  # 결정적 변환을 위해 온도 0으로 설정
+        })
+        return options
+    
+    def _build_result(self, segments_list: List[Any], language: str, language_probability: float,
+                      translated: Optional[List[Any]] = None, segments: Optional[SegmentBuffer] = None,
+                      translation: Optional[SegmentBuffer] = None) -> Dict[str, Any]:
+        """Combine segments into a transcription result"""
+        if segments is None:
+            segments = SegmentBuffer.from_segments(segments_list)
+        if translation is None and translated is not None:
+            translation = SegmentBuffer.from_segments(translated)
+        text = segments.text
+        
+        result = {
+            "text": text,
+            "language": language,
+            "language_probability": language_probability,
+            "segments_count": len(segments),
+            "segments": segments
+        }
+        if translation is not None:
+            result["translation"] = {
+                "text": translation.text,
+                "language": "en",
+                "segments_count": len(translation),
+                "segments": translation
             }
-            
-            logger.info(get_log_message("SERVICE", "TRANSCRIPTION_COMPLETED", language=detected_language))
+        
+        logger.info(get_log_message("SERVICE", "TRANSCRIPTION_COMPLETED", language=language), extra=SAMPLED)
+        if settings.LOG_TRANSCRIPT_TEXT:
             logger.info(f"변환 결과 텍스트: '{text}'")
-            return result
-            
-        except Exception as e:
-            logger.error(get_log_message("SERVICE", "TRANSCRIPTION_FAILED", error=str(e)))
-            raise TranscriptionException(get_error_message("MODEL", "TRANSCRIPTION_FAILED"))
+        return result
+    
+    def _decode_audio(self, audio_path: str, split_stereo: bool = False):
+        """Decode audio file to 16kHz float32 PCM (mono, or a (left, right) pair when split_stereo)"""
+        with span("decode"):
+            audio = load_audio(audio_path, split_stereo=split_stereo)
+        samples = len(audio[0]) if split_stereo else len(audio)
+        set_trace_attribute("audio.duration", round(samples / 16000, 3))
+        return audio
+    
+    def _max_whole_decode_samples(self, channels: int = 1) -> int:
+        limit = min(settings.AUDIO_MAX_REQUEST_MB * 1024 * 1024, audio_budget.max_bytes)
+        return limit // (channels * PCM_BYTES_PER_SAMPLE)
+    
+    def _whole_decode_bytes(self, audio_path: str, channels: int = 1) -> Optional[int]:
+        """
+        Bytes to reserve for decoding the whole file at once
+        
+        Returns:
+            예약할 바이트 수 (디코딩 중 임시 버퍼 포함). 길이를 알 수 없거나
+            AUDIO_MAX_REQUEST_MB를 넘으면 None (창 단위로 처리)
+        """
+        samples = estimate_samples(audio_path)
+        if samples is None or samples > self._max_whole_decode_samples(channels):
+            return None
+        return samples * channels * DECODE_BYTES_PER_SAMPLE
+    
+    @staticmethod
+    def _shift_segment(segment: Any, offset: float) -> Any:
+        """Move a segment decoded from a window to the file timeline"""
+        if not offset:
+            return segment
+        shifted = copy.copy(segment)
+        shifted.start += offset
+        shifted.end += offset
+        return shifted
+    
+    def _transcribe_windows(self, audio_path: str,
+                            transcribe: Callable[..., Tuple[List[Any], str, float, Optional[List[Any]]]],
+                            language: Optional[str]) -> Dict[str, Any]:
+        """
+        Transcribe long audio window by window
+        
+        AUDIO_WINDOW_SECONDS 길이의 PCM 창 하나만 메모리에 두고 디코딩과 변환을 반복합니다.
+        첫 창에서 감지한 언어를 이후 창에 고정하며, 창 경계에 걸친 발화는 나뉘어 인식될 수 있습니다.
+        """
+        window_samples = settings.AUDIO_WINDOW_SECONDS * SAMPLE_RATE
+        segments: List[Any] = []
+        translated: Optional[List[Any]] = None
+        language_probability = 1.0
+        windows = 0
+        duration = 0.0
+        with audio_budget.reserve(window_samples * PCM_BYTES_PER_SAMPLE):
+            for offset, window in iter_audio_windows(audio_path, window_samples):
+                windows += 1
+                duration = offset + len(window) / SAMPLE_RATE
+                with span("window", index=windows):
+                    window_segments, window_language, window_probability, window_translated = transcribe(window, language)
+                if language is None:
+                    language, language_probability = window_language, window_probability
+                segments.extend(self._shift_segment(segment, offset) for segment in window_segments)
+                if window_translated is not None:
+                    translated = (translated or []) + [self._shift_segment(segment, offset) for segment in window_translated]
+        if windows == 0:
+            raise ValueError("no audio frames decoded")
+        
+        set_trace_attribute("audio.duration", round(duration, 3))
+        set_trace_attribute("audio.windows", windows)
+        metrics.increment("audio_windowed_requests_total")
+        logger.info(get_log_message("SERVICE", "AUDIO_WINDOWED", windows=windows, duration=round(duration, 1)), extra=SAMPLED)
+        return self._build_result(segments, language, language_probability, translated)
+    
+    def _stream_windows(self, model: Any, audio_path: str, language: Optional[str],
+                        prompt_options: Dict[str, Any], task: str, stream: Optional[SegmentStream] = None) -> Iterator[Any]:
+        """Lazily decode long audio window by window for streaming responses"""
+        window_samples = settings.AUDIO_WINDOW_SECONDS * SAMPLE_RATE
+        for offset, window in iter_audio_windows(audio_path, window_samples):
+            segments, info = model.transcribe(window, **self._decode_options(language, prompt_options, task))
+            if stream is not None and stream.language is None:
+                stream.set_info(info)
+            # 첫 창에서 감지한 언어를 이후 창에 고정
+            language = language or info.language
+            for segment in segments:
+                yield self._shift_segment(segment, offset)
+    
+    def _transcribe_channels(self, channel_audio: Sequence[Any],
+                             transcribe: Callable[[Any], Tuple[List[Any], str, float, Optional[List[Any]]]]) -> Dict[str, Any]:
+        """Transcribe each channel independently and merge into one time-ordered transcript"""
+        import numpy as np
+        
+        channels = list(range(len(channel_audio)))
+        if len(channel_audio) == 2 and np.array_equal(channel_audio[0], channel_audio[1]):
+            # 모노 파일은 두 채널이 같으므로 한 번만 변환
+            channels = [0]
+        active = [channel for channel in channels if not self._is_silent(channel_audio[channel])]
+        skipped = [channel for channel in channels if channel not in active]
+        
+        outputs: Dict[int, Tuple[List[Any], str, float, Optional[List[Any]]]] = {}
+        if active:
+            # 채널별 추론을 병렬로 실행 (trace 컨텍스트를 작업 스레드로 전달)
+            with ThreadPoolExecutor(max_workers=len(active), thread_name_prefix="stt-channel") as executor:
+                futures = {
+                    channel: executor.submit(contextvars.copy_context().run, transcribe, channel_audio[channel])
+                    for channel in active
+                }
+                outputs = {channel: future.result() for channel, future in futures.items()}
+        
+        metrics.increment("channels_transcribed_total", len(active))
+        metrics.increment("channels_skipped_silent_total", len(skipped))
+        set_trace_attribute("audio.channels", len(channel_audio))
+        logger.info(get_log_message(
+            "SERVICE", "CHANNELS_SPLIT", active=active, skipped=skipped
+        ), extra=SAMPLED)
+        
+        if outputs:
+            # 대표 언어는 감지 확률이 가장 높은 채널 기준
+            _, language, language_probability, _ = max(outputs.values(), key=lambda output: output[2])
+        else:
+            language, language_probability = settings.WHISPER_LANGUAGE or "unknown", 0.0
+        
+        segments = SegmentBuffer.from_channels([(channel, outputs[channel][0]) for channel in active])
+        translation = None
+        if any(output[3] is not None for output in outputs.values()):
+            translation = SegmentBuffer.from_channels([(channel, outputs[channel][3] or []) for channel in active])
+        result = self._build_result([], language, language_probability, segments=segments, translation=translation)
+        result["channels"] = [
+            {
+                "channel": channel,
+                "skipped": channel in skipped,
+                "language": outputs[channel][1] if channel in outputs else None,
+                "segments_count": len(outputs[channel][0]) if channel in outputs else 0
+            }
+            for channel in channels
+        ]
+        return result
+    
+    def _is_silent(self, audio: Any) -> bool:
+        """Cheap RMS check used to skip silent channels before inference"""
+        import numpy as np
+        
+        if len(audio) == 0:
+            return True
+        return float(np.sqrt(np.mean(np.square(audio, dtype=np.float64)))) < settings.CHANNEL_SILENCE_RMS
+    
+    def _transcribe_with_model(self, model, audio: Any, target_language: Optional[str] = None,
+                               prompt_options: Optional[Dict[str, Any]] = None,
+                               task: str = "transcribe") -> Tuple[List[Any], str, float]:
+        """Transcribe decoded PCM with a pinned model"""
+        with span("inference", task=task):
+            segments, info = model.transcribe(audio, **self._decode_options(target_language, prompt_options, task))
+            # Convert generator to list (세그먼트 생성기를 소비하는 동안 실제 디코딩 수행)
+            segments_list = list(segments)
+        
+        if target_language:
+            # 언어가 고정되었으므로 결과의 언어 정보를 고정된 언어로 설정
+            return segments_list, target_language, 1.0  # 고정된 언어이므로 확률을 1.0으로 설정
+        return segments_list, info.language, info.language_probability
+    
+    def _transcribe_assisted(self, model, draft_model, audio: Any, target_language: Optional[str] = None,
+                             prompt_options: Optional[Dict[str, Any]] = None,
+                             draft_prompt_options: Optional[Dict[str, Any]] = None,
+                             task: str = "transcribe") -> Tuple[List[Any], str, float]:
+        """Transcribe with the draft model and re-decode low-confidence spans with the main model"""
+        # 두 모델이 같은 PCM을 공유 (디코딩은 호출 측에서 한 번만 수행)
+        draft_options = self._decode_options(target_language, draft_prompt_options, task)
+        draft_options["beam_size"] = settings.DRAFT_BEAM_SIZE
+        with span("draft_inference", model=settings.DRAFT_MODEL):
+            segments, info = draft_model.transcribe(audio, **draft_options)
+            draft_segments = list(segments)
+        
+        detected_language = target_language or info.language
+        language_probability = 1.0 if target_language else info.language_probability
+        
+        accepted, clips = plan_verification(draft_segments)
+        verified: List[Any] = []
+        if clips:
+            # 초안 모델의 언어 감지 결과를 재사용하여 기본 모델의 언어 감지를 생략
+            options = self._decode_options(target_language, prompt_options, task)
+            options["language"] = detected_language
+            with span("inference", clips=len(clips) // 2):
+                segments, _ = model.transcribe(audio, clip_timestamps=clips, **options)
+                verified = list(segments)
+        
+        self._record_assisted_metrics(draft_segments, accepted, clips, info.duration)
+        return merge_segments(accepted, verified), detected_language, language_probability
+    
+    def _translate_with_model(self, model, audio: Any, source_language: str,
+                              prompt_options: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """Translate decoded PCM to English, reusing the detected source language"""
+        with span("translate_inference"):
+            segments, _ = model.transcribe(audio, **self._decode_options(source_language, prompt_options, "translate"))
+            return list(segments)
+    
+    def _record_assisted_metrics(self, draft_segments: List[Any], accepted: List[Any], clips: List[float], duration: float) -> None:
+        """Update draft accept-rate metrics"""
+        verified_seconds = sum(clips[i + 1] - clips[i] for i in range(0, len(clips), 2))
+        drafted = metrics.increment("assisted_segments_drafted_total", len(draft_segments))
+        accepted_total = metrics.increment("assisted_segments_accepted_total", len(accepted))
+        metrics.increment("assisted_requests_total")
+        metrics.increment("assisted_audio_seconds_total", duration)
+        metrics.increment("assisted_verified_seconds_total", verified_seconds)
+        if drafted:
+            metrics.set_gauge("assisted_accept_rate", accepted_total / drafted)
+        logger.info(get_log_message(
+            "SERVICE", "ASSISTED_DECODING_COMPLETED",
+            accepted=len(accepted), drafted=len(draft_segments), verified=round(verified_seconds, 2)
+        ), extra=SAMPLED)
     
     def cleanup_file(self, file_path: str) -> None:
         """Clean up temporary file"""
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
-                logger.info(get_log_message("SERVICE", "FILE_CLEANED", filepath=file_path))
+                logger.info(get_log_message("SERVICE", "FILE_CLEANED", filepath=file_path), extra=SAMPLED)
         except Exception as e:
             logger.warning(get_log_message("SERVICE", "FILE_CLEANUP_FAILED", filepath=file_path, error=str(e)))
             # 파일 정리 실패는 경고만 하고 예외를 발생시키지 않음
     
-    async def process_audio_file(self, file: UploadFile, language: Optional[str] = None) -> Dict[str, Any]:
+    async def process_audio_file(self, file: UploadFile, language: Optional[str] = None,
+                                 prompt: Optional[PromptSpec] = None, split_channels: bool = False,
+                                 task: str = "transcribe") -> Dict[str, Any]:
         """Process uploaded audio file"""
         start_time = time.time()
+        file_path, content_hash = self.accept_upload(file)
+        result = await self.transcribe_saved_file(file_path, content_hash, language, prompt, split_channels, task)
+        
+        # Add processing time
+        processing_time = time.time() - start_time
+        result["processing_time"] = round(processing_time, 3)
+        
+        # Add file info
+        result["file_info"] = self.describe_upload(file)
+        
+        return result
+    
+    def accept_upload(self, file: UploadFile) -> Tuple[str, str]:
+        """Validate and save an upload, returning (file_path, content_hash)"""
+        set_trace_attribute("audio.filename", file.filename)
+        set_trace_attribute("audio.content_type", file.content_type)
+        set_trace_attribute("audio.size", getattr(file, 'size', None))
         
         # Validate file
-        self.validate_file(file)
+        with span("validate"):
+            self.validate_file(file)
         
         # Save file
-        file_path = self.save_uploaded_file(file)
+        with span("save"):
+            return self.save_uploaded_file(file)
+    
+    @staticmethod
+    def describe_upload(file: UploadFile) -> Dict[str, Any]:
+        return {
+            "filename": file.filename,
+            "content_type": file.content_type,
+            "size": getattr(file, 'size', None)
+        }
+    
+    async def transcribe_saved_file(self, file_path: str, content_hash: str, language: Optional[str] = None,
+                                    prompt: Optional[PromptSpec] = None, split_channels: bool = False,
+                                    task: str = "transcribe") -> Dict[str, Any]:
+        """
+        Transcribe a saved upload and remove it afterwards
+        
+        요청 처리 중이든 백그라운드 작업이든 같은 경로를 사용하므로 동일한 오디오의 요청은 함께 합쳐집니다.
+        """
+        if settings.COALESCING_ENABLED:
+            # 같은 오디오·같은 디코딩 조건의 요청이 진행 중이면 그 결과를 함께 받음
+            inflight, joined = self.transcriptions.join_or_start(
+                self._coalescing_key(content_hash, language, prompt, split_channels, task),
+                lambda: self._transcribe_file(file_path, language, prompt, split_channels, task)
+            )
+            if joined:
+                self.cleanup_file(file_path)
+                set_trace_attribute("coalesced", True)
+            # 먼저 시작한 요청이 취소되어도 작업은 계속되어야 하므로 shield로 대기
+            result = dict(await asyncio.shield(inflight))
+        else:
+            result = await self._transcribe_file(file_path, language, prompt, split_channels, task)
+        
+        set_trace_attribute("audio.language", result["language"])
+        set_trace_attribute("transcription.segments_count", result["segments_count"])
+        return result
+    
+    async def transcribe_segments(self, file: UploadFile, language: Optional[str] = None,
+                                  prompt: Optional[PromptSpec] = None, split_channels: bool = False,
+                                  task: str = "transcribe") -> SegmentStream:
+        """
+        Transcribe an upload and return its segments as an iterator (감지된 언어 포함)
+        
+        단일 채널·단일 작업이고 보조 디코딩을 쓰지 않는 경우 세그먼트가 디코딩되는 대로 반환되어
+        결과 전체를 메모리에 모으지 않습니다. 채널 분리, task=both, 보조 디코딩은 모든 세그먼트가
+        필요하므로 스트리밍하지 않고 변환을 마친 뒤 시간순 세그먼트를 반환합니다 (채널 분리 시 채널 번호 포함).
+        """
+        if split_channels or task == "both" or self.draft_models.active is not None:
+            result = await self.process_audio_file(file, language, prompt, split_channels, task)
+            buffer = result["segments"]
+            channels = buffer.channels if buffer.channels is not None else itertools.repeat(None)
+            return SegmentStream(
+                (
+                    TranscriptionSegment(start=start, end=end, text=text, confidence=confidence, channel=channel)
+                    for (start, end, text, confidence), channel in zip(buffer, channels)
+                ),
+                result["language"], result["language_probability"]
+            )
+        
+        set_trace_attribute("streaming", True)
+        file_path, _ = self.accept_upload(file)
         
         try:
-            # Transcribe audio
-            result = self.transcribe_audio(file_path, language)
-            
-            # Add processing time
-            processing_time = time.time() - start_time
-            result["processing_time"] = round(processing_time, 3)
-            
-            # Add file info
-            result["file_info"] = {
-                "filename": file.filename,
-                "content_type": file.content_type,
-                "size": getattr(file, 'size', None)
-            }
-            
-            return result
+            # 모델 확보, 오디오 디코딩, 언어 감지까지 마친 뒤 반환하여 이 단계의 오류는 일반 에러 응답으로 처리
+            return await run_in_threadpool(self._start_segment_stream, file_path, language, prompt, task)
+        except Exception:
+            self.cleanup_file(file_path)
+            raise
+    
+    def _start_segment_stream(self, audio_path: str, language: Optional[str], prompt: Optional[PromptSpec],
+                              task: str) -> SegmentStream:
+        """Pin the model and start decoding; segments are produced lazily"""
+        prompt = prompt or PromptSpec()
+        stream = SegmentStream()
+        stack = ExitStack()
+        slot = stack.enter_context(self.models.acquire())
+        try:
+            set_trace_attribute("model", slot.config.model)
+            logger.info(get_log_message("SERVICE", "TRANSCRIPTION_STARTED", filepath=audio_path), extra=SAMPLED)
+            target_language = language or settings.WHISPER_LANGUAGE
+            model = slot.model
+            prompt_options = prompt.decode_options(model, ("main", slot.generation))
+            nbytes = self._whole_decode_bytes(audio_path)
+            if nbytes is None:
+                # 긴 오디오는 창 하나 크기의 버퍼만 예약하고 스트림을 소비하는 동안 창 단위로 디코딩
+                stack.enter_context(audio_budget.reserve(settings.AUDIO_WINDOW_SECONDS * SAMPLE_RATE * PCM_BYTES_PER_SAMPLE))
+                metrics.increment("audio_windowed_requests_total")
+                segments = self._stream_windows(model, audio_path, target_language, prompt_options, task, stream)
+            else:
+                reservation = stack.enter_context(audio_budget.reserve(nbytes))
+                audio = self._decode_audio(audio_path)
+                reservation.resize(audio.nbytes)
+                with span("inference_setup", task=task):
+                    segments, info = model.transcribe(audio, **self._decode_options(target_language, prompt_options, task))
+                stream.set_info(info)
+                set_trace_attribute("audio.language", target_language or info.language)
+        except AudioBufferException:
+            stack.close()
+            raise
+        except Exception as e:
+            stack.close()
+            logger.error(get_log_message("SERVICE", "TRANSCRIPTION_FAILED", error=str(e)))
+            raise TranscriptionException(get_error_message("MODEL", "TRANSCRIPTION_FAILED"))
+        
+        stream.segments = self._iterate_segments(segments, stack, audio_path)
+        return stream
+    
+    def _iterate_segments(self, segments: Iterator[Any], stack: ExitStack, audio_path: str) -> Iterator[TranscriptionSegment]:
+        """Yield decoded segments, releasing the model and upload when the stream ends"""
+        count = 0
+        try:
+            for segment in segments:
+                count += 1
+                yield TranscriptionSegment(
+                    start=segment.start, end=segment.end, text=segment.text, confidence=segment_confidence(segment)
+                )
+            logger.info(get_log_message("SERVICE", "STREAM_COMPLETED", segments=count), extra=SAMPLED)
+        except Exception as e:
+            # 응답 헤더가 이미 전송되었으므로 스트림을 중단하고 로그만 남김
+            metrics.increment("stream_failures_total")
+            logger.error(get_log_message("SERVICE", "TRANSCRIPTION_FAILED", error=str(e)))
+        finally:
+            stack.close()
+            self.cleanup_file(audio_path)
+            set_trace_attribute("transcription.segments_count", count)
+    
+    def _coalescing_key(self, content_hash: str, language: Optional[str], prompt: Optional[PromptSpec] = None,
+                        split_channels: bool = False, task: str = "transcribe") -> str:
+        """Key identifying identical transcription work"""
+        active = self.models.active
+        generation = active.generation if active else 0
+        prompt_key = prompt.cache_key() if prompt else ""
+        channels = "split" if split_channels else "mix"
+        return f"{content_hash}:{language or settings.WHISPER_LANGUAGE or ''}:{prompt_key}:{channels}:{task}:{generation}"
+    
+    async def _transcribe_file(self, file_path: str, language: Optional[str] = None,
+                               prompt: Optional[PromptSpec] = None, split_channels: bool = False,
+                               task: str = "transcribe") -> Dict[str, Any]:
+        """Transcribe a saved file and remove it afterwards"""
+        try:
+            # Transcribe audio (모델 추론은 이벤트 루프를 막지 않도록 스레드풀에서 실행)
+            return await run_in_threadpool(self.transcribe_audio, file_path, language, prompt, split_channels, task)
         finally:
             # Cleanup file
             self.cleanup_file(file_path)
 
 # Global STT service instance
-stt_service = STTService() 
\ No newline at end of file
+stt_service = STTService()
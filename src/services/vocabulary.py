@@ -0,0 +1,218 @@
+"""
+Vocabulary Registry
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from src.core.config import settings
+from src.utils.logger import get_logger
+from src.utils.exceptions import VocabularyException
+from src.utils.error_messages import get_error_message
+from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+# 프롬프트 토큰 상한 (hotwords 토큰과 함께 쓰여도 디코더 최대 길이 448을 넘지 않도록 제한)
+MAX_PROMPT_TOKENS = 200
+
+
+class VocabularySet:
+    """이름이 붙은 사용자 어휘 목록"""
+
+    def __init__(self, name: str, terms: List[str], version: int = 1,
+                 tenant_id: Optional[str] = None, created_at: Optional[float] = None):
+        self.name = name
+        self.terms = terms
+        self.version = version
+        self.tenant_id = tenant_id
+        self.created_at = created_at or time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "terms": self.terms,
+            "version": self.version,
+            "tenant_id": self.tenant_id,
+            "created_at": self.created_at
+        }
+
+
+class VocabularyRegistry:
+    """
+    어휘 목록 저장소 및 토큰화된 프롬프트 캐시
+
+    어휘 목록은 등록 시 한 번만 정규화하고, 모델별 토큰화 결과를 캐시하여
+    요청마다 긴 프롬프트를 다시 토큰화하지 않습니다.
+    """
+
+    def __init__(self, store_path: Optional[str] = None, cache_size: int = 256):
+        self._lock = threading.Lock()
+        self._sets: Dict[str, VocabularySet] = {}
+        self._tenant_defaults: Dict[str, str] = {}
+        self._prompt_cache: "OrderedDict[Tuple, List[int]]" = OrderedDict()
+        self._cache_size = cache_size
+        self.store_path = store_path
+        if store_path:
+            self._load()
+
+    def register(self, name: str, terms: List[str], tenant_id: Optional[str] = None) -> VocabularySet:
+        """Register or replace a vocabulary set"""
+        normalized = list(dict.fromkeys(term.strip() for term in terms if term and term.strip()))
+        if not normalized or len(normalized) > settings.VOCABULARY_MAX_TERMS:
+            raise VocabularyException(
+                get_error_message("API", "INVALID_VOCABULARY", max_terms=settings.VOCABULARY_MAX_TERMS)
+            )
+
+        with self._lock:
+            previous = self._sets.get(name)
+            vocabulary = VocabularySet(name, normalized, version=previous.version + 1 if previous else 1, tenant_id=tenant_id)
+            self._sets[name] = vocabulary
+            if tenant_id:
+                self._tenant_defaults[tenant_id] = name
+            self._save()
+
+        logger.info(get_log_message("SERVICE", "VOCABULARY_REGISTERED", name=name, terms=len(normalized), version=vocabulary.version))
+        return vocabulary
+
+    def get(self, name: str) -> VocabularySet:
+        vocabulary = self._sets.get(name)
+        if vocabulary is None:
+            raise VocabularyException(get_error_message("API", "VOCABULARY_NOT_FOUND", name=name), status_code=404)
+        return vocabulary
+
+    def list(self) -> List[VocabularySet]:
+        return list(self._sets.values())
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            if self._sets.pop(name, None) is None:
+                raise VocabularyException(get_error_message("API", "VOCABULARY_NOT_FOUND", name=name), status_code=404)
+            for tenant_id in [t for t, n in self._tenant_defaults.items() if n == name]:
+                del self._tenant_defaults[tenant_id]
+            self._save()
+
+    def resolve(self, name: Optional[str], tenant_id: Optional[str]) -> Optional[VocabularySet]:
+        """Pick the vocabulary for a request: explicit name first, then tenant default"""
+        if name:
+            return self.get(name)
+        if tenant_id and tenant_id in self._tenant_defaults:
+            return self._sets.get(self._tenant_defaults[tenant_id])
+        return None
+
+    def prompt_tokens(self, vocabulary: VocabularySet, tokenizer: Any, model_key: Tuple) -> List[int]:
+        """
+        Tokenized prompt for a vocabulary set, cached per model
+
+        Args:
+            vocabulary: 어휘 목록
+            tokenizer: 모델의 tokenizers.Tokenizer (WhisperModel.hf_tokenizer)
+            model_key: 토크나이저를 구분하는 키 (모델 교체 시 캐시 무효화)
+        """
+        key = (vocabulary.name, vocabulary.version, *model_key)
+        with self._lock:
+            tokens = self._prompt_cache.get(key)
+            if tokens is not None:
+                self._prompt_cache.move_to_end(key)
+                metrics.increment("vocabulary_prompt_cache_hits_total")
+                return tokens
+
+        metrics.increment("vocabulary_prompt_cache_misses_total")
+        tokens = []
+        # 용어 경계에서 잘라 프롬프트 길이 제한을 넘지 않도록 용어 단위로 토큰화
+        for term in vocabulary.terms:
+            term_tokens = tokenizer.encode(f" {term},", add_special_tokens=False).ids
+            if len(tokens) + len(term_tokens) > MAX_PROMPT_TOKENS:
+                break
+            tokens.extend(term_tokens)
+
+        with self._lock:
+            self._prompt_cache[key] = tokens
+            while len(self._prompt_cache) > self._cache_size:
+                self._prompt_cache.popitem(last=False)
+        return tokens
+
+    def _load(self) -> None:
+        if not os.path.exists(self.store_path):
+            return
+        with open(self.store_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for item in data.get("vocabularies", []):
+            self._sets[item["name"]] = VocabularySet(**item)
+        self._tenant_defaults = data.get("tenant_defaults", {})
+
+    def _save(self) -> None:
+        if not self.store_path:
+            return
+        parent = os.path.dirname(self.store_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        tmp_path = f"{self.store_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "vocabularies": [vocabulary.to_dict() for vocabulary in self._sets.values()],
+                "tenant_defaults": self._tenant_defaults
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.store_path)
+
+
+class PromptSpec:
+    """
+    요청 하나에 적용할 프롬프트 조건
+
+    - vocabulary: 등록된 어휘 목록 (캐시된 토큰으로 initial_prompt 구성)
+    - initial_prompt: 요청별 자유 텍스트 프롬프트 (어휘 목록 뒤에 이어 붙임)
+    - hotwords: 요청별 핫워드 (faster-whisper가 모든 30초 구간에 적용)
+    """
+
+    def __init__(self, vocabulary: Optional[VocabularySet] = None,
+                 initial_prompt: Optional[str] = None, hotwords: Optional[str] = None):
+        self.vocabulary = vocabulary
+        self.initial_prompt = initial_prompt.strip() if initial_prompt and initial_prompt.strip() else None
+        self.hotwords = hotwords.strip() if hotwords and hotwords.strip() else None
+
+    def __bool__(self) -> bool:
+        return bool(self.vocabulary or self.initial_prompt or self.hotwords)
+
+    @property
+    def vocabulary_name(self) -> Optional[str]:
+        return self.vocabulary.name if self.vocabulary else None
+
+    def cache_key(self) -> str:
+        """Key distinguishing decode results for request coalescing"""
+        if not self:
+            return ""
+        vocabulary = f"{self.vocabulary.name}@{self.vocabulary.version}" if self.vocabulary else ""
+        raw = "\x1f".join([vocabulary, self.initial_prompt or "", self.hotwords or ""])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+    def decode_options(self, model: Any, model_key: Tuple) -> Dict[str, Any]:
+        """
+        Build transcribe() prompt options for a model
+
+        Args:
+            model: WhisperModel (hf_tokenizer 사용)
+            model_key: 토크나이저 캐시 키 (모델 구분 및 세대)
+        """
+        options: Dict[str, Any] = {}
+        if self.hotwords:
+            options["hotwords"] = self.hotwords
+        if self.vocabulary is None:
+            if self.initial_prompt:
+                options["initial_prompt"] = self.initial_prompt
+            return options
+
+        tokens = vocabulary_registry.prompt_tokens(self.vocabulary, model.hf_tokenizer, model_key)
+        if self.initial_prompt:
+            extra = model.hf_tokenizer.encode(" " + self.initial_prompt, add_special_tokens=False).ids
+            tokens = (tokens + extra)[:MAX_PROMPT_TOKENS]
+        options["initial_prompt"] = tokens
+        return options
+
+
+# Global vocabulary registry instance
+vocabulary_registry = VocabularyRegistry(settings.VOCABULARY_STORE_PATH)
@@ -0,0 +1,60 @@
+"""
+Webhook Transport
+"""
+import socket
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import create_connection
+from src.services.webhooks import is_allowed_host, resolve_callback_address
+
+
+class _PinnedConnectionMixin:
+    """
+    검사한 주소로만 연결하는 urllib3 연결
+
+    urllib3는 연결할 때 이름을 다시 해석하므로, 검사 후 DNS 응답을 바꾸는(DNS rebinding) 호스트는
+    검사를 통과한 뒤 내부 주소로 연결될 수 있습니다. 연결 직전에 해석·검사한 주소로 소켓을 직접 열고,
+    Host 헤더와 TLS SNI·인증서 검증에는 원래 호스트 이름(self.host)을 그대로 사용합니다.
+    """
+
+    def _new_conn(self):
+        if is_allowed_host(self.host):
+            return super()._new_conn()
+        try:
+            address = resolve_callback_address(self.host, self.port)
+            return create_connection(
+                (address, self.port), self.timeout, source_address=self.source_address, socket_options=self.socket_options
+            )
+        except socket.timeout as e:
+            raise ConnectTimeoutError(self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})") from e
+        except OSError as e:
+            raise NewConnectionError(self, f"Failed to establish a new connection: {e}") from e
+
+
+class PinnedHTTPConnection(_PinnedConnectionMixin, HTTPConnection):
+    pass
+
+
+class PinnedHTTPSConnection(_PinnedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class PinnedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = PinnedHTTPConnection
+
+
+class PinnedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = PinnedHTTPSConnection
+
+
+class PinnedHTTPAdapter(HTTPAdapter):
+    """Connection pools whose connections are pinned to a checked public address"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": PinnedHTTPConnectionPool,
+            "https": PinnedHTTPSConnectionPool
+        }
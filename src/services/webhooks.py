@@ -0,0 +1,280 @@
+"""
+Webhook Delivery
+"""
+import hashlib
+import heapq
+import hmac
+import ipaddress
+import itertools
+import random
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+from src.core.config import settings
+from src.utils.logger import get_logger, SAMPLED
+from src.utils.exceptions import JobException
+from src.utils.error_messages import get_error_message
+from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+JOB_ID_HEADER = "X-STT-Job-ID"
+SIGNATURE_HEADER = "X-STT-Signature"
+ATTEMPT_HEADER = "X-STT-Delivery-Attempt"
+
+DELIVERY_PENDING = "pending"
+DELIVERY_DELIVERED = "delivered"
+DELIVERY_FAILED = "failed"
+
+# 연결 오류와 5xx 외에 재시도할 응답 (그 밖의 4xx·3xx는 다시 보내도 결과가 같으므로 즉시 포기)
+RETRYABLE_STATUS_CODES = {408, 425, 429}
+
+
+def validate_callback_url(url: str) -> str:
+    """
+    Reject non-http(s) URLs, hosts outside JOB_CALLBACK_ALLOWED_HOSTS and internal addresses
+
+    허용 목록에 명시한 호스트가 아니면 이름을 해석하여 루프백·사설·링크 로컬 등 내부 주소로 향하는 URL을 거절합니다
+    (API 호출자가 서버를 통해 메타데이터 서비스나 내부 서비스로 요청을 보내지 못하도록).
+    """
+    parts = urlsplit(url)
+    try:
+        valid_port = parts.port is None or parts.port > 0
+    except ValueError:  # 숫자가 아니거나 범위를 벗어난 포트
+        valid_port = False
+    if parts.scheme not in ("http", "https") or not parts.hostname or not valid_port:
+        raise JobException(get_error_message("API", "INVALID_CALLBACK_URL", url=url), status_code=400)
+    allowed = {host.lower() for host in settings.JOB_CALLBACK_ALLOWED_HOSTS}
+    if allowed and parts.hostname.lower() not in allowed:
+        raise JobException(get_error_message("API", "CALLBACK_HOST_NOT_ALLOWED", host=parts.hostname), status_code=400)
+    try:
+        check_callback_address(url)
+    except OSError:
+        raise JobException(get_error_message("API", "CALLBACK_HOST_UNRESOLVED", host=parts.hostname), status_code=400)
+    return url
+
+
+def check_callback_address(url: str) -> None:
+    """
+    Raise JobException if the URL's host resolves to a non-public address
+
+    JOB_CALLBACK_ALLOWED_HOSTS에 명시한 호스트는 검사하지 않습니다. 이름 해석 실패는 OSError로 전달됩니다.
+    """
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if not is_allowed_host(host):
+        resolve_callback_address(host, parts.port or (443 if parts.scheme == "https" else 80))
+
+
+def is_allowed_host(host: str) -> bool:
+    """Whether the host is listed in JOB_CALLBACK_ALLOWED_HOSTS (exempt from the address check)"""
+    return host.lower() in {allowed.lower() for allowed in settings.JOB_CALLBACK_ALLOWED_HOSTS}
+
+
+def resolve_callback_address(host: str, port: int) -> str:
+    """
+    Resolve the host and return the address to connect to
+
+    해석된 주소가 하나라도 공개 주소가 아니면 JobException을 발생시킵니다.
+    전송 시에는 여기서 반환한 주소로 직접 연결하여 검사와 연결 사이에 DNS 응답이 바뀌어도 내부 주소로 보내지 않습니다.
+    """
+    addresses = []
+    for *_, sockaddr in socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP):
+        address = ipaddress.ip_address(sockaddr[0].split("%", 1)[0])
+        if address.version == 6 and address.ipv4_mapped is not None:
+            address = address.ipv4_mapped
+        # is_global이 아니면 루프백, 사설(10/8, 172.16/12, 192.168/16, fc00::/7), 링크 로컬(169.254/16), CGNAT 등
+        if not address.is_global or address.is_multicast:
+            raise JobException(
+                get_error_message("API", "CALLBACK_ADDRESS_NOT_ALLOWED", host=host, address=str(address)), status_code=400
+            )
+        addresses.append(str(address))
+    return addresses[0]
+
+
+def sign_body(body: bytes, secret: str) -> str:
+    """HMAC-SHA256 signature sent in the X-STT-Signature header"""
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def backoff_delay(attempts: int, retry_after: Optional[float] = None) -> float:
+    """
+    Wait before the next attempt after `attempts` failures
+
+    시도마다 2배로 늘리고 0.5~1배 지터를 적용하여 수신 서버가 복구될 때 재시도가 몰리지 않게 합니다.
+    수신 서버가 Retry-After를 보냈으면 그보다 일찍 보내지 않습니다.
+    """
+    delay = min(settings.JOB_CALLBACK_BACKOFF_MAX, settings.JOB_CALLBACK_BACKOFF * 2 ** (attempts - 1))
+    delay *= random.uniform(0.5, 1.0)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, settings.JOB_CALLBACK_BACKOFF_MAX))
+    return delay
+
+
+class Delivery:
+    """
+    웹훅 하나의 전송 상태
+
+    본문(body)은 작업 결과에서 다시 만들 수 있으므로 저장하지 않습니다.
+    """
+
+    def __init__(self, job_id: str, url: str, body: bytes = b"", attempts: int = 0, status: str = DELIVERY_PENDING,
+                 last_status_code: Optional[int] = None, last_error: Optional[str] = None):
+        self.job_id = job_id
+        self.url = url
+        self.body = body
+        self.attempts = attempts
+        self.status = status
+        self.last_status_code = last_status_code
+        self.last_error = last_error
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "attempts": self.attempts,
+            "last_status_code": self.last_status_code,
+            "last_error": self.last_error
+        }
+
+
+class WebhookDispatcher:
+    """
+    재시도 일정을 관리하며 웹훅을 전송하는 클래스
+
+    일정 스레드 하나가 다음 전송 시각까지 기다렸다가 전송 스레드 풀(JOB_CALLBACK_WORKERS)에 넘기고,
+    모든 전송은 연결 풀을 가진 requests.Session 하나를 공유하여 같은 수신 서버로의 연결을 재사용합니다.
+    새 연결은 이름을 해석·검사한 주소로만 맺습니다 (webhook_transport.PinnedHTTPAdapter).
+    재시도 대기 중에는 스레드를 점유하지 않습니다.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self._heap: List[Tuple[float, int, Delivery]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._stopped = False
+
+    def schedule(self, delivery: Delivery, delay: float = 0.0) -> Delivery:
+        """Queue an attempt `delay` seconds from now"""
+        with self._condition:
+            if not self._stopped:
+                self._ensure_worker()
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._sequence), delivery))
+            metrics.set_gauge("callbacks_pending", len(self._heap))
+            self._condition.notify()
+        return delivery
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._heap)
+
+    def stop(self) -> None:
+        """Stop scheduling for good; deliveries still waiting stay pending"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="webhook")
+        self._thread = threading.Thread(target=self._run, name="webhook-scheduler", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    self._condition.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                if self._stopped:
+                    return
+                _, _, delivery = heapq.heappop(self._heap)
+                metrics.set_gauge("callbacks_pending", len(self._heap))
+                executor = self._executor
+            executor.submit(self._attempt, delivery)
+
+    def _client(self):
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from src.services.webhook_transport import PinnedHTTPAdapter
+                    session = requests.Session()
+                    # 환경 변수의 프록시를 거치면 프록시가 이름을 다시 해석하므로 사용하지 않음
+                    session.trust_env = False
+                    adapter = PinnedHTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    session.headers["User-Agent"] = f"{settings.TRACE_SERVICE_NAME}-webhook"
+                    self._session = session
+        return self._session
+
+    def _attempt(self, delivery: Delivery) -> None:
+        delivery.attempts += 1
+        headers = {
+            "Content-Type": "application/json",
+            JOB_ID_HEADER: delivery.job_id,
+            ATTEMPT_HEADER: str(delivery.attempts)
+        }
+        if settings.JOB_CALLBACK_SECRET:
+            headers[SIGNATURE_HEADER] = sign_body(delivery.body, settings.JOB_CALLBACK_SECRET)
+
+        status_code, retry_after, error, blocked = None, None, None, False
+        try:
+            # 리다이렉트를 따라가면 허용 호스트 검사를 우회할 수 있으므로 따라가지 않음
+            with self._client().post(delivery.url, data=delivery.body, headers=headers,
+                                     timeout=settings.JOB_CALLBACK_TIMEOUT, allow_redirects=False) as response:
+                status_code = response.status_code
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        except JobException as e:
+            # 연결 시 다시 해석한 주소가 내부 주소 (접수 이후 DNS 응답이 바뀐 경우)
+            error, blocked = e.message, True
+        except Exception as e:
+            error = str(e)
+
+        delivery.last_status_code = status_code
+        if status_code is not None and 200 <= status_code < 300:
+            delivery.status = DELIVERY_DELIVERED
+            delivery.last_error = None
+            metrics.increment("callbacks_delivered_total")
+            logger.info(get_log_message(
+                "SERVICE", "CALLBACK_DELIVERED", job_id=delivery.job_id, status_code=status_code, attempts=delivery.attempts
+            ), extra=SAMPLED)
+            return
+
+        delivery.last_error = error or f"HTTP {status_code}"
+        retryable = not blocked and (status_code is None or status_code >= 500 or status_code in RETRYABLE_STATUS_CODES)
+        if retryable and delivery.attempts <= settings.JOB_CALLBACK_RETRIES:
+            delay = backoff_delay(delivery.attempts, retry_after)
+            metrics.increment("callback_retries_total")
+            logger.warning(get_log_message(
+                "SERVICE", "CALLBACK_RETRY", job_id=delivery.job_id, delay=round(delay, 1),
+                attempts=delivery.attempts, error=delivery.last_error
+            ))
+            self.schedule(delivery, delay)
+            return
+
+        delivery.status = DELIVERY_FAILED
+        metrics.increment("callbacks_failed_total")
+        logger.error(get_log_message(
+            "SERVICE", "CALLBACK_FAILED", job_id=delivery.job_id, attempts=delivery.attempts, error=delivery.last_error
+        ))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # HTTP 날짜 형식은 무시하고 초 단위 값만 사용
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
@@ -12,6 +12,7 @@ FILE_ERRORS = {
     "FILE_SAVE_FAILED": "파일 저장에 실패했습니다.",
     "FILE_CLEANUP_FAILED": "파일 정리 중 오류가 발생했습니다.",
     "FILE_PROCESSING_FAILED": "파일 처리 중 오류가 발생했습니다.",
+    "AUDIO_TOO_LONG_FOR_SPLIT": "채널 분리 변환은 최대 {max_minutes}분 길이의 오디오까지 지원합니다.",
 }
 
 # 모델 관련 에러 메시지
@@ -20,12 +21,18 @@ MODEL_ERRORS = {
     "MODEL_LOAD_FAILED": "모델 로드에 실패했습니다.",
     "MODEL_PACKAGE_MISSING": "faster-whisper 패키지가 설치되지 않았습니다.",
     "TRANSCRIPTION_FAILED": "음성 변환에 실패했습니다.",
+    "MODEL_SWAP_IN_PROGRESS": "모델 교체가 이미 진행 중입니다.",
 }
 
 # 서버 관련 에러 메시지
 SERVER_ERRORS = {
     "INTERNAL_ERROR": "내부 서버 오류가 발생했습니다.",
     "SERVICE_UNAVAILABLE": "서비스를 사용할 수 없습니다.",
+    "SERVICE_SHUTTING_DOWN": "서버가 종료 중입니다. 잠시 후 다시 시도해 주세요.",
+    "NO_WORKER_AVAILABLE": "요청을 처리할 수 있는 워커가 없습니다.",
+    "NO_WORKER_WITH_MODEL": "모델 {model}을(를) 로드한 워커가 없습니다.",
+    "WORKER_UNREACHABLE": "워커에 연결할 수 없습니다: {node}",
+    "AUDIO_MEMORY_EXHAUSTED": "오디오 처리 메모리가 부족합니다. 잠시 후 다시 시도해 주세요.",
     "CONFIGURATION_ERROR": "설정 오류가 발생했습니다.",
     "VALIDATION_ERROR": "입력 데이터 검증에 실패했습니다.",
 }
@@ -36,6 +43,22 @@ API_ERRORS = {
     "METHOD_NOT_ALLOWED": "허용되지 않는 HTTP 메서드입니다.",
     "NOT_FOUND": "요청한 리소스를 찾을 수 없습니다.",
     "RATE_LIMIT_EXCEEDED": "요청 한도를 초과했습니다.",
+    "NOT_ACCEPTABLE": "지원하지 않는 응답 형식입니다. 지원 형식: {formats}",
+    "ADMIN_DISABLED": "관리자 API가 비활성화되어 있습니다.",
+    "ADMIN_UNAUTHORIZED": "관리자 인증에 실패했습니다.",
+    "VOCABULARY_NOT_FOUND": "등록되지 않은 어휘 목록입니다: {name}",
+    "INVALID_VOCABULARY": "어휘 목록은 1개 이상 {max_terms}개 이하의 용어로 구성되어야 합니다.",
+    "SESSION_NOT_FOUND": "세션을 찾을 수 없거나 만료되었습니다: {session_id}",
+    "PROFILE_IN_PROGRESS": "이미 프로파일링이 진행 중입니다: {kind}",
+    "JOB_NOT_FOUND": "작업을 찾을 수 없거나 결과 보관 기간이 지났습니다: {job_id}",
+    "JOB_QUEUE_FULL": "대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도해 주세요. (최대 {max_queued}개)",
+    "INVALID_CALLBACK_URL": "callback_url은 http 또는 https URL이어야 합니다: {url}",
+    "CALLBACK_HOST_NOT_ALLOWED": "허용되지 않은 callback_url 호스트입니다: {host}",
+    "CALLBACK_HOST_UNRESOLVED": "callback_url 호스트의 주소를 찾을 수 없습니다: {host}",
+    "CALLBACK_ADDRESS_NOT_ALLOWED": "callback_url 호스트가 내부 네트워크 주소로 연결됩니다: {host} ({address}). 필요하면 JOB_CALLBACK_ALLOWED_HOSTS에 추가하세요.",
+    "CALLBACK_FORMAT_UNSUPPORTED": "callback_url은 format=json 요청에서만 사용할 수 있습니다.",
+    "CLUSTER_UNAUTHORIZED": "클러스터 내부 토큰이 올바르지 않습니다.",
+    "UNKNOWN_NODE": "등록되지 않은 워커입니다: {node}",
 }
 
 # 성공 메시지
@@ -25,7 +25,7 @@ async def stt_exception_handler(request: Request, exc: STTException) -> JSONResp
     
     return JSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump()
+        content=error_response.model_dump(mode="json")
     )
 
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
@@ -40,7 +40,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     
     return JSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump()
+        content=error_response.model_dump(mode="json")
     )
 
 async def validation_exception_handler(request: Request, exc: Exception) -> JSONResponse:
@@ -56,7 +56,7 @@ async def validation_exception_handler(request: Request, exc: Exception) -> JSON
     
     return JSONResponse(
         status_code=422,
-        content=error_response.model_dump()
+        content=error_response.model_dump(mode="json")
     )
 
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
@@ -71,7 +71,7 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
     
     return JSONResponse(
         status_code=500,
-        content=error_response.model_dump()
+        content=error_response.model_dump(mode="json")
     )
 
 def register_exception_handlers(app):
@@ -79,7 +79,9 @@ def register_exception_handlers(app):
     from src.utils.exceptions import (
         STTException, ModelNotLoadedException, FileValidationException,
         TranscriptionException, FileProcessingException, ConfigurationException,
-        ServiceUnavailableException
+        ServiceUnavailableException, ModelSwapException, AdminAccessDeniedException,
+        NotAcceptableException, VocabularyException, AudioBufferException,
+        SessionException, ProfilingException, JobException, DispatchException
     )
     
     # 커스텀 예외 핸들러들
@@ -90,6 +92,15 @@ def register_exception_handlers(app):
     app.add_exception_handler(FileProcessingException, stt_exception_handler)
     app.add_exception_handler(ConfigurationException, stt_exception_handler)
     app.add_exception_handler(ServiceUnavailableException, stt_exception_handler)
+    app.add_exception_handler(ModelSwapException, stt_exception_handler)
+    app.add_exception_handler(AdminAccessDeniedException, stt_exception_handler)
+    app.add_exception_handler(NotAcceptableException, stt_exception_handler)
+    app.add_exception_handler(VocabularyException, stt_exception_handler)
+    app.add_exception_handler(AudioBufferException, stt_exception_handler)
+    app.add_exception_handler(SessionException, stt_exception_handler)
+    app.add_exception_handler(ProfilingException, stt_exception_handler)
+    app.add_exception_handler(JobException, stt_exception_handler)
+    app.add_exception_handler(DispatchException, stt_exception_handler)
     
     # HTTP 예외 핸들러
     app.add_exception_handler(HTTPException, http_exception_handler)
@@ -54,4 +54,66 @@ class ServiceUnavailableException(STTException):
     """서비스 사용 불가 시 발생하는 예외"""
     
     def __init__(self, message: str = "서비스를 사용할 수 없습니다."):
-        super().__init__(message, status_code=503) 
\ No newline at end of file
+        super().__init__(message, status_code=503) 
+
+class ModelSwapException(STTException):
+    """모델 교체 요청을 처리할 수 없을 때 발생하는 예외"""
+    
+    def __init__(self, message: str = "모델 교체가 이미 진행 중입니다.", status_code: int = 409):
+        super().__init__(message, status_code=status_code)
+
+
+class AdminAccessDeniedException(STTException):
+    """관리자 API 접근 권한이 없을 때 발생하는 예외"""
+    
+    def __init__(self, message: str = "관리자 권한이 필요합니다.", status_code: int = 403):
+        super().__init__(message, status_code=status_code)
+
+
+class NotAcceptableException(STTException):
+    """요청한 응답 형식을 제공할 수 없을 때 발생하는 예외"""
+    
+    def __init__(self, message: str = "지원하지 않는 응답 형식입니다.", status_code: int = 406):
+        super().__init__(message, status_code=status_code)
+
+
+class VocabularyException(STTException):
+    """어휘 목록 요청을 처리할 수 없을 때 발생하는 예외"""
+    
+    def __init__(self, message: str = "잘못된 어휘 목록입니다.", status_code: int = 400):
+        super().__init__(message, status_code=status_code)
+
+
+class AudioBufferException(STTException):
+    """디코딩 오디오 메모리 예산을 확보하지 못했을 때 발생하는 예외"""
+    
+    def __init__(self, message: str = "오디오 처리 메모리가 부족합니다.", status_code: int = 503):
+        super().__init__(message, status_code=status_code)
+
+
+class ProfilingException(STTException):
+    """프로파일링 요청을 처리할 수 없을 때 발생하는 예외"""
+    
+    def __init__(self, message: str = "이미 프로파일링이 진행 중입니다.", status_code: int = 409):
+        super().__init__(message, status_code=status_code)
+
+
+class SessionException(STTException):
+    """대화 세션을 찾을 수 없을 때 발생하는 예외"""
+    
+    def __init__(self, message: str = "세션을 찾을 수 없습니다.", status_code: int = 404):
+        super().__init__(message, status_code=status_code)
+
+
+class JobException(STTException):
+    """비동기 변환 작업을 찾을 수 없거나 접수할 수 없을 때 발생하는 예외"""
+    
+    def __init__(self, message: str = "작업을 찾을 수 없습니다.", status_code: int = 404):
+        super().__init__(message, status_code=status_code)
+
+
+class DispatchException(STTException):
+    """디스패처가 요청을 전달할 워커를 찾지 못했을 때 발생하는 예외"""
+    
+    def __init__(self, message: str = "요청을 처리할 수 있는 워커가 없습니다.", status_code: int = 503):
+        super().__init__(message, status_code=status_code)
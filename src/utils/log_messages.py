@@ -10,6 +10,9 @@ API_LOGS = {
     "REQUEST_FAILED": "요청 실패: {filename} - {error}",
     "HEALTH_CHECK": "헬스체크 요청",
     "INFO_REQUEST": "서비스 정보 요청",
+    "MODEL_SWAP_REQUESTED": "모델 교체 요청: {model}",
+    "VOCABULARY_DELETED": "어휘 목록 삭제: {name}",
+    "PROFILE_STARTED": "프로파일링 시작: {kind} ({seconds}초)",
 }
 
 # 서비스 관련 로그 메시지
@@ -19,11 +22,33 @@ SERVICE_LOGS = {
     "MODEL_LOAD_FAILED": "모델 로딩 실패: {error}",
     "FILE_SAVED": "파일 저장 완료: {filepath}",
     "FILE_SAVE_FAILED": "파일 저장 실패: {error}",
+    "SESSION_CREATED": "대화 세션 생성: {session_id}",
+    "AUDIO_WINDOWED": "긴 오디오 창 단위 변환: {windows}개 창, {duration}초",
+    "UPLOAD_TMPFS_FULL": "tmpfs 공간 부족, 디스크에 저장: {folder}",
     "TRANSCRIPTION_STARTED": "음성 변환 시작: {filepath}",
     "TRANSCRIPTION_COMPLETED": "음성 변환 완료: {language}",
     "TRANSCRIPTION_FAILED": "음성 변환 실패: {error}",
     "FILE_CLEANED": "파일 정리 완료: {filepath}",
     "FILE_CLEANUP_FAILED": "파일 정리 실패: {filepath} - {error}",
+    "MODEL_SWAP_STARTED": "모델 교체 시작: {model}",
+    "MODEL_WARMUP": "모델 워밍업 중: {model}",
+    "MODEL_SWAPPED": "모델 교체 완료: {model}",
+    "MODEL_SWAP_FAILED": "모델 교체 실패: {model} - {error}",
+    "MODEL_DRAINING": "이전 모델 요청 대기 중: {model} (진행 중: {in_flight})",
+    "MODEL_DRAIN_TIMEOUT": "이전 모델 대기 시간 초과: {model} (진행 중: {in_flight})",
+    "MODEL_RELEASED": "이전 모델 해제 완료: {model}",
+    "LANGUAGE_SET": "언어 고정: {language}",
+    "ASSISTED_DECODING_COMPLETED": "초안 디코딩 완료: 채택 {accepted}/{drafted} 세그먼트, 재디코딩 {verified}초",
+    "VOCABULARY_REGISTERED": "어휘 목록 등록: {name} ({terms}개 용어, 버전 {version})",
+    "VOCABULARY_APPLIED": "어휘 목록 적용: {name}",
+    "TRANSLATION_COMPLETED": "번역 완료: 인코더 출력 재사용 {reused}개 구간, 첫 계산 {encoded}개 구간",
+    "STREAM_COMPLETED": "세그먼트 스트리밍 완료: {segments}개 세그먼트",
+    "CHANNELS_SPLIT": "채널 분리 변환: 변환 {active}, 무음 건너뜀 {skipped}",
+    "JOB_SUBMITTED": "비동기 변환 작업 접수: {job_id} ({filename})",
+    "JOB_COMPLETED": "비동기 변환 작업 완료: {job_id} ({status}, {duration}초)",
+    "CALLBACK_DELIVERED": "웹훅 전송 완료: {job_id} (상태 {status_code}, 시도 {attempts})",
+    "CALLBACK_RETRY": "웹훅 전송 실패, {delay}초 후 재시도: {job_id} (시도 {attempts}) - {error}",
+    "CALLBACK_FAILED": "웹훅 전송 포기: {job_id} (시도 {attempts}) - {error}",
 }
 
 # 시스템 관련 로그 메시지
@@ -32,6 +57,20 @@ SYSTEM_LOGS = {
     "EXCEPTION_HANDLERS_REGISTERED": "예외 핸들러 등록 완료",
     "SERVER_STARTED": "STT 서버 시작",
     "SERVER_START_FAILED": "STT 서버 시작 실패: {error}",
+    "TRACE_EXPORT_FAILED": "trace 내보내기 실패: {error}",
+    "SLOW_REQUEST_CAPTURED": "느린 요청 기록: {request_id} ({duration}초) -> {path}",
+    "SHUTDOWN_STARTED": "종료 시작: 새 작업 요청 거절, 처리 중 요청 {in_flight}개 대기",
+    "SHUTDOWN_DRAINED": "처리 중 요청 모두 완료",
+    "SHUTDOWN_DRAIN_TIMEOUT": "종료 대기 시간 초과: 처리 중 요청 {in_flight}개",
+    "SHUTDOWN_HOOK_FAILED": "종료 훅 실행 실패: {error}",
+    "UPLOADS_SWEPT": "이전 실행의 업로드 파일 {count}개 정리: {folder}",
+    "JOBS_LOADED": "저장된 작업 {count}개 불러옴 (웹훅 재전송 대기 {pending}개)",
+    "JOBS_SAVED": "작업 {count}개 저장: {path}",
+    "DISPATCHER_STARTED": "디스패처 시작: 워커 {count}개",
+    "DISPATCHER_POLL_FAILED": "워커 부하 폴링 실패: {error}",
+    "WORKER_DOWN": "워커 응답 없음: {node} - {error}",
+    "WORKER_UP": "워커 연결됨: {node} (모델 {models}, 처리 중 {in_flight})",
+    "WORKER_FAILOVER": "워커 연결 실패, 다른 워커로 재전송: {node} - {error}",
 }
 
 # 예외 관련 로그 메시지
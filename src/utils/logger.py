@@ -1,22 +1,95 @@
+import atexit
+import json
 import logging
+import queue
+import random
 import sys
 import os
+import zlib
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 from src.core.config import settings
 
 
+# 고빈도 로그 표시용 extra (LOG_SAMPLE_RATE 비율로 샘플링됨)
+SAMPLED = {"sampled": True}
+
+_STANDARD_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id", "sampled"}
+_queue_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나를 출력하는 구조화 로그 포맷터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        for key, value in vars(record).items():
+            if key not in _STANDARD_RECORD_ATTRS:
+                payload[key] = value
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    고빈도 로그 샘플링 필터
+
+    SAMPLED로 표시된 로그만 대상으로 하며, 요청 ID 기준으로 샘플링하여
+    같은 요청의 로그는 함께 남거나 함께 제외됩니다.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0 or not getattr(record, "sampled", False):
+            return True
+        request_id = getattr(record, "request_id", None)
+        if request_id and request_id != "-":
+            return zlib.crc32(request_id.encode("utf-8")) % 10000 < self.rate * 10000
+        return random.random() < self.rate
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    """
+    포맷팅을 리스너 스레드로 미루는 QueueHandler
+
+    기본 구현은 큐에 넣기 전에 레코드를 포맷하고 복사하지만, 같은 프로세스의
+    리스너가 최종 포맷을 담당하므로 메시지 인자만 확정하고 그대로 전달합니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class LoggerConfig:
     """중앙화된 로거 설정 클래스"""
 
     def __init__(
         self,
         level: int = logging.INFO,
-        format_string: str = "%(asctime)s [%(levelname)s] (%(name)s) : %(message)s",
-        log_file: Optional[str] = None
+        format_string: str = "%(asctime)s [%(levelname)s] [%(request_id)s] (%(name)s) : %(message)s",
+        log_file: Optional[str] = None,
+        json_format: bool = False,
+        use_queue: bool = True,
+        sample_rate: float = 1.0
     ):
         self.level = level
         self.format_string = format_string
         self.log_file = log_file
+        self.json_format = json_format
+        self.use_queue = use_queue
+        self.sample_rate = sample_rate
         self._configured = False
 
     def configure(self):
@@ -24,18 +97,23 @@ class LoggerConfig:
         if self._configured:
             return
 
-        # 기존 핸들러 제거
+        # 기존 핸들러 및 백그라운드 리스너 제거
+        shutdown_logging()
         root_logger = logging.getLogger()
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
 
         # 포맷터 생성
-        formatter = logging.Formatter(self.format_string)
+        formatter = JsonFormatter() if self.json_format else logging.Formatter(self.format_string)
+
+        # 요청 ID 필터 (trace와 로그를 연결) - 컨텍스트 변수를 읽으므로 로그를 남기는 스레드에서 실행
+        from src.utils.tracing import RequestIdFilter
+        filters = [RequestIdFilter(), SamplingFilter(self.sample_rate)]
 
         # 콘솔 핸들러
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers = [console_handler]
 
         # 파일 핸들러 (선택사항)
         if self.log_file:
@@ -46,7 +124,23 @@ class LoggerConfig:
 
             file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        if self.use_queue:
+            # 요청 처리 스레드는 큐에 넣기만 하고, 실제 I/O는 리스너 스레드에서 수행
+            global _queue_listener
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            queue_handler = _DeferredFormatQueueHandler(log_queue)
+            for log_filter in filters:
+                queue_handler.addFilter(log_filter)
+            root_logger.addHandler(queue_handler)
+            _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            _queue_listener.start()
+        else:
+            for handler in handlers:
+                for log_filter in filters:
+                    handler.addFilter(log_filter)
+                root_logger.addHandler(handler)
 
         # 루트 로거 레벨 설정
         root_logger.setLevel(self.level)
@@ -54,15 +148,26 @@ class LoggerConfig:
         self._configured = True
 
 
+def shutdown_logging():
+    """백그라운드 로그 리스너를 멈추고 남은 로그를 모두 기록"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def setup_logging(
     level: int = None,
-    format_string: str = "%(asctime)s [%(levelname)s] (%(name)s) : %(message)s",
+    format_string: str = "%(asctime)s [%(levelname)s] [%(request_id)s] (%(name)s) : %(message)s",
     log_file: Optional[str] = None
 ):
     """로깅 설정"""
     # 설정에서 로그 레벨 가져오기
     if level is None:
-        log_level_str = getattr(settings, 'LOG_LEVEL', 'INFO').upper()
+        log_level_str = settings.LOG_LEVEL.upper()
         level_map = {
             "DEBUG": logging.DEBUG,
             "INFO": logging.INFO,
@@ -74,9 +179,16 @@ def setup_logging(
 
     # 설정에서 로그 파일 경로 가져오기
     if log_file is None:
-        log_file = getattr(settings, 'LOG_FILE', None)
-
-    logger_config = LoggerConfig(level, format_string, log_file)
+        log_file = settings.LOG_FILE
+
+    logger_config = LoggerConfig(
+        level,
+        format_string,
+        log_file,
+        json_format=settings.LOG_FORMAT.lower() == "json",
+        use_queue=settings.LOG_ASYNC,
+        sample_rate=settings.LOG_SAMPLE_RATE
+    )
     logger_config.configure()
 
 
@@ -95,7 +207,7 @@ def setup_dev_logging():
     """개발 환경용 로깅 설정"""
     setup_logging(
         level=logging.INFO,
-        format_string="%(asctime)s [%(levelname)s] (%(name)s) : %(message)s"
+        format_string="%(asctime)s [%(levelname)s] [%(request_id)s] (%(name)s) : %(message)s"
     )
 
 
@@ -103,7 +215,7 @@ def setup_prod_logging(log_file: str = "logs/app.log"):
     """프로덕션 환경용 로깅 설정"""
     setup_logging(
         level=logging.INFO,
-        format_string="%(asctime)s [%(levelname)s] (%(name)s:%(funcName)s:%(lineno)d) : %(message)s",
+        format_string="%(asctime)s [%(levelname)s] [%(request_id)s] (%(name)s:%(funcName)s:%(lineno)d) : %(message)s",
         log_file=log_file
     )
 
@@ -120,33 +232,23 @@ def get_uvicorn_custom_log():
                 "format": "%(asctime)s [%(levelname)s] (%(name)s) : %(message)s"
             }
         },
-        "handlers": {
-            "default": {
-                "formatter": "default",
-                "class": "logging.StreamHandler",
-                "stream": "ext://sys.stdout"
-            },
-            "access": {
-                "formatter": "access",
-                "class": "logging.StreamHandler",
-                "stream": "ext://sys.stdout"
-            }
-        },
+        # 핸들러를 두지 않고 루트 로거(큐 핸들러)로 전달하여 비동기로 기록
+        "handlers": {},
         "loggers": {
             "uvicorn": {
-                "handlers": ["default"],
+                "handlers": [],
                 "level": "INFO",
-                "propagate": False
+                "propagate": True
             },
             "uvicorn.error": {
-                "handlers": ["default"],
+                "handlers": [],
                 "level": "INFO",
-                "propagate": False
+                "propagate": True
             },
             "uvicorn.access": {
-                "handlers": ["access"],
+                "handlers": [],
                 "level": "INFO",
-                "propagate": False
+                "propagate": True
             }
         }
     } 
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Service Metrics
+"""
+import threading
+from collections import defaultdict
+from typing import Dict, Any
+
+
+class MetricsRegistry:
+    """스레드 안전한 카운터/게이지 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+
+    def increment(self, name: str, value: float = 1.0) -> float:
+        """Increase a counter and return its new value"""
+        with self._lock:
+            self._counters[name] += value
+            return self._counters[name]
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to the given value"""
+        with self._lock:
+            self._gauges[name] = value
+
+    def get_counter(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of all counters and gauges"""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges)
+            }
+
+
+# Global metrics instance
+metrics = MetricsRegistry()
@@ -0,0 +1,205 @@
+"""
+Runtime Profiling
+
+실행 중인 서버를 재시작 없이 진단하기 위한 시간 제한 프로파일러입니다.
+요청받은 시간 동안만 샘플링 스레드(CPU) 또는 tracemalloc(힙)을 켜고, 끝나면 모두 정리하므로
+프로파일링하지 않을 때의 오버헤드는 없습니다.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Dict, List, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from src.utils.exceptions import ProfilingException
+from src.utils.error_messages import get_error_message
+from src.utils.logger import get_logger
+from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+# 가장 안쪽 프레임이 이 파일들이면 유휴 대기(스레드 풀 큐, 이벤트 루프 select 등)로 보고 기본 결과에서 제외
+IDLE_FILES = ("threading.py", "selectors.py", "queue.py")
+# 힙 보고서에서 제외할 프로파일러 자체의 할당
+HEAP_IGNORED_FILES = (__file__, tracemalloc.__file__, "<frozen importlib._bootstrap>", "<unknown>")
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOTS = tuple(sorted({_PROJECT_ROOT} | set(sys.path), key=len, reverse=True))
+
+
+def _short_path(filename: str) -> str:
+    """Strip sys.path prefixes so frames read like module paths"""
+    for root in _ROOTS:
+        if root and filename.startswith(root + os.sep):
+            return filename[len(root) + 1:]
+    return filename
+
+
+class CpuProfile:
+    """
+    sys._current_frames() 기반 샘플링 CPU 프로파일
+
+    interval마다 모든 스레드의 스택을 읽어 접힌 스택(folded stack)별 샘플 수를 셉니다.
+    추론(CTranslate2)처럼 GIL을 놓고 네이티브 코드에서 실행 중인 구간은 호출한 Python 프레임으로 집계됩니다.
+    """
+
+    def __init__(self, interval: float, include_idle: bool = False):
+        self.interval = interval
+        self.include_idle = include_idle
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.idle_samples = 0
+        self.duration = 0.0
+        self._labels: Dict[CodeType, str] = {}
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+    def _sample(self, own_thread: int) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            if not self.include_idle and os.path.basename(frame.f_code.co_filename) in IDLE_FILES:
+                self.idle_samples += 1
+                continue
+            stack: List[str] = []
+            current: Optional[FrameType] = frame
+            while current is not None:
+                stack.append(self._label(current.f_code))
+                current = current.f_back
+            stack.append(names.get(thread_id, f"thread-{thread_id}"))
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def run(self, stop: threading.Event) -> None:
+        """Sample until stop is set (runs on the profiler thread)"""
+        own_thread = threading.get_ident()
+        start = time.perf_counter()
+        while not stop.wait(self.interval):
+            self._sample(own_thread)
+        self.duration = time.perf_counter() - start
+
+    def folded(self) -> str:
+        """Collapsed stacks (flamegraph.pl, speedscope, inferno input)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top(self, limit: int) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """(self samples, total samples) per function, most expensive first"""
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")[1:]  # 첫 항목은 스레드 이름
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+        return own.most_common(limit), total.most_common(limit)
+
+    def report(self, limit: int = 30) -> str:
+        own, total = self.top(limit)
+        samples = self.samples or 1
+        lines = [
+            f"CPU profile: {self.duration:.1f}s, interval {self.interval * 1000:.1f}ms, "
+            f"{self.samples} samples ({self.idle_samples} idle samples excluded)",
+            "",
+            f"{'self %':>7} {'samples':>8}  function",
+        ]
+        lines += [f"{count / samples:>7.1%} {count:>8}  {frame}" for frame, count in own]
+        lines += ["", f"{'total %':>7} {'samples':>8}  function"]
+        lines += [f"{count / samples:>7.1%} {count:>8}  {frame}" for frame, count in total]
+        return "\n".join(lines) + "\n"
+
+
+class Profiler:
+    """
+    한 번에 하나의 프로파일만 실행하도록 조정하는 진입점
+
+    동시에 여러 프로파일을 켜면 서로의 결과에 섞이고 오버헤드가 겹치므로, 실행 중이면 409로 거절합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active: Optional[str] = None
+
+    def _begin(self, kind: str, seconds: float) -> None:
+        with self._lock:
+            if self.active is not None:
+                raise ProfilingException(get_error_message("API", "PROFILE_IN_PROGRESS", kind=self.active))
+            self.active = kind
+        logger.info(get_log_message("API", "PROFILE_STARTED", kind=kind, seconds=seconds))
+
+    def _end(self, kind: str) -> None:
+        with self._lock:
+            self.active = None
+        metrics.increment(f"profiles_{kind}_total")
+
+    async def profile_cpu(self, seconds: float, interval: float, include_idle: bool = False) -> CpuProfile:
+        """Sample every thread's stack for `seconds`"""
+        self._begin("cpu", seconds)
+        try:
+            profile = CpuProfile(interval, include_idle)
+            stop = threading.Event()
+            thread = threading.Thread(target=profile.run, args=(stop,), name="cpu-profiler", daemon=True)
+            thread.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                stop.set()
+                await run_in_threadpool(thread.join)
+            return profile
+        finally:
+            self._end("cpu")
+
+    async def profile_heap(self, seconds: float, frames: int, limit: int, group_by: str = "lineno") -> str:
+        """
+        Trace allocations for `seconds` and report what is still allocated at the end
+
+        이미 PYTHONTRACEMALLOC 등으로 추적 중이면 그 추적을 그대로 사용하고 끄지 않습니다.
+        """
+        self._begin("heap", seconds)
+        started = not tracemalloc.is_tracing()
+        try:
+            if started:
+                tracemalloc.start(frames)
+            baseline = await run_in_threadpool(tracemalloc.take_snapshot)
+            await asyncio.sleep(seconds)
+            snapshot = await run_in_threadpool(tracemalloc.take_snapshot)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            if started:
+                tracemalloc.stop()
+            self._end("heap")
+        return await run_in_threadpool(_heap_report, baseline, snapshot, current, peak, seconds, limit, group_by)
+
+
+def _heap_report(baseline: tracemalloc.Snapshot, snapshot: tracemalloc.Snapshot, current: int, peak: int,
+                 seconds: float, limit: int, group_by: str) -> str:
+    filters = [tracemalloc.Filter(False, filename) for filename in HEAP_IGNORED_FILES]
+    baseline, snapshot = baseline.filter_traces(filters), snapshot.filter_traces(filters)
+    stats = snapshot.compare_to(baseline, group_by)
+    growth = sum(stat.size_diff for stat in stats)
+    lines = [
+        f"Heap profile: {seconds:.1f}s, traced current {current / 1024 / 1024:.1f} MiB, "
+        f"peak {peak / 1024 / 1024:.1f} MiB, growth {growth / 1024 / 1024:+.1f} MiB",
+        "",
+        f"{'size KiB':>10} {'diff KiB':>10} {'count':>8}  location",
+    ]
+    for stat in stats[:limit]:
+        frames = stat.traceback.format() if group_by == "traceback" else [str(stat.traceback[0])]
+        location = _short_path(frames[0].strip()) if len(frames) == 1 else "\n" + "\n".join(frames)
+        lines.append(f"{stat.size / 1024:>10.1f} {stat.size_diff / 1024:>+10.1f} {stat.count:>8}  {location}")
+    return "\n".join(lines) + "\n"
+
+
+# Global profiler
+profiler = Profiler()
@@ -0,0 +1,100 @@
+"""
+Response Serialization
+"""
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi.responses import Response
+from src.models.segments import SegmentBuffer
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack 미설치 시 msgpack 응답 비활성화
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack"}
+
+
+def parse_accept(accept: Optional[str]) -> List[str]:
+    """Media types from an Accept header ordered by quality"""
+    if not accept:
+        return []
+
+    ranges: List[Tuple[float, int, str]] = []
+    for index, part in enumerate(accept.split(",")):
+        media_type, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type and quality > 0:
+            ranges.append((-quality, index, media_type.strip().lower()))
+
+    return [media_type for _, _, media_type in sorted(ranges)]
+
+
+def negotiate_media_type(accept: Optional[str]) -> Optional[str]:
+    """
+    Pick the response media type for an Accept header
+
+    Returns:
+        선택된 미디어 타입, 지원 가능한 타입이 없으면 None
+    """
+    media_types = parse_accept(accept)
+    if not media_types:
+        return JSON_MEDIA_TYPE
+
+    for media_type in media_types:
+        if media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            return JSON_MEDIA_TYPE
+        if media_type in MSGPACK_MEDIA_TYPES and msgpack is not None:
+            return MSGPACK_MEDIA_TYPE
+    return None
+
+
+def dumps_json(payload: Any) -> bytes:
+    """Encode JSON with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def build_transcription_payload(result: Dict[str, Any], include_segments: bool, columnar: bool = False) -> Dict[str, Any]:
+    """Flatten a service result into a TranscriptionResponse-shaped dict"""
+    segments: Optional[SegmentBuffer] = result.get("segments")
+    payload = {key: value for key, value in result.items() if key != "segments"}
+
+    if include_segments and segments is not None:
+        payload["segments"] = segments.to_columns() if columnar else segments.to_dicts()
+    else:
+        payload["segments"] = None
+
+    translation = result.get("translation")
+    if translation is not None:
+        payload["translation"] = build_transcription_payload(translation, include_segments, columnar)
+    return payload
+
+
+def render_transcription(result: Dict[str, Any], media_type: str, include_segments: bool = False) -> Response:
+    """
+    Serialize a transcription result for the negotiated media type
+
+    msgpack 응답의 segments는 {"start": [...], "end": [...], "text": [...], "confidence": [...]}
+    형태의 열 배열로 인코딩됩니다.
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        payload = build_transcription_payload(result, include_segments, columnar=True)
+        return Response(content=msgpack.packb(payload, use_bin_type=True), media_type=MSGPACK_MEDIA_TYPE)
+
+    payload = build_transcription_payload(result, include_segments)
+    return Response(content=dumps_json(payload), media_type=JSON_MEDIA_TYPE)
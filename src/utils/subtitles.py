@@ -0,0 +1,69 @@
+"""
+Subtitle Rendering
+"""
+from typing import Iterable, Iterator
+from src.models.responses import TranscriptionSegment
+
+SUBTITLE_FORMATS = ("srt", "vtt", "tsv", "txt")
+SUBTITLE_MEDIA_TYPES = {
+    "srt": "application/x-subrip",
+    "vtt": "text/vtt",
+    "tsv": "text/tab-separated-values",
+    "txt": "text/plain",
+}
+
+
+def format_timestamp(seconds: float, decimal_marker: str = ".", always_include_hours: bool = True) -> str:
+    """Format seconds as HH:MM:SS.mmm"""
+    milliseconds = max(0, round(seconds * 1000.0))
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    prefix = f"{hours:02d}:" if always_include_hours or hours > 0 else ""
+    return f"{prefix}{minutes:02d}:{seconds:02d}{decimal_marker}{milliseconds:03d}"
+
+
+def _cue_text(segment: TranscriptionSegment) -> str:
+    # 자막 블록 구분자(빈 줄)와 겹치지 않도록 줄바꿈 정리
+    return " ".join(segment.text.split())
+
+
+def render_subtitles(segments: Iterable[TranscriptionSegment], subtitle_format: str,
+                     with_channels: bool = False) -> Iterator[str]:
+    """
+    Render segments as SRT/VTT/TSV/TXT, one chunk per segment
+
+    세그먼트를 받는 즉시 해당 자막 블록을 내보내므로 전체 결과를 메모리에 모으지 않습니다.
+    with_channels이면 화자를 구분할 수 있도록 채널 번호를 표시합니다
+    (SRT/TXT는 `[ch0]` 접두어, VTT는 `<v ch0>` 화자 태그, TSV는 channel 열).
+    """
+    if subtitle_format == "vtt":
+        yield "WEBVTT\n\n"
+    elif subtitle_format == "tsv":
+        yield "start\tend\tchannel\ttext\n" if with_channels else "start\tend\ttext\n"
+
+    index = 0
+    for segment in segments:
+        text = _cue_text(segment)
+        if not text:
+            continue
+        index += 1
+        speaker = f"ch{segment.channel}" if with_channels and segment.channel is not None else None
+        if speaker is not None and subtitle_format in ("srt", "txt"):
+            text = f"[{speaker}] {text}"
+        elif speaker is not None and subtitle_format == "vtt":
+            text = f"<v {speaker}>{text}"
+        if subtitle_format == "srt":
+            yield (
+                f"{index}\n"
+                f"{format_timestamp(segment.start, ',')} --> {format_timestamp(segment.end, ',')}\n"
+                f"{text}\n\n"
+            )
+        elif subtitle_format == "vtt":
+            yield f"{format_timestamp(segment.start)} --> {format_timestamp(segment.end)}\n{text}\n\n"
+        elif subtitle_format == "tsv":
+            # OpenAI Whisper와 같은 정수 밀리초 형식, 탭은 공백으로 치환
+            channel = f"{'' if segment.channel is None else segment.channel}\t" if with_channels else ""
+            yield f"{round(segment.start * 1000)}\t{round(segment.end * 1000)}\t{channel}{text.replace(chr(9), ' ')}\n"
+        else:
+            yield f"{text}\n"
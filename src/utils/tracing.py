@@ -0,0 +1,304 @@
+"""
+Request Tracing
+
+요청마다 trace를 만들어 처리 단계별 span 타임라인을 기록하고,
+OpenTelemetry(OTLP/JSON) 호환 형식으로 내보냅니다.
+"""
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from src.core.config import settings
+from src.utils.logger import get_logger
+from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+
+
+class Span:
+    """처리 단계 하나의 시간 구간"""
+
+    __slots__ = ("name", "span_id", "parent_id", "kind", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, parent_id: Optional[str], kind: int = SPAN_KIND_INTERNAL):
+        self.name = name
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+
+    @property
+    def duration(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+
+class Trace:
+    """요청 하나의 span 타임라인"""
+
+    def __init__(self, request_id: str, name: str):
+        self.request_id = request_id
+        self.trace_id = uuid.uuid4().hex
+        self.root = Span(name, None, kind=SPAN_KIND_SERVER)
+        self.spans: List[Span] = [self.root]
+        self.status_code: Optional[int] = None
+        self.context_token = None
+
+    def start_span(self, name: str) -> Span:
+        span = Span(name, self.root.span_id)
+        self.spans.append(span)
+        return span
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.root.attributes[key] = value
+
+    def finish(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.root.attributes["http.status_code"] = status_code
+        if status_code >= 500:
+            self.root.error = f"HTTP {status_code}"
+        self.root.end()
+
+    @property
+    def duration(self) -> float:
+        return self.root.duration
+
+    def timeline(self) -> List[Dict[str, Any]]:
+        """Span offsets relative to the request start"""
+        return [
+            {
+                "name": span.name,
+                "offset_ms": round((span.start_ns - self.root.start_ns) / 1e6, 3),
+                "duration_ms": round(span.duration * 1000, 3),
+                "attributes": span.attributes,
+                "error": span.error
+            }
+            for span in self.spans[1:]
+        ]
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Encode as an OTLP/JSON ExportTraceServiceRequest"""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": _otlp_attributes({"service.name": settings.TRACE_SERVICE_NAME})},
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [self._otlp_span(span) for span in self.spans]
+                }]
+            }]
+        }
+
+    def _otlp_span(self, span: Span) -> Dict[str, Any]:
+        attributes = dict(span.attributes)
+        if span is self.root:
+            attributes["request.id"] = self.request_id
+        encoded = {
+            "traceId": self.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": span.kind,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns or time.time_ns()),
+            "attributes": _otlp_attributes(attributes),
+            "status": {"code": STATUS_ERROR, "message": span.error} if span.error else {"code": STATUS_OK}
+        }
+        if span.parent_id:
+            encoded["parentSpanId"] = span.parent_id
+        return encoded
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    encoded = []
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        encoded.append({"key": key, "value": typed})
+    return encoded
+
+
+def start_trace(request_id: Optional[str], name: str) -> Trace:
+    """Create a trace and bind it to the current context"""
+    trace = Trace(request_id or uuid.uuid4().hex, name)
+    trace.context_token = _current_trace.set(trace)
+    return trace
+
+
+def end_trace(trace: Trace, status_code: int) -> None:
+    """Finish a trace, unbind it and hand it to the exporter"""
+    trace.finish(status_code)
+    _current_trace.reset(trace.context_token)
+    trace_exporter.submit(trace)
+
+
+def get_current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def get_request_id() -> Optional[str]:
+    trace = _current_trace.get()
+    return trace.request_id if trace else None
+
+
+def set_trace_attribute(key: str, value: Any) -> None:
+    """Attach an attribute to the current request trace"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.set_attribute(key, value)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Record a child span on the current trace (no-op without a trace)"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    current = trace.start_span(name)
+    current.attributes.update(attributes)
+    try:
+        yield current
+    except Exception as e:
+        current.error = str(e)
+        raise
+    finally:
+        current.end()
+
+
+class TraceExporter:
+    """
+    완료된 trace를 백그라운드 스레드에서 내보내는 클래스
+
+    - TRACE_EXPORT_PATH: 모든 trace를 OTLP/JSON 한 줄씩 파일에 추가
+    - TRACE_COLLECTOR_URL: OTLP/HTTP JSON 수집기로 전송
+    - SLOW_REQUEST_THRESHOLD 초과 요청은 SLOW_REQUEST_DIR에 전체 타임라인과 함께 저장
+    """
+
+    def __init__(self, max_queue: int = 1000):
+        self._queue: "queue.Queue[Trace]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._session = None
+
+    def submit(self, trace: Trace) -> None:
+        """Queue a finished trace without blocking the request"""
+        is_slow = trace.duration >= settings.SLOW_REQUEST_THRESHOLD
+        if not (is_slow or settings.TRACE_EXPORT_PATH or settings.TRACE_COLLECTOR_URL):
+            return
+
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            metrics.increment("traces_dropped_total")
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            trace = self._queue.get()
+            try:
+                self.export(trace)
+            except Exception as e:
+                logger.warning(get_log_message("SYSTEM", "TRACE_EXPORT_FAILED", error=str(e)))
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until queued traces are exported"""
+        deadline = time.time() + timeout
+        while self._queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.01)
+
+    def export(self, trace: Trace) -> None:
+        otlp = trace.to_otlp()
+
+        if settings.TRACE_EXPORT_PATH:
+            _ensure_parent_dir(settings.TRACE_EXPORT_PATH)
+            with open(settings.TRACE_EXPORT_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(otlp, ensure_ascii=False) + "\n")
+
+        if settings.TRACE_COLLECTOR_URL:
+            if self._session is None:
+                import requests
+                self._session = requests.Session()
+            self._session.post(settings.TRACE_COLLECTOR_URL, json=otlp, timeout=5)
+
+        if trace.duration >= settings.SLOW_REQUEST_THRESHOLD:
+            self.capture_slow_request(trace, otlp)
+
+    def capture_slow_request(self, trace: Trace, otlp: Dict[str, Any]) -> str:
+        """Persist a slow request with its timeline and audio metadata"""
+        os.makedirs(settings.SLOW_REQUEST_DIR, exist_ok=True)
+        path = os.path.join(settings.SLOW_REQUEST_DIR, f"{int(time.time())}_{trace.request_id}.json")
+        record = {
+            "request_id": trace.request_id,
+            "trace_id": trace.trace_id,
+            "name": trace.root.name,
+            "status_code": trace.status_code,
+            "duration_ms": round(trace.duration * 1000, 3),
+            "attributes": trace.root.attributes,
+            "timeline": trace.timeline(),
+            "otlp": otlp
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+
+        metrics.increment("slow_requests_captured_total")
+        logger.warning(get_log_message(
+            "SYSTEM", "SLOW_REQUEST_CAPTURED",
+            request_id=trace.request_id, duration=round(trace.duration, 3), path=path
+        ))
+        return path
+
+
+def _ensure_parent_dir(path: str) -> None:
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+
+class RequestIdFilter(logging.Filter):
+    """로그 레코드에 현재 요청 ID를 추가하는 필터"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = get_request_id() or "-"
+        return True
+
+
+# Global trace exporter instance
+trace_exporter = TraceExporter()
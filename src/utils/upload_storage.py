@@ -0,0 +1,180 @@
+"""
+Upload Storage
+"""
+import errno
+import hashlib
+import os
+import re
+import secrets
+import socket
+import threading
+import unicodedata
+from typing import BinaryIO, List, Optional, Tuple
+from src.core.config import settings
+from src.utils.logger import get_logger
+from src.utils.log_messages import get_log_message
+from src.utils.metrics import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = get_logger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+TMPFS_SUBDIR = "stt-uploads"
+OWNER_LOCK_FILE = ".owner"
+MAX_FILENAME_LENGTH = 100
+
+_UNSAFE_CHARS = re.compile(r"[^\w.-]+")
+
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive lock without waiting; False if another process holds it"""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def sanitize_filename(filename: Optional[str]) -> str:
+    """
+    Reduce a client-supplied filename to a safe basename
+
+    경로 구분자, 상위 경로(..), 제어 문자를 제거하고 확장자를 유지한 채 길이를 제한합니다.
+    """
+    name = unicodedata.normalize("NFC", filename or "")
+    name = name.replace("\\", "/").rsplit("/", 1)[-1]
+    name = _UNSAFE_CHARS.sub("_", name).lstrip(".")
+    stem, ext = os.path.splitext(name)
+    stem = stem[:MAX_FILENAME_LENGTH - len(ext[:16])]
+    return f"{stem}{ext[:16]}" or "upload"
+
+
+class UploadStorage:
+    """
+    업로드 임시 파일 저장소
+
+    - 파일 이름: 임의 토큰 + 정리된 원본 이름. O_EXCL로 생성하므로 동시 업로드가 서로 덮어쓰지 않음
+    - 샤딩: 토큰 앞 두 글자로 하위 폴더(최대 256개)를 나눠 한 폴더에 파일이 몰리지 않도록 함
+    - tmpfs: UPLOAD_TMPFS_DIR(기본 /dev/shm)에 쓸 수 있으면 메모리 기반 파일 시스템에 저장하고,
+      공간이 부족하면 UPLOAD_FOLDER(디스크)로 대체
+    - 프로세스별 폴더: 같은 머신의 여러 프로세스가 폴더를 공유하므로 프로세스마다 하위 폴더를 만들고
+      그 안의 잠금 파일을 종료할 때까지 잡고 있어, 시작 시 정리는 소유 프로세스가 종료된 폴더만 삭제
+    """
+
+    def __init__(self, folder: str, tmpfs_dir: Optional[str] = None):
+        self.folder = folder
+        self.tmpfs_folder = self._tmpfs_folder(tmpfs_dir)
+        self._owned: Optional[List[str]] = None
+        self._owner_fds: List[int] = []
+        self._claim_lock = threading.Lock()
+
+    @staticmethod
+    def _tmpfs_folder(tmpfs_dir: Optional[str]) -> Optional[str]:
+        if not tmpfs_dir or not os.path.isdir(tmpfs_dir) or not os.access(tmpfs_dir, os.W_OK):
+            return None
+        return os.path.join(tmpfs_dir, TMPFS_SUBDIR)
+
+    @property
+    def roots(self) -> List[str]:
+        """Folders that may hold upload files, in preference order"""
+        return [root for root in (self.tmpfs_folder, self.folder) if root]
+
+    def claim(self) -> List[str]:
+        """Create and lock this process's folder under each root"""
+        with self._claim_lock:
+            if self._owned is None:
+                owner = f"{_UNSAFE_CHARS.sub('_', socket.gethostname())}-{os.getpid()}-{secrets.token_hex(4)}"
+                owned = []
+                for root in self.roots:
+                    folder = os.path.join(root, owner)
+                    os.makedirs(folder, mode=0o700, exist_ok=True)
+                    fd = os.open(os.path.join(folder, OWNER_LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o600)
+                    _try_lock(fd)
+                    self._owner_fds.append(fd)
+                    owned.append(folder)
+                self._owned = owned
+            return self._owned
+
+    def orphaned(self) -> List[str]:
+        """
+        Folders under the upload roots that no running process owns
+
+        잠금 파일을 잡을 수 있으면 소유 프로세스가 종료된 것이며, 잠금 파일이 없는 폴더는
+        프로세스별 폴더 도입 이전의 샤드 폴더입니다. 폴더 이름에 임의 토큰이 있어 다른 프로세스가 다시 사용하지 않습니다.
+        """
+        owned = set(self._owned or ())
+        orphans = []
+        for root in self.roots:
+            try:
+                entries = [entry.path for entry in os.scandir(root) if entry.is_dir(follow_symlinks=False)]
+            except OSError:
+                continue
+            for path in entries:
+                if path in owned:
+                    continue
+                try:
+                    fd = os.open(os.path.join(path, OWNER_LOCK_FILE), os.O_RDWR)
+                except FileNotFoundError:
+                    orphans.append(path)
+                    continue
+                except OSError:
+                    continue
+                try:
+                    if _try_lock(fd):
+                        orphans.append(path)
+                finally:
+                    os.close(fd)
+        return orphans
+
+    def _create(self, root: str, filename: str) -> Tuple[str, int]:
+        """Create a new file exclusively and return (path, fd)"""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        while True:
+            token = secrets.token_hex(8)
+            shard = os.path.join(root, token[:2])
+            os.makedirs(shard, mode=0o700, exist_ok=True)
+            path = os.path.join(shard, f"{token}_{filename}")
+            try:
+                return path, os.open(path, flags, 0o600)
+            except FileExistsError:
+                continue
+
+    def save(self, source: BinaryIO, filename: Optional[str]) -> Tuple[str, str]:
+        """
+        Stream an upload into a new unique file
+
+        Returns:
+            (저장된 파일 경로, 파일 내용의 SHA-256 해시)
+        """
+        safe_name = sanitize_filename(filename)
+        roots = self.claim()
+        for index, root in enumerate(roots):
+            path, fd = self._create(root, safe_name)
+            content_hash = hashlib.sha256()
+            try:
+                with os.fdopen(fd, "wb") as buffer:
+                    while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                        content_hash.update(chunk)
+                        buffer.write(chunk)
+                return path, content_hash.hexdigest()
+            except OSError as e:
+                os.remove(path)
+                # tmpfs 공간 부족이면 처음부터 다시 읽어 디스크에 저장
+                if e.errno != errno.ENOSPC or index == len(roots) - 1 or not source.seekable():
+                    raise
+                source.seek(0)
+                metrics.increment("upload_tmpfs_fallbacks_total")
+                logger.warning(get_log_message("SERVICE", "UPLOAD_TMPFS_FULL", folder=root))
+        raise OSError(errno.ENOENT, "no upload folder available")
+
+
+# Global upload storage instance
+upload_storage = UploadStorage(settings.UPLOAD_FOLDER, settings.UPLOAD_TMPFS_DIR)
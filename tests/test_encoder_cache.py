@@ -0,0 +1,34 @@
+"""
+Encoder Output Reuse Tests
+"""
+import numpy as np
+from src.services.encoder_cache import install_encoder_reuse, reuse_encoder_outputs
+
+
+class StubModel:
+    """encode 호출 시 자신의 이름을 돌려주는 모델"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+
+    def encode(self, features):
+        self.calls += 1
+        return f"{self.name}-enc"
+
+
+def test_request_memo_keeps_encoder_outputs_per_model():
+    draft, main = StubModel("tiny"), StubModel("large")
+    install_encoder_reuse(draft)
+    install_encoder_reuse(main)
+    features = np.zeros((80, 3000), dtype=np.float32)
+
+    with reuse_encoder_outputs(max_windows=8) as memo:
+        # 보조 디코딩처럼 초안 모델이 같은 구간을 먼저 인코딩
+        assert draft.encode(features) == "tiny-enc"
+        assert main.encode(features) == "large-enc"
+        # task=both의 번역 단계는 같은 모델의 출력을 재사용
+        assert main.encode(features) == "large-enc"
+
+    assert (draft.calls, main.calls) == (1, 1)
+    assert memo.hits == 1